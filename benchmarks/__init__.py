@@ -0,0 +1,4 @@
+"""
+Benchmarks of lexing, parsing, evaluation & the command line interface on
+generated workloads. See `python -m benchmarks -h`.
+"""
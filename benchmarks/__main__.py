@@ -0,0 +1,65 @@
+"""
+Command Line Interface for the benchmarks.
+
+Usage:
+    python -m benchmarks run -o before.json
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json --threshold 0.1
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+
+from .suite import run
+from .compare import compare, report
+
+
+def get_argparser() -> ArgumentParser:
+    """returns the parser object to parse args"""
+    p = ArgumentParser('benchmarks')
+    commands = p.add_subparsers(dest='command', required=True)
+
+    r = commands.add_parser('run', help="run the benchmarks & write the results as json")
+    r.add_argument('-o', '--output', type=str, default='-', help="file to write the results to, '-' for stdout")
+    r.add_argument('--seed', type=int, default=0, help="seed of the generated workloads")
+    r.add_argument('--scale', type=int, default=1, help="multiplies the size of the workloads")
+    r.add_argument('--quick', action='store_true', help="single short measurement of each benchmark")
+    r.add_argument('--only', type=str, default=None, help="run the benchmarks whose name contains the text")
+
+    c = commands.add_parser('compare', help="compare two results & flag the regressions")
+    c.add_argument('old', type=str, help="results of the old run")
+    c.add_argument('new', type=str, help="results of the new run")
+    c.add_argument('-t', '--threshold', type=float, default=0.1, help="relative slowdown flagged as regression")
+    c.add_argument('--key', choices=('min', 'median'), default='min', help="measurement to compare")
+
+    return p
+
+
+def main(argv) -> int:
+    """Main function for benchmarks, returns the exit status"""
+    args = get_argparser().parse_args(argv)
+
+    if args.command == 'run':
+        log = lambda line: print(line, file=sys.stderr)
+        results = run(args.seed, args.scale, args.quick, args.only, log)
+        text = json.dumps(results, indent=2)
+        if args.output == '-':
+            print(text)
+        else:
+            with open(args.output, 'w', encoding='utf-8') as file:
+                file.write(text + '\n')
+        return 0
+
+    with open(args.old, encoding='utf-8') as old, open(args.new, encoding='utf-8') as new:
+        changes = compare(json.load(old), json.load(new), args.threshold, args.key)
+    print(report(changes))
+
+    regressions = [change for change in changes if change.status == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+sys.exit(main(sys.argv[1:]))
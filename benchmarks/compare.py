@@ -0,0 +1,82 @@
+"""
+Module: benchmarks.compare
+Description: Provides the comparison of two runs of the benchmarks.
+
+Usage:
+>>> from benchmarks.compare import compare
+>>> old = {'benchmarks': {'a/lex': {'min': 1.0}, 'b/lex': {'min': 1.0}}}
+>>> new = {'benchmarks': {'a/lex': {'min': 1.5}, 'b/lex': {'min': 0.5}}}
+>>> [(c.name, c.status) for c in compare(old, new, threshold=0.1)]
+[('a/lex', 'regression'), ('b/lex', 'improvement')]
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+
+__all__ = (
+    "Change",
+    "compare",
+    "report",
+)
+
+
+@dataclass(frozen=True)
+class Change:
+    """Change of time of a benchmark between the runs.
+
+    Arguments:
+    - name: name of benchmark.
+    - old: seconds per call in the old run.
+    - new: seconds per call in the new run.
+    - status: `regression`, `improvement` or `same`.
+    """
+
+    name: str
+    old: float
+    new: float
+    status: str
+
+    @property
+    def ratio(self) -> float:
+        """Time of new run relative to the old one."""
+        return self.new / self.old if self.old else float("inf")
+
+
+def compare(old: dict, new: dict, threshold: float = 0.1, key: str = "min") -> List[Change]:
+    """Compares the benchmarks present in both the runs.
+
+    Arguments:
+    - old: results of the old run.
+    - new: results of the new run.
+    - threshold: relative change of time beyond which the benchmark is flagged.
+    - key: measurement compared, `min` or `median`.
+    """
+    changes = []
+    old_results = old["benchmarks"]
+
+    for name, result in new["benchmarks"].items():
+        if name not in old_results:
+            continue
+
+        before, after = old_results[name][key], result[key]
+        if after > before * (1 + threshold):
+            status = "regression"
+        elif after < before * (1 - threshold):
+            status = "improvement"
+        else:
+            status = "same"
+        changes.append(Change(name, before, after, status))
+
+    return changes
+
+
+def report(changes: List[Change]) -> str:
+    """Provides the table of the changes."""
+    rows = [f"{'Benchmark':<32} {'Old (ms)':>12} {'New (ms)':>12} {'Ratio':>7}  Status"]
+    for change in changes:
+        rows.append(
+            f"{change.name:<32} {change.old * 1e3:>12.3f} {change.new * 1e3:>12.3f} "
+            f"{change.ratio:>7.2f}  {change.status}"
+        )
+    return "\n".join(rows)
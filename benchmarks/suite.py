@@ -0,0 +1,149 @@
+"""
+Module: benchmarks.suite
+Description: Provides the benchmarks timing each stage on the workloads.
+
+Each stage is timed on its own: parsing is given the tokens already lexed and
+evaluation the tree already parsed. The CLI is run end to end in the same
+process, with its output written to memory.
+
+Usage:
+>>> from benchmarks.suite import run
+>>> results = run(quick=True, only='short_formulas/lex')
+>>> list(results['benchmarks'])
+['short_formulas/lex']
+"""
+
+import contextlib
+import io
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List
+
+from calc.cli import main as cli_main
+from calc.evaluator import Evaluator
+from calc.lexer import fast_lex
+from calc.parser import parse
+
+from .workloads import workloads
+
+
+__all__ = (
+    "stages",
+    "benchmarks",
+    "measure",
+    "run",
+)
+
+
+def lex_stage(exprs: List[str]) -> Callable[[], None]:
+    """Tokenises the expressions."""
+    return lambda: [tuple(fast_lex(expr)) for expr in exprs]
+
+
+def parse_stage(exprs: List[str]) -> Callable[[], None]:
+    """Parses the tokens of the expressions."""
+    lexed = [(expr, tuple(fast_lex(expr))) for expr in exprs]
+    return lambda: [parse(expr, tokens=tokens) for expr, tokens in lexed]
+
+
+def evaluate_stage(exprs: List[str]) -> Callable[[], None]:
+    """Evaluates the parse trees of the expressions."""
+    parsed = [(expr, parse(expr, tokens=tuple(fast_lex(expr)))) for expr in exprs]
+    return lambda: [Evaluator(expr).eval_tree(root) for expr, root in parsed]
+
+
+def cli_stage(exprs: List[str]) -> Callable[[], None]:
+    """Runs the command line interface on the expressions."""
+    argv = ["--no-color", "--no-title", "-e", *exprs]
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            cli_main(argv)
+
+    return run
+
+
+stages: Dict[str, Callable[[List[str]], Callable[[], None]]] = {
+    "lex": lex_stage,
+    "parse": parse_stage,
+    "evaluate": evaluate_stage,
+    "cli": cli_stage,
+}
+"""Prepares the function timing the stage on the expressions by name of stage."""
+
+
+def benchmarks(seed: int = 0, scale: int = 1) -> Dict[str, Callable[[], None]]:
+    """Provides the benchmarks named as `workload/stage`."""
+    return {
+        f"{name}/{stage}": (lambda prepare=prepare, exprs=exprs: prepare(exprs))
+        for name, exprs in workloads(seed, scale).items()
+        for stage, prepare in stages.items()
+    }
+
+
+def measure(fn: Callable[[], None], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    """Times the function, repeating the calls until they take at least min_time.
+
+    Arguments:
+    - fn: function to time.
+    - repeat: number of measurements.
+    - min_time: minimum duration of a measurement in seconds.
+
+    Returns:
+    - seconds per call of best & median measurement, with the calls per measurement.
+    """
+    timer = timeit.Timer(fn)
+    number = 1
+    while timer.timeit(number) < min_time and number < 1 << 20:
+        number *= 2
+
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(
+    seed: int = 0,
+    scale: int = 1,
+    quick: bool = False,
+    only: str | None = None,
+    log: Callable[[str], None] | None = None,
+) -> dict:
+    """Runs the benchmarks.
+
+    Arguments:
+    - seed: seed of the generated workloads.
+    - scale: multiplies the size of the workloads.
+    - quick: fewer & shorter measurements, for checking the suite runs.
+    - only: runs the benchmarks whose name contains the text.
+    - log: called with the result of each benchmark.
+
+    Returns:
+    - results along with the environment they were measured in.
+    """
+    repeat, min_time = (1, 0.0) if quick else (5, 0.2)
+    results = {}
+
+    for name, prepare in benchmarks(seed, scale).items():
+        if only and only not in name:
+            continue
+        results[name] = result = measure(prepare(), repeat, min_time)
+        if log is not None:
+            log(f"{name:<32} {result['min'] * 1e3:>12.3f} ms")
+
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": seed,
+        "scale": scale,
+        "benchmarks": results,
+    }
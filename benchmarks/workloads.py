@@ -0,0 +1,119 @@
+"""
+Module: benchmarks.workloads
+Description: Provides the generated expressions the benchmarks are run on.
+
+The expressions are generated from a seeded random generator, so every run of
+the suite measures the same workloads without any files to ship along.
+
+Usage:
+>>> from benchmarks.workloads import workloads
+>>> exprs = workloads(scale=1)['flat_sum']
+>>> len(exprs)
+1
+"""
+
+import random
+from typing import Callable, Dict, List
+
+
+__all__ = (
+    "short_formulas",
+    "flat_sum",
+    "nested_parens",
+    "function_heavy",
+    "big_int_powers",
+    "scientific_literals",
+    "generators",
+    "workloads",
+)
+
+
+_funcs = ("sin", "cos", "atan", "tanh")
+_consts = ("pi", "e")
+
+
+def short_formulas(rng: random.Random, scale: int) -> List[str]:
+    """Typical one line formulas as typed by a user."""
+    templates = (
+        "{a}+{b}*{c}",
+        "({a}-{b})/{c}",
+        "{a}**2 + {b}**2",
+        "sin(pi/{a}) * {b}",
+        "max({a}, {b}, {c}) % {d}",
+        "-{a} + sqrt({b}) - {c}.5",
+    )
+    exprs = []
+    for _ in range(100 * scale):
+        a, b, c, d = (rng.randint(1, 999) for _ in range(4))
+        exprs.append(rng.choice(templates).format(a=a, b=b, c=c, d=d))
+    return exprs
+
+
+def flat_sum(rng: random.Random, scale: int) -> List[str]:
+    """A single long sum of numbers."""
+    terms = (str(rng.randint(0, 10**6)) for _ in range(10_000 * scale))
+    return [" + ".join(terms)]
+
+
+def nested_parens(rng: random.Random, scale: int) -> List[str]:
+    """Deeply nested parenthesis around alternating operators."""
+    depth = 1_000 * scale
+    expr = "1"
+    for i in range(depth):
+        expr = f"({expr} {'+-'[i % 2]} {rng.randint(1, 9)})"
+    return [expr]
+
+
+def function_heavy(rng: random.Random, scale: int) -> List[str]:
+    """Sums of nested calls of functions with constants."""
+    exprs = []
+    for _ in range(50 * scale):
+        calls = []
+        for _ in range(10):
+            inner = f"{rng.choice(_consts)}/{rng.randint(2, 9)}"
+            for fn in rng.sample(_funcs, 2):
+                inner = f"{fn}({inner})"
+            calls.append(f"max({inner}, {rng.randint(0, 1)}, abs(-{rng.randint(1, 9)}))")
+        exprs.append(" + ".join(calls))
+    return exprs
+
+
+def big_int_powers(rng: random.Random, scale: int) -> List[str]:
+    """Products of powers with results of tens of thousands of digits."""
+    exprs = []
+    for _ in range(5 * scale):
+        base = rng.randint(2, 99)
+        # `**` binds as tight as `*` & `%`, so the powers are parenthesised
+        power = f"({base}**{rng.randint(5_000, 20_000)})"
+        exprs.append(f"{power} * (3**{rng.randint(1_000, 9_000)}) % 1000007")
+    return exprs
+
+
+def scientific_literals(rng: random.Random, scale: int) -> List[str]:
+    """Sums of literals written with mantissa & exponent."""
+    terms = (
+        f"{rng.randint(1, 9)}.{rng.randint(0, 999)}{rng.choice('eE')}{rng.randint(-30, 30)}"
+        for _ in range(5_000 * scale)
+    )
+    return [" + ".join(terms)]
+
+
+generators: Dict[str, Callable[[random.Random, int], List[str]]] = {
+    "short_formulas": short_formulas,
+    "flat_sum": flat_sum,
+    "nested_parens": nested_parens,
+    "function_heavy": function_heavy,
+    "big_int_powers": big_int_powers,
+    "scientific_literals": scientific_literals,
+}
+"""Generators of the workloads by their name."""
+
+
+def workloads(seed: int = 0, scale: int = 1) -> Dict[str, List[str]]:
+    """Generates the expressions of all the workloads.
+
+    Arguments:
+    - seed: seed of the random generator.
+    - scale: multiplies the size of the workloads.
+    """
+    return {name: generate(random.Random(seed), scale) for name, generate in generators.items()}
@@ -0,0 +1,18 @@
+"""
+Package: calc
+Description: A simple calculator for mathematical expressions.
+
+Usage:
+>>> import calc
+>>> e = calc.compile('2*pi')
+>>> e.evaluate()
+6.283185307179586
+"""
+
+from .expression import Expression, compile
+
+
+__all__ = (
+    "Expression",
+    "compile",
+)
@@ -1,8 +1,14 @@
 """
 Command Line Interface for calc.
+
+`python -m calc serve` runs the expression server instead.
 """
 
-from .cli import main
 import sys
 
-main(sys.argv[1:])
+if sys.argv[1:2] == ["serve"]:
+    from .server import main
+    main(sys.argv[2:])
+else:
+    from .cli import main
+    main(sys.argv[1:])
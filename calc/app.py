@@ -5,37 +5,89 @@ Description: Provide the main application interface.
 
 from .view import AbstractView
 from .models import AbstractModel
+from .worker import EvalWorker
 
 
 class Controller:
     """Main Control application engine for the Calculator."""
 
-    def __init__(self, model: AbstractModel):
+    def __init__(self, model: AbstractModel, worker: EvalWorker | None = None):
         """
         Initialise the control engine with a model.
 
         Arguments:
         - model: a model to provide the operation of various queries.
+        - worker: evaluates the expressions in background, `None` uses the model.
 
         The view attribute is by default is `None`.
         It is the respnsibility of the view to bind with it.
         """
         self.model = model
+        self.worker = worker
         self.view: AbstractView | None = None
+        self.submitted: str | None = None
 
     def evaluate_expression(self) -> None:
-        """Evaluates the expression and provides it to the view."""
-        result, success = self.model.evaluate(self.view.expression)
+        """Evaluates the expression and provides it to the view.
 
+        With a worker the evaluation is only started, the view should call
+        `poll_result` until it returns `False`.
+        """
+        if self.worker is None:
+            self.show_result(*self.model.evaluate(self.view.expression))
+            return
+
+        self.submitted = self.view.expression
+        self.worker.submit(self.submitted)
+        self.view.show_busy(True)
+
+    def poll_result(self) -> bool:
+        """Provides the result of worker to the view once it is ready.
+
+        Result is dropped when the expression was changed since it was submitted.
+
+        Returns:
+        - whether the evaluation is still pending.
+        """
+        if self.worker is None or not self.worker.busy:
+            return False
+
+        outcome = self.worker.poll()
+        if outcome is None:
+            return True
+
+        _, result, success = outcome
+        self.view.show_busy(False)
+        if self.view.expression == self.submitted:
+            self.show_result(result, success)
+        return False
+
+    def cancel_evaluation(self) -> None:
+        """Cancels the evaluation being done by the worker."""
+        if self.worker is not None and self.worker.busy:
+            self.worker.cancel()
+            self.view.show_busy(False)
+
+    def show_result(self, result: int | float | Exception, success: bool) -> None:
+        """Provides the result of evaluation to the view."""
         if success:
             self.view.show_expression(str(result))
         else:
             self.view.show_error(result)
 
+    def preview_expression(self) -> None:
+        """Evaluates the expression being typed and provides it to the view."""
+        result, success = self.model.preview(self.view.expression)
+        self.view.show_preview(str(result) if success else "")
+
 
 if __name__ == "__main__":
     from .gui import TkView
     from .models import CalcModel
 
-    view = TkView("Calculator", Controller(CalcModel()))
-    view.mainloop()
+    worker = EvalWorker()
+    view = TkView("Calculator", Controller(CalcModel(), worker))
+    try:
+        view.mainloop()
+    finally:
+        worker.close()
@@ -0,0 +1,171 @@
+"""
+Module: calc.batch
+Description: Provides the functions to evaluate a stream of expressions.
+
+The expressions are consumed lazily and the outcomes are produced as soon as they
+are evaluated, so arbitrary long streams are evaluated in bounded memory.
+
+Usage:
+>>> from calc.batch import evaluate_iter
+>>> for outcome in evaluate_iter(['1+2', '1/0']):
+...     print(outcome)
+Outcome(expr='1+2', value=3, error=None, message=None)
+Outcome(expr='1/0', value=None, error='DivideByZeroError', message='cannot divide by zero')
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+from .cache import LRUCache
+from .exceptions import CalcError
+from .expression import compile
+
+
+__all__ = (
+    "Outcome",
+    "evaluate_one",
+    "evaluate_iter",
+    "evaluate_parallel",
+    "read_exprs",
+)
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """Outcome of evaluating a single expression.
+
+    Arguments:
+    - expr: expression.
+    - value: value of expression, `None` when evaluation failed.
+    - error: name of the error raised.
+    - message: description of the error raised.
+    """
+
+    expr: str
+    value: int | float | None = None
+    error: str | None = None
+    message: str | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the expression was evaluated."""
+        return self.error is None
+
+
+def evaluate_one(
+    expr: str, cache: LRUCache | None = None, optimize: bool = False
+) -> Outcome:
+    """Evaluates the expression, capturing any error raised as failed outcome.
+
+    Arguments:
+    - expr: expression.
+    - cache: cache of compiled expressions.
+    - optimize: fold constants & simplify the parse tree.
+    """
+    try:
+        if cache is None:
+            compiled = compile(expr, optimize=optimize)
+        else:
+            factory = lambda expr: compile(expr, optimize=optimize)
+            compiled = cache.get_or_create(expr, factory)
+        return Outcome(expr, compiled.evaluate())
+    except CalcError as error:
+        return Outcome(expr, error=error.name, message=error.description)
+    except Exception as error:
+        # errors not raised by calc, e.g. malformed literals or float overflow
+        return Outcome(expr, error=type(error).__name__, message=str(error))
+
+
+def evaluate_iter(
+    exprs: Iterable[str], cache_size: int = 256, optimize: bool = False
+) -> Iterator[Outcome]:
+    """Lazily evaluates the expressions in order.
+
+    Arguments:
+    - exprs: expressions.
+    - cache_size: maximum number of compiled expressions kept for reuse.
+    - optimize: fold constants & simplify the parse tree.
+    """
+    cache = LRUCache(cache_size)
+    for expr in exprs:
+        yield evaluate_one(expr, cache, optimize)
+
+
+_worker_cache: LRUCache | None = None
+"""cache of compiled expressions of the worker process."""
+
+_worker_optimize: bool = False
+"""whether the worker process optimizes the parse trees."""
+
+
+def _init_worker(cache_size: int, optimize: bool):
+    """Initializes the state kept by the worker process for its lifetime."""
+    global _worker_cache, _worker_optimize
+    _worker_cache = LRUCache(cache_size)
+    _worker_optimize = optimize
+
+
+def _evaluate_chunk(exprs: list[str]) -> list[Outcome]:
+    """Evaluates a chunk of expressions in the worker process."""
+    return [evaluate_one(expr, _worker_cache, _worker_optimize) for expr in exprs]
+
+
+def evaluate_parallel(
+    exprs: Iterable[str],
+    jobs: int | None = None,
+    cache_size: int = 256,
+    optimize: bool = False,
+    chunksize: int = 256,
+) -> Iterator[Outcome]:
+    """Lazily evaluates the expressions in order using a pool of processes.
+
+    The expressions are sent to the workers in chunks, and every worker keeps its
+    own cache of compiled expressions, so a repeated expression is parsed once per
+    worker. Only a bounded number of chunks are in flight at any time.
+
+    Arguments:
+    - exprs: expressions.
+    - jobs: number of worker processes, defaults to number of cpus.
+    - cache_size: maximum number of compiled expressions kept by each worker.
+    - optimize: fold constants & simplify the parse tree.
+    - chunksize: number of expressions sent to a worker at once.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be +ve")
+
+    jobs = jobs or os.cpu_count() or 1
+    window = 2 * jobs
+    pending = deque()
+
+    exprs = iter(exprs)
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(cache_size, optimize),
+    ) as executor:
+        while True:
+            while len(pending) < window:
+                chunk = list(islice(exprs, chunksize))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_evaluate_chunk, chunk))
+
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+
+def read_exprs(stream: IO[str]) -> Iterator[str]:
+    """Lazily reads newline delimited expressions, skipping the blank lines.
+
+    Arguments:
+    - stream: text stream.
+    """
+    for line in stream:
+        expr = line.strip()
+        if expr:
+            yield expr
@@ -0,0 +1,130 @@
+"""
+Module: calc.cache
+Description: Provides a bounded thread safe LRU cache with usage counters.
+
+Usage:
+>>> from calc.cache import LRUCache
+>>> cache = LRUCache(maxsize=2)
+>>> cache.get_or_create('1+2', len)
+3
+>>> cache.get_or_create('1+2', len)
+3
+>>> cache.info()
+CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, NamedTuple
+
+
+__all__ = (
+    "CacheInfo",
+    "LRUCache",
+)
+
+
+class CacheInfo(NamedTuple):
+    """Usage counters of the cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """A bounded cache evicting the least recently used item when full.
+
+    All the operations are guarded by a lock, so the cache can be shared by threads.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Arguments:
+        - maxsize: maximum number of items kept, `0` disables the cache.
+
+        Raises:
+        - ValueError: maxsize is a negative value.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize cannot be -ve")
+
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Provides the cached value of key and marks it as recently used.
+
+        Arguments:
+        - key: key of the value.
+        - default: returned when key is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Caches the value, evicts the least recently used item when full.
+
+        Arguments:
+        - key: key of the value.
+        - value: value to cache.
+        """
+        if self.maxsize == 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_create(self, key: Hashable, factory: Callable[[Hashable], Any]) -> Any:
+        """Provides the cached value of key, creates & caches it when missing.
+
+        NOTE: factory is called outside of the lock, exceptions raised by it are not cached.
+
+        Arguments:
+        - key: key of the value.
+        - factory: creates the value from the key.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = factory(key)
+            self.put(key, value)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Provides the usage counters of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._data)
+            )
+
+    def clear(self):
+        """Removes all the items and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
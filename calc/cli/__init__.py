@@ -3,23 +3,35 @@ This package contains objects and functions required for parsing and
 output command line arguments for calc.
 """
 
+import sys
 from argparse import ArgumentParser
 from dataclasses import dataclass
 from typing import Iterable
 
-from ..lexer import lex
+from ..batch import evaluate_iter, evaluate_parallel, read_exprs
+from ..cache import LRUCache
+from ..lexer import fast_lex
+from ..lexer.token import Token
 from ..parser import parse
-from ..evaluator import evaluate
+from ..evaluator import Evaluator
+from ..evaluator.numeric import Numeric, NumericEvaluator, numeric_backend
+from ..evaluator.optimizer import optimize
 from ..exceptions import CalcError
-from .views import token_view, ast_view, eval_view, error_view
-
+from ..parser.node import Node
+from ..profile import Observer, Profile, observe, node_counts
+from .views import token_view, ast_view, eval_view, error_view, cache_view, profile_view
+from .stream import writers
 
 
 @dataclass(frozen=True)
 class Args:
     """Parse command line arguments provided to calc module"""
 
-    exprs: Iterable[str]
+    exprs: Iterable[str] | None = None
+    input: str | None = None
+    output_format: str = "text"
+    flush_every: int = 1000
+    jobs: int = 1
     raw: bool = False
     title: bool = True
     fmt: str = None
@@ -28,6 +40,11 @@ class Args:
     inspect_tokens: bool = False
     inspect_tree: bool = False
     round: int | None = None
+    optimize: bool = False
+    cache_size: int = 256
+    cache_stats: bool = False
+    profile: bool = False
+    numeric: str = "float"
 
 
 def get_argparser() -> ArgumentParser:
@@ -41,11 +58,24 @@ def get_argparser() -> ArgumentParser:
 
     p.add_argument('--inspect-tokens', action='store_const', const=True, default=False, required=False, help="inspect tokens of the expression")
     p.add_argument('--inspect-tree', action='store_const', const=True, default=False, required=False, help="inspect parse tree of the expression")
+    p.add_argument('-O', '--optimize', action='store_const', const=True, default=False, required=False, help="fold constants & simplify the parse tree before evaluation")
+
+    p.add_argument('--numeric', type=str, default='float', required=False, help="numbers evaluated with: float, fraction, decimal or decimal:<precision>")
 
     p.add_argument('-r', '--round', type=int, default=None, required=False, help="round output value")
     p.add_argument('-f', '--format', type=str, default=None, required=False, help="python f-string based format specifier to format number")
 
-    p.add_argument('-e', '--expr', '--exprs', required=True, nargs='+', help="input expressions")
+    p.add_argument('--cache-size', type=int, default=256, required=False, help="maximum number of parsed expressions kept for reuse, 0 disables the cache")
+    p.add_argument('--cache-stats', action='store_const', const=True, default=False, required=False, help="show cache usage counters at the end")
+    p.add_argument('--profile', action='store_const', const=True, default=False, required=False, help="show time taken by lexing, parsing & evaluation of each expression")
+
+    p.add_argument('--output-format', choices=tuple(writers), default="text", required=False, help="output format of the results for --input")
+    p.add_argument('-j', '--jobs', type=int, default=1, required=False, help="number of worker processes evaluating --input, 0 uses all cpus")
+    p.add_argument('--flush-every', type=int, default=1000, required=False, help="flush the output after these many results for --input")
+
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument('-e', '--expr', '--exprs', nargs='+', help="input expressions")
+    src.add_argument('-i', '--input', type=str, default=None, help="file with newline delimited expressions, '-' for stdin")
 
     return p
 
@@ -53,8 +83,19 @@ def get_argparser() -> ArgumentParser:
 def parse_args(arg_parser: ArgumentParser, argv: Iterable[str]) -> Args:
     """returns parsed data"""
     args = arg_parser.parse_args(argv)
+    try:
+        numeric_backend(args.numeric)
+    except ValueError as e:
+        arg_parser.error(f"argument --numeric: {e}")
+    if args.input is not None and args.numeric != 'float':
+        arg_parser.error("argument --numeric: not supported with --input")
+
     return Args(
         exprs=args.expr,
+        input=args.input,
+        output_format=args.output_format,
+        flush_every=max(1, args.flush_every),
+        jobs=max(0, args.jobs),
         raw=args.raw,
         title=args.no_title,
         fmt=args.format,
@@ -63,23 +104,60 @@ def parse_args(arg_parser: ArgumentParser, argv: Iterable[str]) -> Args:
         inspect_tokens=args.inspect_tokens,
         inspect_tree=args.inspect_tree,
         round=args.round,
+        optimize=args.optimize,
+        cache_size=args.cache_size,
+        cache_stats=args.cache_stats,
+        profile=args.profile,
+        numeric=args.numeric,
     )
 
 
-def process(expr: str, args: Args):
-    """Processes one expression at a time"""
+def analyse(
+    expr: str, args: Args, observer: Observer | None = None
+) -> tuple[tuple[Token, ...], Node]:
+    """Provides the tokens & parse tree of the expression, lexing & parsing it once"""
+    if observer is None:
+        tokens = tuple(fast_lex(expr))
+        root = parse(expr, tokens=tokens)
+        if args.optimize and args.numeric == 'float':
+            root = optimize(expr, root)
+        return tokens, root
 
-    try:
-        tokens = tuple(tok for tok in lex(expr))
-        root = parse(expr, lex)
-        result = evaluate(expr)
+    tokens = observe(observer, expr, 'lex', lambda: tuple(fast_lex(expr)), len)
+    root = observe(observer, expr, 'parse', lambda: parse(expr, tokens=tokens), node_counts)
+    if args.optimize and args.numeric == 'float':
+        root = observe(observer, expr, 'optimize', lambda: optimize(expr, root), node_counts)
+    return tokens, root
+
+
+def format_value(value: int | float, args: Args) -> int | float | str:
+    """Rounds & formats the value as requested"""
+    if args.round:
+        value = round(value, args.round)
+
+    if args.fmt:
+        value = format(value, args.fmt)
 
-        if args.round:
-            result = round(result, args.round)
+    return value
 
-        if args.fmt:
-            result = format(result, args.fmt)
 
+def process(
+    expr: str, args: Args, cache: LRUCache | None = None, numeric: Numeric | None = None
+):
+    """Processes one expression at a time, evaluating with the numeric backend if provided"""
+
+    profile = Profile() if args.profile else None
+
+    try:
+        if cache is None or profile is not None:
+            tokens, root = analyse(expr, args, profile)
+        else:
+            tokens, root = cache.get_or_create(expr, lambda expr: analyse(expr, args))
+        if numeric is None:
+            evaluator = Evaluator(expr, observer=profile)
+        else:
+            evaluator = NumericEvaluator(expr, numeric, observer=profile)
+        result = format_value(evaluator.eval_tree(root), args)
     except CalcError as e:
         name, desc = str(e).split(': ', maxsplit=1)
         print(error_view(name, desc, color=args.color))
@@ -96,9 +174,35 @@ def process(expr: str, args: Args):
     if args.show_eval:
         print(eval_view(result, title, args.color), end='\n\n')
 
+    if profile is not None:
+        print(profile_view(profile, title, args.color), end='\n\n')
+
+
+def process_stream(args: Args):
+    """Streams the expressions from input file to the output as they are evaluated"""
+    write = writers[args.output_format]
+    formatter = lambda value: format_value(value, args)
+
+    stream = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    with stream:
+        exprs = read_exprs(stream)
+        if args.jobs == 1:
+            outcomes = evaluate_iter(exprs, args.cache_size, args.optimize)
+        else:
+            outcomes = evaluate_parallel(exprs, args.jobs or None, args.cache_size, args.optimize)
+        write(outcomes, sys.stdout, formatter, args.title, args.color, args.flush_every)
+
 
 def main(argv):
     """Main functions for CLI"""
     args = parse_args(arg_parser=get_argparser(), argv=argv)
+    if args.input is not None:
+        return process_stream(args)
+
+    cache = LRUCache(args.cache_size)
+    numeric = numeric_backend(args.numeric)
     for expr in args.exprs:
-        process(expr, args)
+        process(expr, args, cache, numeric)
+
+    if args.cache_stats:
+        print(cache_view(cache.info(), args.color))
@@ -0,0 +1,111 @@
+"""
+This module contains the writers to output the outcomes of streamed expressions.
+
+Every writer consumes the outcomes lazily and flushes the output periodically,
+so results appear while the input is still being read.
+"""
+
+import csv
+import json
+from typing import IO, Callable, Iterable
+
+from ..batch import Outcome
+from .views import eval_view, error_view
+
+
+Formatter = Callable[[int | float], int | float | str]
+"""Formats the evaluated value for output."""
+
+
+def render(outcome: Outcome, fmt: Formatter) -> Outcome:
+    """Formats the value of outcome, failing the outcome when the value cannot be written.
+
+    e.g. integers beyond the limit of digits converted to string.
+    """
+    if not outcome.success:
+        return outcome
+    try:
+        value = fmt(outcome.value)
+        str(value)
+    except Exception as error:
+        return Outcome(outcome.expr, error=type(error).__name__, message=str(error))
+    return Outcome(outcome.expr, value)
+
+
+def write_text(
+    outcomes: Iterable[Outcome],
+    out: IO[str],
+    fmt: Formatter = lambda value: value,
+    title: bool = True,
+    color: bool = False,
+    flush_every: int = 1000,
+):
+    """writes the views of outcomes, one after another"""
+    for i, outcome in enumerate(outcomes, 1):
+        outcome = render(outcome, fmt)
+        if outcome.success:
+            name = outcome.expr if title else None
+            out.write(eval_view(outcome.value, name, color) + "\n")
+        else:
+            out.write(error_view(outcome.error, outcome.message, color=color) + "\n")
+
+        if i % flush_every == 0:
+            out.flush()
+    out.flush()
+
+
+def write_csv(
+    outcomes: Iterable[Outcome],
+    out: IO[str],
+    fmt: Formatter = lambda value: value,
+    title: bool = True,
+    color: bool = False,
+    flush_every: int = 1000,
+):
+    """writes the outcomes as csv rows with a header"""
+    writer = csv.writer(out)
+    writer.writerow(("expr", "value", "error", "message"))
+
+    for i, outcome in enumerate(outcomes, 1):
+        outcome = render(outcome, fmt)
+        writer.writerow((outcome.expr, outcome.value, outcome.error, outcome.message))
+
+        if i % flush_every == 0:
+            out.flush()
+    out.flush()
+
+
+def write_jsonl(
+    outcomes: Iterable[Outcome],
+    out: IO[str],
+    fmt: Formatter = lambda value: value,
+    title: bool = True,
+    color: bool = False,
+    flush_every: int = 1000,
+):
+    """writes the outcomes as json objects, one per line"""
+    for i, outcome in enumerate(outcomes, 1):
+        outcome = render(outcome, fmt)
+        value = outcome.value
+        if not isinstance(value, (int, float, str, type(None))):
+            value = str(value)
+
+        record = {
+            "expr": outcome.expr,
+            "value": value,
+            "error": outcome.error,
+            "message": outcome.message,
+        }
+        out.write(json.dumps(record) + "\n")
+
+        if i % flush_every == 0:
+            out.flush()
+    out.flush()
+
+
+writers = {
+    "text": write_text,
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+}
+"""Writers for the output formats."""
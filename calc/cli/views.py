@@ -7,8 +7,10 @@ from io import StringIO
 from typing import Iterable
 
 from .styles import *
+from ..cache import CacheInfo
 from ..lexer.token import Token
 from ..parser.node import Node
+from ..profile import Profile
 
 
 def title_view(title: str, expr: str, end: str = "") -> str:
@@ -104,3 +106,24 @@ def eval_view(value: str | int | float, title: str = None, color: bool = False)
     title = title_view("Eval", title, "\n= ") if title else ""
     value = str(value)
     return title + wrap(value, LT_GREEN_FG, DK_WHITE_FG) if color else title + value
+
+
+def cache_view(info: CacheInfo, color: bool = False) -> str:
+    """cache usage view"""
+    title = wrap("Cache", LT_GREEN_FG, LT_WHITE_FG) if color else "Cache"
+    counters = ", ".join(f"{name}={value}" for name, value in info._asdict().items())
+    return f"{title}: {counters}"
+
+
+def profile_view(profile: Profile, title: str = None, color: bool = False) -> str:
+    """time taken by each stage view"""
+    heading = title_view("Profile", title, "\n\n") if title else ""
+    rows = []
+    for stage in profile.stages:
+        counts = " ".join(f"{name}={count}" for name, count in stage.counts.items())
+        name = wrap(f"{stage.name:<8}", LT_GREEN_FG, LT_WHITE_FG) if color else f"{stage.name:<8}"
+        rows.append(f"{name} {stage.ns / 1000:>10.3f} us {stage.count:>6}  {counts}".rstrip())
+
+    total = wrap(f"{'total':<8}", LT_GREEN_FG, LT_WHITE_FG) if color else f"{'total':<8}"
+    rows.append(f"{total} {profile.total_ns / 1000:>10.3f} us")
+    return heading + "\n".join(rows)
@@ -3,19 +3,54 @@ Module: calc.evaluator
 Description: Providesthe classand functions to evaluate the parse tree.
 """
 
-from typing import Callable, Dict
+from typing import Callable, Dict, Mapping
 
 from .functions import default_funcs
 from .constants import default_consts
 from .exceptions import *
+from .limits import Limits, Guard, binary_costs, default_limits, time_budget
+from . import operators
 from ..lexer import Lexer, lex
 from ..parser import Parser, parse
-from ..parser.node import Node, BinOp, UnOp, Num, Func, Const
+from ..parser.node import Node, BinOp, UnOp, Num, Func, Const, walk, to_number
+from ..profile import Observer, observe, node_counts
+
+
+# kinds of the nodes pending on stack to be applied
+_BINOP = 0
+_UNOP = 1
+_FUNC = 2
+
+_VARIABLE = object()
+"""marks the names resolved to variables, their values change with the bindings."""
+
+_max_resolved = 4096
+"""number of nodes whose operators are kept resolved by an evaluator."""
+
+_cheap_binary_ops = {
+    op: fn for op, fn in operators.binary_ops.items() if op not in binary_costs
+}
+"""default operators applied the same for every node when the limits are checked."""
 
 
 class Evaluator:
     """A class to evaluate the expression."""
 
+    domain_errors: tuple[type[Exception], ...] = (ValueError,)
+    """errors raised by functions for values out of their domain."""
+
+    binary_ops: Dict[str, Callable] = operators.binary_ops
+    """functions applying the binary operators by symbol."""
+
+    unary_ops: Dict[str, Callable] = operators.unary_ops
+    """functions applying the unary operators by symbol."""
+
+    parsed_numbers: bool = True
+    """whether numbers converted by the parser are used, else `_eval_num` converts each literal."""
+
+    _binop_dispatch: Dict[str, Callable] | None = None
+    """table of `_binop_table` built by the first evaluation."""
+
     def __init__(
         self,
         expr: str,
@@ -23,6 +58,9 @@ class Evaluator:
         parser: Parser = parse,
         funcs: Dict[str, Callable] = default_funcs,
         consts: Dict[str, int | float] = default_consts,
+        variables: Mapping[str, int | float] | None = None,
+        limits: Limits | None = default_limits,
+        observer: Observer | None = None,
     ):
         """
         Arguments:
@@ -31,117 +69,312 @@ class Evaluator:
         - parser: parses the stream of token into parse tree.
         - funcs: functions.
         - consts: constants.
+        - variables: values of the free names used in expression.
+        - limits: resource limits of the evaluation, `None` disables them.
+        - observer: told the measurements of lexing, parsing & evaluation.
+
+        NOTE: constants take precedence over the variables of same name.
         """
         self.expr = expr
         self.lexer = lexer
         self.parser = parser
         self.funcs = funcs
         self.consts = consts
+        self.variables = variables or {}
+        self.limits = limits
+        self.guard = Guard(expr, limits) if limits is not None else None
+        self.observer = observer
+
+        # resolved once & shared with the bound copies, as functions & constants are
+        self._found_funcs: Dict[str, tuple[str, Callable]] = {}
+        self._found_consts: Dict[str, object] = {}
+        self._resolved: Dict[int, tuple[BinOp, Callable]] = {}
 
     def eval(self) -> int | float:
         """Main method to evaluate the expreesion."""
+        if self.observer is not None:
+            return self._eval_observed()
+
         root = self.parser(self.expr, self.lexer)
-        return self._eval_node(root)
+        return self.eval_tree(root)
+
+    def _eval_observed(self) -> int | float:
+        """Evaluates the expression measuring lexing & parsing seperately."""
+        observer, expr = self.observer, self.expr
+
+        tokens = observe(observer, expr, "lex", lambda: tuple(self.lexer(expr)), len)
+        root = observe(
+            observer, expr, "parse", lambda: self.parser(expr, lambda _: tokens), node_counts
+        )
+        return self.eval_tree(root)
+
+    def eval_tree(self, root: Node) -> int | float:
+        """Evaluates an already parsed tree of the expression.
+
+        Arguments:
+        - root: parse tree produced from `expr`.
+        """
+        if self.observer is not None:
+            return observe(
+                self.observer,
+                self.expr,
+                "eval",
+                lambda: self._eval_tree(root),
+                lambda _: node_counts(root),
+            )
+        return self._eval_tree(root)
+
+    def _eval_tree(self, root: Node) -> int | float:
+        """Evaluates the tree within the limits."""
+        if self.guard is None:
+            return self._eval_node(root)
+
+        if self.limits.max_ops is not None:
+            self.guard.check_ops(sum(1 for _ in walk(root)), root.index)
+        if self.limits.timeout is None:
+            return self._eval_node(root)
+        with time_budget(self.limits.timeout):
+            return self._eval_node(root)
+
+    def bind(self, variables: Mapping[str, int | float]) -> "Evaluator":
+        """Provides a copy of the evaluator with the variables bound to it.
+
+        Arguments:
+        - variables: values of the free names used in expression.
+        """
+        evaluator = object.__new__(type(self))
+        evaluator.__dict__.update(self.__dict__)
+        evaluator.variables = variables
+        return evaluator
 
     def _eval_node(self, root: Node) -> int | float:
-        """Evaluates arbitrary node. Finds the appropriate method for the node."""
+        """Evaluates arbitrary node.
+
+        The tree is walked in post-order using an explicit stack, so the depth of
+        the tree is not limited by the recursion limit. Operators & functions are
+        applied once the values of their operands are computed.
+
+        Operators are dispatched by the table of the evaluator, the ones needing the
+        node are resolved once per node of the tree. Functions & constants are resolved
+        once per name by the evaluator.
+        """
+        stack = [root]
+        values = []
+        push = stack.append
+        pop = stack.pop
+        item = None
+        parsed_numbers = self.parsed_numbers
+        unary_ops = self.unary_ops
+        funcs = self._found_funcs
+        consts = self._found_consts
+        resolved = self._resolved
+        binary_ops = self._binop_dispatch
+        if binary_ops is None:
+            binary_ops = self._binop_dispatch = self._binop_table()
+
         try:
-            name = f"_eval_{type(root).__name__.lower()}"
-            method = getattr(self, name)
-        except AttributeError:
-            raise MethodNotFoundError(
-                self.expr, name, root, "method not found for node evaluation"
-            )
-        return method(root)
+            while stack:
+                item = pop()
+                cls = type(item)
 
-    def _eval_binop(self, root: BinOp) -> int | float:
-        """Evaluates the BinOp node."""
-        left = self._eval_node(root.left)
-        right = self._eval_node(root.right)
+                if cls is tuple:
+                    # operands are computed, apply the node
+                    kind, node = item[0], item[1]
+                    if kind is _BINOP:
+                        right = values.pop()
+                        values[-1] = item[2](values[-1], right)
+                    elif kind is _UNOP:
+                        values[-1] = item[2](values[-1])
+                    else:
+                        argc = len(node.args)
+                        args = tuple(values[-argc:]) if argc else ()
+                        if argc:
+                            del values[-argc:]
+                        values.append(self._apply_func(node, item[3], args))
 
-        if root.op == "+":
-            return left + right
+                elif cls is Num:
+                    number = item.number
+                    if number is None or not parsed_numbers:
+                        number = self._eval_num(item)
+                    values.append(number)
 
-        if root.op == "-":
-            return left - right
+                elif cls is Const:
+                    value = consts.get(item.name)
+                    if value is None:
+                        value = self._eval_const(item)
+                        is_const = item.name.lower() in self.consts
+                        consts[item.name] = value if is_const else _VARIABLE
+                    elif value is _VARIABLE:
+                        value = self._eval_const(item)
+                    values.append(value)
 
-        if root.op == "*":
-            return left * right
+                elif cls is BinOp:
+                    fn = binary_ops.get(item.op)
+                    if fn is None:
+                        # the node is kept along, so its id is not reused by another
+                        found = resolved.get(id(item))
+                        if found is None:
+                            if len(resolved) >= _max_resolved:
+                                resolved.clear()
+                            found = resolved[id(item)] = (item, self._resolve_binop(item))
+                        fn = found[1]
+                    push((_BINOP, item, fn))
+                    push(item.right)
+                    push(item.left)
 
-        if root.op == "/":
-            try:
-                return left / right
-            except ZeroDivisionError:
-                raise DivideByZeroError(self.expr, root.index, "cannot divide by zero")
+                elif cls is UnOp:
+                    push((_UNOP, item, unary_ops[item.op]))
+                    push(item.expr)
 
-        if root.op == "%":
-            try:
-                return left % right
-            except ZeroDivisionError:
-                raise DivideByZeroError(self.expr, root.index, "cannot modulo by zero")
+                elif cls is Func:
+                    found = funcs.get(item.name)
+                    if found is None:
+                        found = funcs[item.name] = self._find_func(item)
+                    push((_FUNC, item, *found))
+                    for arg in reversed(item.args):
+                        push(arg)
 
-        if root.op == "**":
-            return left**right
+                else:
+                    try:
+                        name = f"_eval_{cls.__name__.lower()}"
+                        method = getattr(self, name)
+                    except AttributeError:
+                        raise MethodNotFoundError(
+                            self.expr, name, item, "method not found for node evaluation"
+                        )
+                    values.append(method(item))
 
-    def _eval_unop(self, root: UnOp) -> int | float:
-        """Evaluates UnOp node."""
-        expr = self._eval_node(root.expr)
+        except ZeroDivisionError:
+            error = self._zero_division(item[1]) if type(item) is tuple else None
+            if error is None:
+                raise
+            raise error
 
-        if root.op == "+":
-            return +expr
-        if root.op == "-":
-            return -expr
+        except (*self.domain_errors, TypeError) as error:
+            # the innermost function being applied or computing its arguments
+            pending = (item, *reversed(stack))
+            owner = next((p for p in pending if type(p) is tuple and p[0] is _FUNC), None)
 
-    def _eval_num(self, root: Num) -> int | float:
-        """Evaluates Num node."""
+            if owner is None:
+                raise
+
+            _, node, name, _ = owner
+            if isinstance(error, self.domain_errors):
+                raise MathDomainError(self.expr, name, node.index, "value out of domain")
+            raise WrongArgCountError(
+                self.expr, name, node.index, "wrong number of arguments provided"
+            )
+
+        return values[-1]
+
+    def _binop_table(self) -> Dict[str, Callable]:
+        """Provides the functions of the binary operators applied the same for every node.
+
+        The table is built once per evaluator, the operators missing from it are
+        resolved once per node by `_resolve_binop`. Subclasses overriding it provide
+        the table accordingly.
+        """
+        if self.guard is None or not self.guard.active:
+            return self.binary_ops
+        if self.binary_ops is operators.binary_ops:
+            return _cheap_binary_ops
+        return {op: fn for op, fn in self.binary_ops.items() if op not in binary_costs}
+
+    def _resolve_binop(self, root: BinOp) -> Callable:
+        """Provides the function applying the operator of BinOp node to the values of its operands.
+
+        NOTE: `ZeroDivisionError` raised by the function is converted by the caller.
+        """
+        fn = self.binary_ops[root.op]
+        if self.guard is not None:
+            fn = self.guard.binary(root.op, fn, root.index)
+        return fn
+
+    def _zero_division(self, root: Node) -> DivideByZeroError | None:
+        """Provides the error of the node dividing by zero, `None` for nodes other than `/` & `%`."""
+        message = operators.zero_division_msg.get(root.op) if type(root) is BinOp else None
+        if message is None:
+            return None
+        return DivideByZeroError(self.expr, root.index, message)
+
+    def _apply_binop(self, root: BinOp, left: int | float, right: int | float) -> int | float:
+        """Applies the operator of BinOp node to the values of its operands."""
         try:
-            return int(root.value)
-        except ValueError:
-            pass
+            return self._resolve_binop(root)(left, right)
+        except ZeroDivisionError:
+            error = self._zero_division(root)
+            if error is None:
+                raise
+            raise error
 
-        base, expo = root.value, 0
-        if "e" in base:
-            base, expo = base.split("e")
+    def _apply_unop(self, root: UnOp, value: int | float) -> int | float:
+        """Applies the operator of UnOp node to the value of its operand."""
+        return self.unary_ops[root.op](value)
 
-        base = float(base) if "." in base else int(base)
-        return base * (10 ** int(expo))
+    def _eval_num(self, root: Num) -> int | float:
+        """Evaluates Num node."""
+        if root.number is not None:
+            return root.number
+        if self.guard is not None:
+            self.guard.check_literal(root.value, root.index)
+        return to_number(root.value)
 
-    def _eval_func(self, root: Func) -> int | float:
-        """Evaluates Func node."""
+    def _find_func(self, root: Func) -> tuple[str, Callable]:
+        """Provides the name & function of Func node, before its arguments are evaluated."""
         try:
             name = root.name.lower()
-            fn = self.funcs[name]
+            return name, self.funcs[name]
         except KeyError:
             raise UnknownFuncNameError(
                 self.expr, name, root.index, "function name not found"
             )
 
-        try:
-            args = tuple(self._eval_node(arg) for arg in root.args)
-            return fn(*args)
-        except ValueError:
-            raise MathDomainError(self.expr, name, root.index, "value out of domain")
-        except TypeError:
-            raise WrongArgCountError(
-                self.expr, name, root.index, "wrong number of arguments provided"
-            )
+    def _apply_func(self, root: Func, fn: Callable, args: tuple) -> int | float:
+        """Calls the function of Func node with the values of its arguments.
+
+        NOTE: `domain_errors` & `TypeError` raised while computing the arguments or
+        calling the function are converted by `_eval_node`.
+        """
+        if self.guard is not None:
+            self.guard.check_call(fn, args, root.index)
+        return fn(*args)
 
     def _eval_const(self, root: Const) -> int | float:
-        """Evaluates Const node."""
+        """Evaluates Const node. Looks up the constants first then the variables."""
+        name = root.name.lower()
         try:
-            name = root.name.lower()
             return self.consts[name]
+        except KeyError:
+            pass
+
+        try:
+            return self.variables[root.name]
         except KeyError:
             raise UnknownConstNameError(
                 self.expr, name, root.index, "const name not found"
             )
 
 
-def evaluate(expr: str) -> int | float:
+def evaluate(
+    expr: str,
+    env: Mapping[str, int | float] | None = None,
+    /,
+    **variables: int | float,
+) -> int | float:
     """
     Evaluates the expreesion into and outputs the result.
 
     Arguments:
     - expr: expression.
+    - env: values of the free names used in expression.
+    - variables: values of the free names, takes precedence over env.
+
+    Usage:
+    >>> evaluate('x*2 + y', x=3, y=1)
+    7
+    >>> evaluate('x*2 + y', {'x': 3, 'y': 1})
+    7
     """
-    return Evaluator(expr).eval()
+    if env and variables:
+        variables = {**env, **variables}
+    return Evaluator(expr, variables=variables or env).eval()
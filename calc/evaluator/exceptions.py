@@ -15,6 +15,7 @@ __all__ = (
     "WrongArgCountError",
     "MathDomainError",
     "MethodNotFoundError",
+    "ResourceLimitError",
 )
 
 
@@ -169,3 +170,27 @@ class MethodNotFoundError(EvaluationError):
             f"{self.name}: {self.description} \n"
             f"unable to find method '{self.method}' for node '{node}'"
         )
+
+
+class ResourceLimitError(EvaluationError):
+    """Raised when evaluation would exceed the resource limits."""
+
+    def __init__(self, expr: str, limit: str, pos: int, *msg: object):
+        """
+        Arguments:
+        - expr: expression.
+        - limit: name of the limit exceeded.
+        - pos: position of the operation in expression.
+        - msg: messages or data objects.
+        """
+        super().__init__(expr, *msg)
+        self.limit = limit
+        self.pos = pos
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.description} \n"
+            f"Expression: '{self.expr}' \n"
+            f"{'^':>{self.pos+14}} \n"
+            f"limit '{self.limit}' exceeded"
+        )
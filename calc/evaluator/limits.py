@@ -0,0 +1,259 @@
+"""
+Module: calc.evaluator.limits
+Description: Provides the resource limits enforced during evaluation.
+
+Python integers are unbounded, so `9**9**9` or `fact(10**7)` can keep a core busy
+for minutes and exhaust the memory. The number of digits of the result is
+estimated before such operations are done, and `ResourceLimitError` is raised when
+the estimate goes beyond the limit. The wall clock budget is checked before every
+costly operation, the remaining operations are cheap.
+
+Usage:
+>>> from calc.evaluator import Evaluator
+>>> from calc.evaluator.limits import Limits
+>>> Evaluator('fact(10**7)', limits=Limits(max_digits=1000)).eval()
+Traceback (most recent call last):
+...
+calc.evaluator.exceptions.ResourceLimitError: ResourceLimitError: result is too large
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from fractions import Fraction
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator
+
+from .exceptions import ResourceLimitError
+
+
+__all__ = (
+    "Limits",
+    "default_limits",
+    "Guard",
+    "time_budget",
+    "pow_digits",
+    "mul_digits",
+    "fact_digits",
+    "literal_digits",
+)
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Resource limits of a single evaluation, `None` disables the limit.
+
+    Arguments:
+    - max_digits: maximum number of decimal digits of an integer result.
+    - max_ops: maximum number of operations, i.e. nodes in parse tree.
+    - timeout: wall clock budget in seconds.
+    """
+
+    max_digits: int | None = 100_000
+    max_ops: int | None = None
+    timeout: float | None = None
+
+
+default_limits = Limits()
+"""Limits used unless provided otherwise."""
+
+
+_exact = (int, Fraction)
+"""Types of numbers with exact results, which grow with the operations."""
+
+
+def magnitude(value: int | Fraction) -> int:
+    """Larger of the absolute values of numerator & denominator."""
+    return max(abs(value.numerator), value.denominator)
+
+
+def pow_digits(base: int | float, exponent: int | float) -> float:
+    """Estimates the number of digits of `base**exponent` for integers & fractions."""
+    if not (isinstance(base, _exact) and isinstance(exponent, _exact)):
+        return 0
+    if exponent.denominator != 1 or (exponent < 0 and isinstance(base, int)):
+        return 1
+    if exponent == 0 or magnitude(base) <= 1:
+        return 1
+    return abs(exponent) * math.log10(magnitude(base))
+
+
+def mul_digits(left: int | float, right: int | float) -> float:
+    """Estimates the number of digits of `left*right` for integers & fractions."""
+    if not (isinstance(left, _exact) and isinstance(right, _exact)):
+        return 0
+    if left == 0 or right == 0:
+        return 1
+    return math.log10(magnitude(left)) + math.log10(magnitude(right))
+
+
+def fact_digits(*args: int | float) -> float:
+    """Estimates the number of digits of factorial of integer."""
+    if len(args) != 1 or not isinstance(args[0], int) or args[0] < 0:
+        return 0
+    try:
+        return math.lgamma(args[0] + 1) / math.log(10)
+    except OverflowError:
+        return math.inf
+
+
+def literal_digits(literal: str) -> float:
+    """Estimates the number of digits of the exact value of number literal."""
+    mantissa, _, exponent = literal.partition("e")
+    try:
+        return len(mantissa) + abs(int(exponent or 0))
+    except ValueError:
+        # malformed literal, reported by its conversion
+        return 0
+
+
+binary_costs: Dict[str, Callable[[int | float, int | float], float]] = {
+    "*": mul_digits,
+    "**": pow_digits,
+}
+"""Estimates of digits of the result of costly binary operators."""
+
+cheap_bits = 4096
+"""Operations on integers with results of fewer bits are not checked."""
+
+func_costs: Dict[Callable, Callable[..., float]] = {
+    math.factorial: fact_digits,
+}
+"""Estimates of digits of the result of costly functions."""
+
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+"""Monotonic time by which the current evaluation must complete."""
+
+
+@contextmanager
+def time_budget(timeout: float | None) -> Iterator[None]:
+    """Sets the deadline of evaluations done within the context.
+
+    Arguments:
+    - timeout: wall clock budget in seconds, `None` keeps the current deadline.
+    """
+    if timeout is None:
+        yield
+        return
+
+    token = _deadline.set(time.monotonic() + timeout)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class Guard:
+    """Checks the limits before the costly operations of an expression.
+
+    The guard holds no state of an evaluation, the deadline is provided by
+    `time_budget`. So it can be shared by concurrent evaluations.
+    """
+
+    def __init__(self, expr: str, limits: Limits):
+        """
+        Arguments:
+        - expr: expression.
+        - limits: limits to enforce.
+        """
+        self.expr = expr
+        self.limits = limits
+
+        # results below these many bits cannot exceed the limits
+        self.unchecked_bits = cheap_bits
+        if limits.max_digits is not None:
+            self.unchecked_bits = min(cheap_bits, int(limits.max_digits / math.log10(2)))
+
+    @property
+    def active(self) -> bool:
+        """Whether any limit is checked during the operations."""
+        return self.limits.max_digits is not None or self.limits.timeout is not None
+
+    def check_ops(self, ops: int, pos: int):
+        """Checks the number of operations of the evaluation."""
+        max_ops = self.limits.max_ops
+        if max_ops is not None and ops > max_ops:
+            raise ResourceLimitError(
+                self.expr, "max_ops", pos, "too many operations"
+            )
+
+    def check_time(self, pos: int):
+        """Checks the deadline of the evaluation."""
+        deadline = _deadline.get()
+        if deadline is not None and time.monotonic() > deadline:
+            raise ResourceLimitError(
+                self.expr, "timeout", pos, "evaluation took too long"
+            )
+
+    def check_digits(self, digits: float, pos: int):
+        """Checks the estimated number of digits of the result."""
+        max_digits = self.limits.max_digits
+        if max_digits is not None and digits > max_digits:
+            raise ResourceLimitError(
+                self.expr, "max_digits", pos, "result is too large"
+            )
+
+    def check_literal(self, literal: str, pos: int):
+        """Checks the limits before converting the number literal exactly."""
+        if "e" in literal:
+            self.check_digits(literal_digits(literal), pos)
+
+    def check_binary(self, op: str, left: int | float, right: int | float, pos: int):
+        """Checks the limits before the binary operator."""
+        cost = binary_costs.get(op)
+        if cost is not None:
+            self.check_time(pos)
+            self.check_digits(cost(left, right), pos)
+
+    def check_call(self, fn: Callable, args: tuple, pos: int):
+        """Checks the limits before the function call."""
+        cost = func_costs.get(fn)
+        if cost is not None:
+            self.check_time(pos)
+            self.check_digits(cost(*args), pos)
+
+    def binary(self, op: str, fn: Callable, pos: int) -> Callable:
+        """Provides the operator function checking the limits before applying it."""
+        if op not in binary_costs or not self.active:
+            return fn
+
+        unchecked_bits = self.unchecked_bits
+        check = self.check_binary
+
+        # cheap upper bound of bits of the result is checked first
+        if op == "*":
+
+            def guarded(left, right):
+                if (
+                    type(left) is int
+                    and type(right) is int
+                    and left.bit_length() + right.bit_length() > unchecked_bits
+                ):
+                    check(op, left, right, pos)
+                return fn(left, right)
+
+            return guarded
+
+        def guarded(left, right):
+            if (
+                type(left) is int
+                and type(right) is int
+                and left.bit_length() * right > unchecked_bits
+            ):
+                check(op, left, right, pos)
+            return fn(left, right)
+
+        return guarded
+
+    def call(self, fn: Callable, pos: int) -> Callable:
+        """Provides the function checking the limits before calling it."""
+        if fn not in func_costs or not self.active:
+            return fn
+
+        def guarded(*args):
+            self.check_call(fn, args, pos)
+            return fn(*args)
+
+        return guarded
@@ -0,0 +1,175 @@
+"""
+Module: calc.evaluator.native
+Description: Provides the compiler of parse tree into a native python function.
+
+The parse tree is translated into a python `ast.Expression` of a lambda, only
+made of generated names, literals and operators, and compiled with `compile`.
+The expression text is never evaluated. Functions & constants are provided to the
+lambda through its globals, so calling it costs close to a python function call.
+
+Errors are not tracked by the native code. When it raises, the expression is
+run again by the stack machine of `calc.evaluator.vm`, which raises the same
+error with the same position as `Evaluator`. As the evaluation has no side
+effects, running it again gives the same result.
+
+Usage:
+>>> from calc.parser import parse
+>>> from calc.evaluator.native import compile_native
+>>> fn = compile_native('x*2 + 1', parse('x*2 + 1'))
+>>> fn({'x': 3})
+7
+"""
+
+import ast
+from typing import Any, Callable, Dict, Mapping
+
+from .functions import default_funcs
+from .constants import default_consts
+from .limits import Limits, default_limits, time_budget
+from .vm import Program, PUSH, LOAD, BINARY, UNARY, CALL
+from . import vm
+from ..parser.node import Node
+
+
+__all__ = (
+    "compile_native",
+    "translate",
+)
+
+
+binary_ops = {
+    "+": ast.Add,
+    "-": ast.Sub,
+    "*": ast.Mult,
+    "/": ast.Div,
+    "%": ast.Mod,
+    "**": ast.Pow,
+}
+
+unary_ops = {
+    "+": ast.UAdd,
+    "-": ast.USub,
+}
+
+ENV = "env"
+"""Name of the lambda parameter holding the variables."""
+
+_loc = {"lineno": 1, "col_offset": 0, "end_lineno": 1, "end_col_offset": 0}
+"""Location of every generated node, the code has no source text."""
+
+
+def translate(program: Program) -> tuple[ast.Expression, Dict[str, Any]] | None:
+    """Translates the instructions of program into the ast of a lambda.
+
+    Arguments:
+    - program: compiled instructions of the parse tree.
+
+    Returns:
+    - ast of the lambda taking the variables mapping.
+    - globals required by the lambda.
+    or `None` when the program has instructions which always raise.
+    """
+    namespace = {"__builtins__": {}}
+    names = {}
+    stack = []
+
+    def global_name(prefix: str, value: Any) -> ast.Name:
+        """Name of the value provided through globals of the lambda."""
+        key = id(value)
+        if key not in names:
+            names[key] = f"_{prefix}{len(names)}"
+            namespace[names[key]] = value
+        return ast.Name(names[key], ast.Load(), **_loc)
+
+    for (op, arg), symbol in zip(program.code, program.symbols):
+        if op == PUSH:
+            if type(arg) in (int, float):
+                stack.append(ast.Constant(arg, **_loc))
+            else:
+                stack.append(global_name("c", arg))
+
+        elif op == LOAD:
+            env = ast.Name(ENV, ast.Load(), **_loc)
+            name = ast.Constant(arg, **_loc)
+            stack.append(ast.Subscript(env, name, ast.Load(), **_loc))
+
+        elif op == BINARY:
+            right = stack.pop()
+            left = stack.pop()
+            if arg is vm.binary_ops[symbol]:
+                stack.append(ast.BinOp(left, binary_ops[symbol](), right, **_loc))
+            else:
+                # operator checking the limits
+                stack.append(ast.Call(global_name("f", arg), [left, right], [], **_loc))
+
+        elif op == UNARY:
+            stack.append(ast.UnaryOp(unary_ops[symbol](), stack.pop(), **_loc))
+
+        elif op == CALL:
+            fn, argc = arg
+            start = len(stack) - argc
+            args = stack[start:]
+            del stack[start:]
+            stack.append(ast.Call(global_name("f", fn), args, [], **_loc))
+
+        else:
+            return None
+
+    params = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(ENV, **_loc)],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+    tree = ast.Expression(ast.Lambda(params, stack.pop(), **_loc))
+    return tree, namespace
+
+
+def compile_native(
+    expr: str,
+    root: Node,
+    funcs: Dict[str, Callable] = default_funcs,
+    consts: Dict[str, int | float] = default_consts,
+    limits: Limits | None = default_limits,
+) -> Callable[[Mapping[str, Any] | None], int | float]:
+    """Compiles the parse tree into a python function taking the variables.
+
+    Falls back to the stack machine when the tree cannot be compiled natively,
+    for e.g. when it is too deep for the python compiler.
+
+    Arguments:
+    - expr: expression.
+    - root: parse tree of expression.
+    - funcs: functions.
+    - consts: constants.
+    - limits: resource limits of the evaluation, `None` disables them.
+    """
+    program = Program.compile(expr, root, funcs, consts, limits)
+    translated = translate(program)
+    if translated is None:
+        return program.run
+
+    tree, namespace = translated
+    try:
+        code = compile(tree, f"<calc: {expr[:32]}>", "eval")
+        native = eval(code, namespace)
+    except (RecursionError, MemoryError, SyntaxError, ValueError):
+        return program.run
+
+    empty = {}
+
+    def run(variables: Mapping[str, Any] | None = None) -> int | float:
+        try:
+            return native(variables or empty)
+        except Exception:
+            return program.run(variables)
+
+    if program.timeout is None:
+        return run
+
+    def run_with_timeout(variables: Mapping[str, Any] | None = None) -> int | float:
+        with time_budget(program.timeout):
+            return run(variables)
+
+    return run_with_timeout
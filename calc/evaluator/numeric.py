@@ -0,0 +1,389 @@
+"""
+Module: calc.evaluator.numeric
+Description: Provides the number backends evaluating with decimals or fractions.
+
+A backend converts the number literals, applies the operators and provides the
+functions & constants working on its type of number. The decimal backend rounds
+the results to a set precision, every operation is done by the methods of a single
+`decimal.Context` created along with the backend. The fraction backend is exact,
+operations with no exact rational result are out of its domain.
+
+Usage:
+>>> from calc.evaluator.numeric import NumericEvaluator, DecimalNumeric, FractionNumeric
+>>> NumericEvaluator('0.1 + 0.2', DecimalNumeric(precision=50)).eval()
+Decimal('0.3')
+>>> NumericEvaluator('1/3 + 1/6', FractionNumeric()).eval()
+Fraction(1, 2)
+"""
+
+import decimal
+import math
+import operator
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache, reduce
+from typing import Any, Callable, Dict, Mapping
+
+from . import Evaluator
+from .limits import Limits, default_limits, fact_digits, func_costs
+from .exceptions import *
+from .operators import zero_division_msg
+from ..parser.node import BinOp, Num
+from ..profile import Observer
+
+
+__all__ = (
+    "Numeric",
+    "DecimalNumeric",
+    "FractionNumeric",
+    "NumericEvaluator",
+    "numeric_backend",
+)
+
+
+class Numeric:
+    """Number backend of the evaluator.
+
+    Attributes to be provided by the backends:
+    - name: name of the backend.
+    - binary_ops: functions applying the binary operators by symbol.
+    - unary_ops: functions applying the unary operators by symbol.
+    - funcs: functions.
+    - consts: constants.
+    - domain_errors: errors raised for values out of domain of operation.
+    - exact: whether the literals are converted exactly, i.e. expanding the exponent.
+    """
+
+    name: str
+    binary_ops: Dict[str, Callable[[Any, Any], Any]]
+    unary_ops: Dict[str, Callable[[Any], Any]]
+    funcs: Dict[str, Callable]
+    consts: Dict[str, Any]
+    domain_errors: tuple[type[Exception], ...] = (ValueError,)
+    exact: bool = False
+
+    def convert(self, literal: str) -> Any:
+        """Converts the number literal."""
+        raise NotImplementedError
+
+    def coerce(self, value: Any) -> Any:
+        """Converts the float value of variable or constant, others are kept as they are."""
+        if isinstance(value, float):
+            return self.convert(repr(value))
+        return value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+def _integral(value: Any) -> int:
+    """Provides the integer of integral value, for e.g. factorial."""
+    if value != math.floor(value):
+        raise ValueError("value is not integral")
+    return int(value)
+
+
+def _factorial(value: Any) -> int:
+    """Factorial of integral value of the backends."""
+    return math.factorial(_integral(value))
+
+
+def _log_domain(value: Any):
+    """Checks the value has a logarithm, decimals give -ve infinity for zero."""
+    if value <= 0:
+        raise ValueError("logarithm of non +ve value")
+
+
+# checked by the guard as `math.factorial` is
+func_costs[_factorial] = lambda *args: fact_digits(*map(_integral, args))
+
+
+class DecimalNumeric(Numeric):
+    """Decimal numbers rounded to the precision after every operation."""
+
+    name = "decimal"
+    domain_errors = (ValueError, decimal.InvalidOperation, decimal.Overflow)
+
+    def __init__(self, precision: int = 28, rounding: str = decimal.ROUND_HALF_EVEN):
+        """
+        Arguments:
+        - precision: number of significant digits of the results.
+        - rounding: rounding mode of the results.
+
+        Raises:
+        - ValueError: precision is not +ve.
+        """
+        if precision < 1:
+            raise ValueError("precision must be +ve")
+
+        self.precision = precision
+        self.context = ctx = decimal.Context(
+            prec=precision,
+            rounding=rounding,
+            traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+        )
+        # series are summed with guard digits, then rounded by the context
+        self.work = decimal.Context(prec=precision + 5, traps=ctx.traps.copy())
+        self.convert = lru_cache(maxsize=4096)(Decimal)
+
+        pi = self._pi()
+        self.two_pi = self.work.multiply(pi, 2)
+        self.ln2 = self.work.ln(2)
+
+        self.binary_ops = {
+            "+": ctx.add,
+            "-": ctx.subtract,
+            "*": ctx.multiply,
+            "/": ctx.divide,
+            "%": ctx.remainder,
+            "**": self.power,
+        }
+        self.unary_ops = {"+": ctx.plus, "-": ctx.minus}
+        self.consts = {"pi": ctx.plus(pi), "e": ctx.plus(self.work.exp(1))}
+        self.funcs = {
+            "sin": self.sin,
+            "cos": self.cos,
+            "tan": self.tan,
+            "log10": self.log10,
+            "log2": self.log2,
+            "log": self.log,
+            "sqrt": ctx.sqrt,
+            "floor": math.floor,
+            "ceil": math.ceil,
+            "round": lambda x, ndigits=0: ctx.quantize(x, Decimal(1).scaleb(-ndigits)),
+            "max": max,
+            "min": min,
+            "abs": ctx.abs,
+            "avg": lambda *nums: ctx.divide(reduce(self.work.add, nums), len(nums)),
+            "fact": _factorial,
+        }
+
+    def __repr__(self) -> str:
+        return f"DecimalNumeric(precision={self.precision})"
+
+    def _pi(self) -> Decimal:
+        """Computes pi at the working precision."""
+        c = self.work
+        lasts, t, s, n, na, d, da = 0, Decimal(3), 3, 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = c.divide(c.multiply(t, n), d)
+            s = c.add(s, t)
+        return s
+
+    def _series(self, x: Decimal, term: Decimal, i: int) -> Decimal:
+        """Sums the alternating series of sine or cosine, from the first term."""
+        c = self.work
+        x2 = c.multiply(x, x)
+        total, last, sign = term, None, 1
+        while total != last:
+            last = total
+            term = c.divide(c.multiply(term, x2), (i + 1) * (i + 2))
+            i += 2
+            sign = -sign
+            total = c.add(total, term) if sign > 0 else c.subtract(total, term)
+        return total
+
+    def sin(self, x: Decimal) -> Decimal:
+        """Sine of x radians."""
+        x = self.work.remainder_near(x, self.two_pi)
+        return self.context.plus(self._series(x, x, 1))
+
+    def cos(self, x: Decimal) -> Decimal:
+        """Cosine of x radians."""
+        x = self.work.remainder_near(x, self.two_pi)
+        return self.context.plus(self._series(x, Decimal(1), 0))
+
+    def tan(self, x: Decimal) -> Decimal:
+        """Tangent of x radians."""
+        x = self.work.remainder_near(x, self.two_pi)
+        sin, cos = self._series(x, x, 1), self._series(x, Decimal(1), 0)
+        return self.context.divide(sin, cos)
+
+    def power(self, base: Decimal, exponent: Decimal) -> Decimal:
+        """Power, zero has no -ve powers unlike the infinity given by the context."""
+        if not base and exponent < 0:
+            raise ZeroDivisionError("zero raised to a -ve power")
+        return self.context.power(base, exponent)
+
+    def log(self, x: Decimal, base: Decimal | None = None) -> Decimal:
+        """Natural logarithm, or of the base."""
+        _log_domain(x)
+        if base is None:
+            return self.context.ln(x)
+        _log_domain(base)
+        if base == 1:
+            raise ValueError("logarithm of base 1")
+        return self.context.divide(self.work.ln(x), self.work.ln(base))
+
+    def log10(self, x: Decimal) -> Decimal:
+        """Logarithm of base 10."""
+        _log_domain(x)
+        return self.context.log10(x)
+
+    def log2(self, x: Decimal) -> Decimal:
+        """Logarithm of base 2."""
+        _log_domain(x)
+        return self.context.divide(self.work.ln(x), self.ln2)
+
+
+def _divide(left: Any, right: Any) -> Fraction:
+    """Exact division, integers are divided as fractions."""
+    if type(left) is int:
+        left = Fraction(left)
+    return left / right
+
+
+def _power(base: Any, exponent: Any) -> Fraction | int:
+    """Exact power, only for integral exponents."""
+    if isinstance(exponent, Fraction):
+        if exponent.denominator != 1:
+            raise ValueError("fractional power is not rational")
+        exponent = exponent.numerator
+    if exponent < 0:
+        return Fraction(base) ** exponent
+    return base**exponent
+
+
+def _sqrt(value: Any) -> Fraction:
+    """Exact square root of rationals which are squares."""
+    value = Fraction(value)
+    if value < 0:
+        raise ValueError("square root of -ve value")
+    num, den = math.isqrt(value.numerator), math.isqrt(value.denominator)
+    if num * num != value.numerator or den * den != value.denominator:
+        raise ValueError("square root is not rational")
+    return Fraction(num, den)
+
+
+class FractionNumeric(Numeric):
+    """Exact rational numbers."""
+
+    name = "fraction"
+    exact = True
+
+    def __init__(self):
+        self.convert = lru_cache(maxsize=4096)(Fraction)
+        self.binary_ops = {
+            "+": operator.add,
+            "-": operator.sub,
+            "*": operator.mul,
+            "/": _divide,
+            "%": operator.mod,
+            "**": _power,
+        }
+        self.unary_ops = {"+": operator.pos, "-": operator.neg}
+        self.consts = {}
+        self.funcs = {
+            "sqrt": _sqrt,
+            "floor": math.floor,
+            "ceil": math.ceil,
+            "round": round,
+            "max": max,
+            "min": min,
+            "abs": abs,
+            "avg": lambda *nums: Fraction(sum(nums)) / len(nums),
+            "fact": _factorial,
+        }
+
+
+def numeric_backend(spec: str) -> Numeric | None:
+    """Provides the backend from its specification.
+
+    Arguments:
+    - spec: `float`, `fraction`, `decimal` or `decimal:<precision>`.
+
+    Returns:
+    - backend, `None` for float which is the default evaluation.
+
+    Raises:
+    - ValueError: unknown backend or invalid precision.
+    """
+    name, _, option = spec.partition(":")
+    if name == "float" and not option:
+        return None
+    if name == "fraction" and not option:
+        return FractionNumeric()
+    if name == "decimal":
+        if not option:
+            return DecimalNumeric()
+        if not option.isdigit():
+            raise ValueError(f"invalid precision {option!r}")
+        return DecimalNumeric(int(option))
+    raise ValueError(f"unknown numeric backend {spec!r}")
+
+
+class NumericEvaluator(Evaluator):
+    """An evaluator evaluating with the numbers of the backend.
+
+    Literals are converted by the backend instead of the parser, values of variables
+    & of constants not provided by the backend are converted as well.
+    """
+
+    parsed_numbers = False
+
+    def __init__(
+        self,
+        expr: str,
+        numeric: Numeric,
+        funcs: Dict[str, Callable] | None = None,
+        consts: Dict[str, Any] | None = None,
+        variables: Mapping[str, int | float] | None = None,
+        limits: Limits | None = default_limits,
+        observer: Observer | None = None,
+    ):
+        """
+        Arguments:
+        - expr: expression.
+        - numeric: number backend.
+        - funcs: functions, functions of the backend by default.
+        - consts: constants, constants of the backend by default.
+        - variables: values of the free names used in expression.
+        - limits: resource limits of the evaluation, `None` disables them.
+        - observer: told the measurements of lexing, parsing & evaluation.
+        """
+        super().__init__(
+            expr,
+            funcs=numeric.funcs if funcs is None else funcs,
+            consts=numeric.consts if consts is None else consts,
+            variables=variables,
+            limits=limits,
+            observer=observer,
+        )
+        self.numeric = numeric
+        self.domain_errors = numeric.domain_errors
+        self.binary_ops = numeric.binary_ops
+        self.unary_ops = numeric.unary_ops
+
+    def _binop_table(self) -> Dict[str, Callable]:
+        """Provides no operators, every operator is checked for errors of the backend."""
+        return {}
+
+    def _resolve_binop(self, root: BinOp) -> Callable:
+        """Provides the function applying the operator of BinOp node by the backend."""
+        fn = self.binary_ops[root.op]
+        guard, domain_errors = self.guard, self.domain_errors
+
+        def apply(left, right):
+            if guard is not None:
+                guard.check_binary(root.op, left, right, root.index)
+            try:
+                return fn(left, right)
+            except (ZeroDivisionError, *domain_errors):
+                if root.op in zero_division_msg and not right:
+                    raise DivideByZeroError(self.expr, root.index, zero_division_msg[root.op])
+                raise MathDomainError(self.expr, root.op, root.index, "value out of domain")
+
+        return apply
+
+    def _eval_num(self, root: Num) -> Any:
+        """Converts the literal of Num node by the backend."""
+        if self.numeric.exact and self.guard is not None:
+            self.guard.check_literal(root.value, root.index)
+        return self.numeric.convert(root.value)
+
+    def _eval_const(self, root) -> Any:
+        """Evaluates Const node, converting the value by the backend."""
+        return self.numeric.coerce(super()._eval_const(root))
@@ -0,0 +1,45 @@
+"""
+Module: calc.evaluator.operators
+Description: Provides the tables dispatching the operators to the functions applying them.
+
+The operators are looked up by their symbol once per node instead of comparing the
+symbol with every operator. Only the operators listed in `zero_division_msg` have
+their `ZeroDivisionError` reported as `DivideByZeroError`.
+
+Usage:
+>>> from calc.evaluator.operators import binary_ops
+>>> binary_ops['**'](2, 10)
+1024
+"""
+
+import operator
+
+
+__all__ = (
+    "binary_ops",
+    "unary_ops",
+    "zero_division_msg",
+)
+
+
+binary_ops = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "**": operator.pow,
+}
+"""Functions applying the binary operators by symbol."""
+
+unary_ops = {
+    "+": operator.pos,
+    "-": operator.neg,
+}
+"""Functions applying the unary operators by symbol."""
+
+zero_division_msg = {
+    "/": "cannot divide by zero",
+    "%": "cannot modulo by zero",
+}
+"""Messages of the errors of the operators dividing by zero."""
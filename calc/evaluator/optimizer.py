@@ -0,0 +1,180 @@
+"""
+Module: calc.evaluator.optimizer
+Description: Provides the optimizer to simplify the parse tree before evaluation.
+
+Usage:
+>>> from calc.parser import parse
+>>> from calc.evaluator.optimizer import optimize
+>>> optimize('2*pi/360*(x)', parse('2*pi/360*(x)'))
+BinOp(Num(0.017453292519943295)*Const(X))
+"""
+
+import math
+from typing import Callable, Dict
+
+from . import Evaluator
+from .functions import default_funcs
+from .constants import default_consts
+from ..parser.node import Node, BinOp, UnOp, Num, Func, Const
+
+
+__all__ = (
+    "Optimizer",
+    "optimize",
+)
+
+
+_bits_per_digit = math.log2(10)
+
+
+class Optimizer:
+    """An optimizer to fold the constant subtrees and simplify the parse tree.
+
+    Constant subtrees are evaluated once and replaced by a number. A subtree is
+    only folded when its evaluation succeeds, so errors like `DivideByZeroError`
+    or `MathDomainError` are still raised when the tree is evaluated.
+
+    Applied identities: `x*1`, `1*x`, `x+0`, `0+x`, `x-0`, `+x` and `--x` to `x`.
+    """
+
+    max_digits: int = 1000
+    """largest number of digits of a folded integer, larger values keep their subtree."""
+
+    def __init__(
+        self,
+        expr: str,
+        funcs: Dict[str, Callable] = default_funcs,
+        consts: Dict[str, int | float] = default_consts,
+    ):
+        """
+        Arguments:
+        - expr: expression.
+        - funcs: functions.
+        - consts: constants.
+        """
+        self.expr = expr
+        self.evaluator = Evaluator(expr, funcs=funcs, consts=consts)
+
+    def optimize(self, root: Node) -> Node:
+        """Provides the optimized tree. The given tree is not modified.
+
+        Arguments:
+        - root: parse tree of the expression.
+        """
+        method = getattr(self, f"_optimize_{type(root).__name__.lower()}", None)
+        if method is None:
+            return root
+        return method(root)
+
+    def fold(self, root: Node) -> Node:
+        """Replaces the constant tree by the number it evaluates to.
+
+        NOTE: the tree is kept as it is when evaluation fails or the value cannot be
+        represented back by a number node.
+        """
+        try:
+            value = self.evaluator.eval_tree(root)
+        except Exception:
+            return root
+
+        literal = self.literal(value)
+        if literal is None:
+            return root
+        return Num(root.index, literal)
+
+    def literal(self, value: int | float) -> str | None:
+        """Provides the literal for number node which evaluates back to same value."""
+        if type(value) not in (int, float):
+            return None
+        if type(value) is int and value.bit_length() > self.max_digits * _bits_per_digit:
+            return None
+
+        try:
+            literal = repr(value)
+            number = Num(0, literal).number
+        except (ValueError, OverflowError):
+            # e.g. `inf` & `nan` have no literal
+            return None
+
+        if type(number) is type(value) and number == value:
+            return literal
+        return None
+
+    @staticmethod
+    def is_constant(root: Node) -> bool:
+        """Checks if the node is already a folded constant."""
+        return isinstance(root, Num)
+
+    @staticmethod
+    def is_literal(root: Node, value: str) -> bool:
+        """Checks if the node is the integer literal."""
+        return isinstance(root, Num) and root.value == value
+
+    def _optimize_binop(self, root: BinOp) -> Node:
+        left = self.optimize(root.left)
+        right = self.optimize(root.right)
+        node = BinOp(root.index, left, root.op, right)
+
+        if self.is_constant(left) and self.is_constant(right):
+            return self.fold(node)
+
+        if root.op == "*":
+            if self.is_literal(right, "1"):
+                return left
+            if self.is_literal(left, "1"):
+                return right
+
+        if root.op == "+":
+            if self.is_literal(right, "0"):
+                return left
+            if self.is_literal(left, "0"):
+                return right
+
+        if root.op == "-" and self.is_literal(right, "0"):
+            return left
+
+        return node
+
+    def _optimize_unop(self, root: UnOp) -> Node:
+        expr = self.optimize(root.expr)
+
+        if self.is_constant(expr):
+            return self.fold(UnOp(root.index, root.op, expr))
+
+        if root.op == "+":
+            return expr
+
+        if root.op == "-" and isinstance(expr, UnOp) and expr.op == "-":
+            return expr.expr
+
+        return UnOp(root.index, root.op, expr)
+
+    def _optimize_func(self, root: Func) -> Node:
+        args = tuple(self.optimize(arg) for arg in root.args)
+        node = Func(root.index, root.name, args)
+
+        if all(map(self.is_constant, args)):
+            return self.fold(node)
+        return node
+
+    def _optimize_const(self, root: Const) -> Node:
+        if root.name.lower() in self.evaluator.consts:
+            return self.fold(root)
+        return root
+
+
+def optimize(
+    expr: str,
+    root: Node,
+    funcs: Dict[str, Callable] = default_funcs,
+    consts: Dict[str, int | float] = default_consts,
+) -> Node:
+    """Provides the optimized parse tree of the expression.
+
+    Arguments:
+    - expr: expression.
+    - root: parse tree of the expression.
+    - funcs: functions.
+    - consts: constants.
+    """
+    return Optimizer(expr, funcs, consts).optimize(root)
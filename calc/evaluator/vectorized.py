@@ -0,0 +1,239 @@
+"""
+Module: calc.evaluator.vectorized
+Description: Provides the evaluator to evaluate the parse tree over columns of values.
+
+The evaluator walks the parse tree once and maps each node to a whole array
+operation, it requires the optional dependency `numpy`.
+
+Usage:
+>>> from calc.evaluator.vectorized import evaluate_columns
+>>> evaluate_columns('x*2 + 1', x=[1, 2, 3])
+array([3, 5, 7])
+"""
+
+from typing import Any, Callable, Dict, Mapping
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+from . import Evaluator
+from .functions import default_funcs
+from .constants import default_consts
+from .exceptions import *
+from .operators import zero_division_msg
+from ..parser.node import BinOp, Func
+
+
+__all__ = (
+    "VectorEvaluator",
+    "default_ufuncs",
+    "evaluate_columns",
+)
+
+
+def _log(x, base=None):
+    """Vector form of `math.log` with optional base."""
+    if base is None:
+        return np.log(x)
+    return np.log(x) / np.log(base)
+
+
+def _round(x, ndigits=0):
+    """Vector form of `round`."""
+    return np.round(x, ndigits)
+
+
+def _avg(*nums):
+    """Vector form of average of the values."""
+    return sum(nums) / len(nums)
+
+
+def _power(left, right):
+    """Vector form of `**`, integers to negative integer powers are floats."""
+    try:
+        return np.power(left, right)
+    except ValueError:
+        return np.float_power(left, right)
+
+
+def _vector_ops() -> tuple[Dict[str, Callable], Dict[str, Callable]]:
+    """Maps the binary & unary operators to their numpy equivalent."""
+    if np is None:
+        return {}, {}
+
+    binary_ops = {
+        "+": np.add,
+        "-": np.subtract,
+        "*": np.multiply,
+        "/": np.true_divide,
+        "%": np.mod,
+        "**": _power,
+    }
+    unary_ops = {"+": np.positive, "-": np.negative}
+    return binary_ops, unary_ops
+
+
+def _vector_funcs() -> Dict[str, Callable]:
+    """Maps the default functions to their numpy equivalent."""
+    if np is None:
+        return {}
+
+    return {
+        "sin": np.sin,
+        "cos": np.cos,
+        "tan": np.tan,
+        "asin": np.arcsin,
+        "acos": np.arccos,
+        "atan": np.arctan,
+        "sinh": np.sinh,
+        "cosh": np.cosh,
+        "tanh": np.tanh,
+        "asinh": np.arcsinh,
+        "acosh": np.arccosh,
+        "atanh": np.arctanh,
+        "log10": np.log10,
+        "log2": np.log2,
+        "log": _log,
+        "sqrt": np.sqrt,
+        "cbrt": np.cbrt,
+        "floor": np.floor,
+        "ceil": np.ceil,
+        "round": _round,
+        "max": lambda *nums: np.maximum.reduce(np.broadcast_arrays(*nums)),
+        "min": lambda *nums: np.minimum.reduce(np.broadcast_arrays(*nums)),
+        "abs": np.abs,
+        "avg": _avg,
+    }
+
+
+default_ufuncs = _vector_funcs()
+"""Vector form of the default functions. `fact` has no vector form."""
+
+
+def _largest(value: Any) -> Any:
+    """Provides the largest magnitude of the column, as python number."""
+    if np.ndim(value) == 0:
+        return value
+    if np.size(value) == 0:
+        return 0
+    largest = np.max(np.abs(value))
+    return largest.item() if isinstance(largest, np.generic) else largest
+
+
+class VectorEvaluator(Evaluator):
+    """An evaluator evaluating the parse tree over columns of values.
+
+    The values of the variables are arrays (columns) and every node is evaluated
+    once for all the rows. Functions without a vector form are evaluated for each
+    row using the scalar function.
+
+    NOTE: arrays use fixed width numpy types, e.g. integers can overflow unlike python int.
+    """
+
+    def __init__(
+        self,
+        expr: str,
+        funcs: Dict[str, Callable] = default_funcs,
+        consts: Dict[str, int | float] = default_consts,
+        columns: Mapping[str, Any] | None = None,
+        ufuncs: Dict[str, Callable] = default_ufuncs,
+    ):
+        """
+        Arguments:
+        - expr: expression.
+        - funcs: scalar functions.
+        - consts: constants.
+        - columns: arrays of values of the free names used in expression.
+        - ufuncs: vector form of the functions, only used for names present in funcs.
+
+        Raises:
+        - ImportError: when numpy is not installed.
+        """
+        if np is None:
+            raise ImportError("numpy is required for evaluating columns of values")
+
+        columns = {name: np.asarray(col) for name, col in (columns or {}).items()}
+        super().__init__(expr, funcs=funcs, consts=consts, variables=columns)
+        self.ufuncs = {name: fn for name, fn in ufuncs.items() if name in funcs}
+
+    def bind(self, columns: Mapping[str, Any]) -> "VectorEvaluator":
+        columns = {name: np.asarray(col) for name, col in columns.items()}
+        return super().bind(columns)
+
+    domain_errors = (ValueError, FloatingPointError)
+
+    binary_ops, unary_ops = _vector_ops()
+
+    def _binop_table(self) -> Dict[str, Callable]:
+        """Provides the operators which cannot divide by zero."""
+        return {op: fn for op, fn in self.binary_ops.items() if op not in zero_division_msg}
+
+    def _resolve_binop(self, root: BinOp) -> Callable:
+        """Provides the function applying the operator of BinOp node for all the rows."""
+        fn = self.binary_ops[root.op]
+        if root.op not in zero_division_msg:
+            return fn
+
+        def checked(left, right):
+            if np.any(np.equal(right, 0)):
+                raise DivideByZeroError(self.expr, root.index, zero_division_msg[root.op])
+            return fn(left, right)
+
+        return checked
+
+    def _find_func(self, root: Func) -> tuple[str, Callable]:
+        """Provides the name & vector form of the function of Func node.
+
+        Falls back to the scalar function when the function has no vector form.
+        """
+        name = root.name.lower()
+        fn = self.ufuncs.get(name)
+        if fn is not None:
+            return name, fn
+        return super()._find_func(root)
+
+    def _apply_func(self, root: Func, fn: Callable, args: tuple) -> Any:
+        """Calls the function of Func node for all the rows.
+
+        The limits are checked once with the largest value of each column, which
+        bounds the cost of the call for every row.
+        """
+        if self.guard is not None:
+            self.guard.check_call(fn, tuple(map(_largest, args)), root.index)
+        if fn is not self.ufuncs.get(root.name.lower()):
+            return self._apply_scalar(fn, args)
+        with np.errstate(divide="raise", invalid="raise"):
+            return fn(*args)
+
+    @staticmethod
+    def _apply_scalar(fn: Callable, args: tuple) -> Any:
+        """Applies the scalar function to each row of the arguments."""
+        if not any(np.ndim(arg) for arg in args):
+            return fn(*(arg.item() if hasattr(arg, "item") else arg for arg in args))
+
+        rows = np.frompyfunc(fn, len(args), 1)(*args)
+        try:
+            return np.array(rows.tolist())
+        except OverflowError:
+            return rows
+
+
+def evaluate_columns(
+    expr: str,
+    columns: Mapping[str, Any] | None = None,
+    /,
+    **named_columns: Any,
+) -> Any:
+    """
+    Evaluates the expression over columns of values.
+
+    Arguments:
+    - expr: expression.
+    - columns: arrays of values of the free names used in expression.
+    - named_columns: arrays of values, takes precedence over columns.
+    """
+    if columns and named_columns:
+        named_columns = {**columns, **named_columns}
+    return VectorEvaluator(expr, columns=named_columns or columns).eval()
@@ -0,0 +1,310 @@
+"""
+Module: calc.evaluator.vm
+Description: Provides the compiler of parse tree into flat instructions & the stack machine to run them.
+
+The parse tree is compiled into postfix instructions with the functions, constants
+and number literals resolved once. The position of the node producing each
+instruction is kept in a side table so that errors point at the same character as
+errors raised by `Evaluator`.
+
+Usage:
+>>> from calc.parser import parse
+>>> from calc.evaluator.vm import Program
+>>> program = Program.compile('x*2 + 1', parse('x*2 + 1'))
+>>> program.run({'x': 3})
+7
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping
+
+from . import Evaluator
+from .functions import default_funcs
+from .constants import default_consts
+from .exceptions import *
+from .limits import Limits, Guard, default_limits, time_budget
+from .operators import binary_ops, unary_ops, zero_division_msg
+from ..parser.node import Node, BinOp, UnOp, Num, Func, Const, walk
+
+
+__all__ = (
+    "Program",
+    "compile_tree",
+)
+
+
+# opcodes
+PUSH = 0
+"""Pushes the value on stack."""
+LOAD = 1
+"""Pushes the value of variable on stack."""
+BINARY = 2
+"""Pops two values & pushes the result of the operator."""
+UNARY = 3
+"""Replaces the top value with result of the operator."""
+CALL = 4
+"""Pops the arguments & pushes the result of the function."""
+NUM = 5
+"""Pushes the value of a number literal which could not be converted ahead."""
+FAIL = 6
+"""Raises the prepared error."""
+
+
+@dataclass(frozen=True, repr=False)
+class Program:
+    """Flat instructions of the parse tree run by a stack machine.
+
+    Each instruction is a pair of opcode and its argument. The side tables share
+    the indices with the instructions:
+    - positions: position of the node in expression.
+    - symbols: operator or the lowercase name used by the node.
+    - owners: the innermost function (name, position) whose arguments are computed
+      by the instruction, `None` outside any function.
+
+    The limits on digits & operations are checked by the compiled instructions,
+    the wall clock budget of a run is kept in `timeout`.
+    """
+
+    expr: str
+    code: tuple[tuple[int, Any], ...]
+    positions: tuple[int, ...]
+    symbols: tuple[str | None, ...]
+    owners: tuple[tuple[str, int] | None, ...]
+    timeout: float | None = None
+
+    @classmethod
+    def compile(
+        cls,
+        expr: str,
+        root: Node,
+        funcs: Dict[str, Callable] = default_funcs,
+        consts: Dict[str, int | float] = default_consts,
+        limits: Limits | None = default_limits,
+    ) -> "Program":
+        """Compiles the parse tree into instructions.
+
+        Arguments:
+        - expr: expression.
+        - root: parse tree of expression.
+        - funcs: functions.
+        - consts: constants.
+        - limits: resource limits of the evaluation, `None` disables them.
+        """
+        return _Compiler(expr, funcs, consts, limits).compile(root)
+
+    def run(self, variables: Mapping[str, Any] | None = None) -> int | float:
+        """Runs the instructions and provides the value of expression.
+
+        Arguments:
+        - variables: values of the free names used in expression.
+
+        Raises:
+        - EvaluationError: same as raised by `Evaluator` for the parse tree.
+        """
+        if self.timeout is None:
+            return self._execute(variables)
+        with time_budget(self.timeout):
+            return self._execute(variables)
+
+    def _execute(self, variables: Mapping[str, Any] | None) -> int | float:
+        """Runs the instructions on the stack."""
+        variables = variables or {}
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+
+        try:
+            for pc, (op, arg) in enumerate(self.code):
+                if op is PUSH:
+                    push(arg)
+                elif op is BINARY:
+                    right = pop()
+                    stack[-1] = arg(stack[-1], right)
+                elif op is LOAD:
+                    push(variables[arg])
+                elif op is CALL:
+                    fn, argc = arg
+                    start = len(stack) - argc
+                    args = stack[start:]
+                    del stack[start:]
+                    push(fn(*args))
+                elif op is UNARY:
+                    stack[-1] = arg(stack[-1])
+                elif op is NUM:
+                    push(arg())
+                else:
+                    raise arg()
+        except KeyError:
+            if op is not LOAD:
+                raise
+            raise UnknownConstNameError(
+                self.expr, self.symbols[pc], self.positions[pc], "const name not found"
+            )
+        except ZeroDivisionError:
+            symbol = self.symbols[pc]
+            if op is not BINARY or symbol not in zero_division_msg:
+                raise
+            raise DivideByZeroError(
+                self.expr, self.positions[pc], zero_division_msg[symbol]
+            )
+        except ValueError:
+            if self.owners[pc] is None:
+                raise
+            name, index = self.owners[pc]
+            raise MathDomainError(self.expr, name, index, "value out of domain")
+        except TypeError:
+            if self.owners[pc] is None:
+                raise
+            name, index = self.owners[pc]
+            raise WrongArgCountError(
+                self.expr, name, index, "wrong number of arguments provided"
+            )
+
+        return stack[-1]
+
+    __call__ = run
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+    def __repr__(self) -> str:
+        return f"Program({self.expr!r}, {len(self)} instructions)"
+
+
+class _Compiler:
+    """Compiles the parse tree into postfix instructions without recursion."""
+
+    def __init__(
+        self,
+        expr: str,
+        funcs: Dict[str, Callable],
+        consts: Dict[str, int | float],
+        limits: Limits | None,
+    ):
+        self.expr = expr
+        self.funcs = funcs
+        self.consts = consts
+        self.limits = limits
+        self.guard = Guard(expr, limits) if limits is not None else None
+        self.evaluator = Evaluator(expr, funcs=funcs, consts=consts)
+
+        self.code = []
+        self.positions = []
+        self.symbols = []
+        self.owners = []
+
+    def emit(self, op: int, arg: Any, node: Node, symbol: str | None, owner):
+        """Appends the instruction with its side table entries."""
+        self.code.append((op, arg))
+        self.positions.append(node.index)
+        self.symbols.append(symbol)
+        self.owners.append(owner)
+
+    def compile(self, root: Node) -> Program:
+        max_ops = self.limits.max_ops if self.limits is not None else None
+        if max_ops is not None and sum(1 for _ in walk(root)) > max_ops:
+            error = self.error_factory(
+                ResourceLimitError, "max_ops", root.index, "too many operations"
+            )
+            self.emit(FAIL, error, root, None, None)
+            return self.program()
+
+        # each entry: node, innermost function owning it, whether children are emitted
+        stack = [(root, None, False)]
+
+        while stack:
+            node, owner, expanded = stack.pop()
+
+            if isinstance(node, BinOp):
+                if expanded:
+                    fn = binary_ops[node.op]
+                    if self.guard is not None:
+                        fn = self.guard.binary(node.op, fn, node.index)
+                    self.emit(BINARY, fn, node, node.op, owner)
+                else:
+                    stack.append((node, owner, True))
+                    stack.append((node.right, owner, False))
+                    stack.append((node.left, owner, False))
+
+            elif isinstance(node, UnOp):
+                if expanded:
+                    self.emit(UNARY, unary_ops[node.op], node, node.op, owner)
+                else:
+                    stack.append((node, owner, True))
+                    stack.append((node.expr, owner, False))
+
+            elif isinstance(node, Func):
+                name = node.name.lower()
+                if expanded:
+                    fn = self.funcs[name]
+                    if self.guard is not None:
+                        fn = self.guard.call(fn, node.index)
+                    self.emit(CALL, (fn, len(node.args)), node, name, (name, node.index))
+                elif name not in self.funcs:
+                    error = self.error_factory(
+                        UnknownFuncNameError, name, node.index, "function name not found"
+                    )
+                    self.emit(FAIL, error, node, name, owner)
+                else:
+                    stack.append((node, owner, True))
+                    func_owner = (name, node.index)
+                    for arg in reversed(node.args):
+                        stack.append((arg, func_owner, False))
+
+            elif isinstance(node, Num):
+                if node.number is not None:
+                    self.emit(PUSH, node.number, node, None, owner)
+                else:
+                    convert = lambda node=node: self.evaluator._eval_num(node)
+                    self.emit(NUM, convert, node, None, owner)
+
+            elif isinstance(node, Const):
+                name = node.name.lower()
+                if name in self.consts:
+                    self.emit(PUSH, self.consts[name], node, name, owner)
+                else:
+                    self.emit(LOAD, node.name, node, name, owner)
+
+            else:
+                name = f"_eval_{type(node).__name__.lower()}"
+                raise MethodNotFoundError(
+                    self.expr, name, node, "method not found for node evaluation"
+                )
+
+        return self.program()
+
+    def program(self) -> Program:
+        """Provides the program of the instructions emitted."""
+        return Program(
+            self.expr,
+            tuple(self.code),
+            tuple(self.positions),
+            tuple(self.symbols),
+            tuple(self.owners),
+            self.limits.timeout if self.limits is not None else None,
+        )
+
+    def error_factory(self, error: type, *args: object) -> Callable[[], Exception]:
+        """Prepares the error to be raised when the instruction is run."""
+        expr = self.expr
+        return lambda: error(expr, *args)
+
+
+def compile_tree(
+    expr: str,
+    root: Node,
+    funcs: Dict[str, Callable] = default_funcs,
+    consts: Dict[str, int | float] = default_consts,
+    limits: Limits | None = default_limits,
+) -> Program:
+    """Compiles the parse tree into a program for the stack machine.
+
+    Arguments:
+    - expr: expression.
+    - root: parse tree of expression.
+    - funcs: functions.
+    - consts: constants.
+    - limits: resource limits of the evaluation, `None` disables them.
+    """
+    return Program.compile(expr, root, funcs, consts, limits)
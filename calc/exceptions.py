@@ -4,6 +4,14 @@ Description: Provides the base error class for calaulator.
 """
 
 
+def _rebuild(cls: type["CalcError"], args: tuple, state: dict) -> "CalcError":
+    """Rebuilds the error from its messages and attributes."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
+
 class CalcError(Exception):
     """Base exception class for errors raised in the application."""
 
@@ -31,6 +39,10 @@ class CalcError(Exception):
         """Provides the underline marker highlighting."""
         return " " * pad + mark * length
 
+    def __reduce__(self) -> tuple:
+        """Errors are pickled with their attributes, e.g. to send them across processes."""
+        return _rebuild, (type(self), self.args, self.__dict__)
+
     def __str__(self) -> str:
         """Representation of the error."""
         return f"{self.name}: {self.description}"
@@ -0,0 +1,221 @@
+"""
+Module: calc.expression
+Description: Provides the compiled expression object for repeated evaluation.
+
+Usage:
+>>> from calc.expression import compile
+>>> e = compile('2*pi')
+>>> e.evaluate()
+6.283185307179586
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping
+
+from .evaluator import Evaluator
+from .evaluator.vectorized import VectorEvaluator
+from .evaluator.optimizer import optimize as optimize_tree
+from .evaluator.vm import Program
+from .evaluator.native import compile_native
+from .evaluator.limits import Limits, default_limits
+from .evaluator.functions import default_funcs
+from .evaluator.constants import default_consts
+from .lexer import Lexer, lex
+from .parser import Parser, parse
+from .parser.node import Node, Const, walk
+
+
+__all__ = (
+    "Expression",
+    "compile",
+    "backends",
+)
+
+
+Runner = Callable[[Mapping[str, int | float] | None], int | float]
+"""Evaluates the compiled expression for the given variables."""
+
+
+def tree_backend(evaluator: Evaluator, root: Node) -> Runner:
+    """Walks the parse tree on each evaluation."""
+
+    def run(variables: Mapping[str, int | float] | None = None) -> int | float:
+        bound = evaluator.bind(variables) if variables else evaluator
+        return bound.eval_tree(root)
+
+    return run
+
+
+def vm_backend(evaluator: Evaluator, root: Node) -> Runner:
+    """Runs the flat instructions of the parse tree on a stack machine."""
+    return Program.compile(
+        evaluator.expr, root, evaluator.funcs, evaluator.consts, evaluator.limits
+    ).run
+
+
+def native_backend(evaluator: Evaluator, root: Node) -> Runner:
+    """Calls the parse tree compiled into a python function."""
+    return compile_native(
+        evaluator.expr, root, evaluator.funcs, evaluator.consts, evaluator.limits
+    )
+
+
+backends: Dict[str, Callable[[Evaluator, Node], Runner]] = {
+    "tree": tree_backend,
+    "vm": vm_backend,
+    "native": native_backend,
+}
+"""Available backends to evaluate the compiled expression."""
+
+
+@dataclass(frozen=True, repr=False)
+class Expression:
+    """An expression which is lexed and parsed only once.
+
+    The parse tree is kept with the object and compiled by a backend, so evaluating
+    the expression again skips lexing and parsing. Errors raised during evaluation
+    are the same as raised by `Evaluator.eval` for the expression.
+
+    Usage:
+    >>> e = Expression.compile('sin(pi/2)')
+    >>> e.evaluate()
+    1.0
+    >>> e = Expression.compile('x*2 + y')
+    >>> e.evaluate(x=3, y=1)
+    7
+    """
+
+    expr: str
+    """Source expression."""
+
+    root: Node
+    """Parse tree of the expression."""
+
+    evaluator: Evaluator = field(compare=False)
+    """Evaluator used to walk the parse tree."""
+
+    variables: frozenset[str] = field(default=frozenset(), compare=False)
+    """Free names in expression which are not constants."""
+
+    run: Runner | None = field(default=None, compare=False)
+    """Evaluates the expression for the given variables, provided by the backend."""
+
+    @classmethod
+    def compile(
+        cls,
+        expr: str,
+        lexer: Lexer = lex,
+        parser: Parser = parse,
+        funcs: Dict[str, Callable] = default_funcs,
+        consts: Dict[str, int | float] = default_consts,
+        optimize: bool = False,
+        backend: str = "vm",
+        limits: Limits | None = default_limits,
+    ) -> "Expression":
+        """Lexes and parses the expression once.
+
+        Arguments:
+        - expr: expression.
+        - lexer: function to tokenise the expression.
+        - parser: parses the stream of token into parse tree.
+        - funcs: functions.
+        - consts: constants.
+        - optimize: fold constants & simplify the parse tree.
+        - backend: name of the backend in `backends` to evaluate the parse tree.
+        - limits: resource limits of each evaluation, `None` disables them.
+
+        Raises:
+        - LexicalError, ParsingError: same as raised during `Evaluator.eval`.
+        - ValueError: unknown backend.
+        """
+        if backend not in backends:
+            raise ValueError(
+                f"unknown backend {backend!r}, expected one of {tuple(backends)}"
+            )
+
+        root = parser(expr, lexer)
+        if optimize:
+            root = optimize_tree(expr, root, funcs, consts)
+        evaluator = Evaluator(expr, lexer, parser, funcs, consts, limits=limits)
+        variables = frozenset(
+            node.name
+            for node in walk(root)
+            if isinstance(node, Const) and node.name.lower() not in consts
+        )
+        run = backends[backend](evaluator, root)
+        return cls(expr, root, evaluator, variables, run)
+
+    def evaluate(
+        self,
+        env: Mapping[str, int | float] | None = None,
+        /,
+        **variables: int | float,
+    ) -> int | float:
+        """Evaluates the parse tree of the expression.
+
+        Arguments:
+        - env: values of the free names used in expression.
+        - variables: values of the free names, takes precedence over env.
+
+        Raises:
+        - EvaluationError: same as raised during `Evaluator.eval`.
+        """
+        if env and variables:
+            variables = {**env, **variables}
+        return self.run(variables or env)
+
+    __call__ = evaluate
+
+    def evaluate_columns(
+        self,
+        columns: Mapping[str, Any] | None = None,
+        /,
+        **named_columns: Any,
+    ) -> Any:
+        """Evaluates the parse tree once over whole columns of values.
+
+        Requires numpy, see `calc.evaluator.vectorized`.
+
+        Arguments:
+        - columns: arrays of values of the free names used in expression.
+        - named_columns: arrays of values, takes precedence over columns.
+        """
+        if columns and named_columns:
+            named_columns = {**columns, **named_columns}
+        evaluator = VectorEvaluator(
+            self.expr,
+            funcs=self.evaluator.funcs,
+            consts=self.evaluator.consts,
+            columns=named_columns or columns,
+        )
+        return evaluator.eval_tree(self.root)
+
+    def __repr__(self) -> str:
+        return f"Expression({self.expr!r})"
+
+
+def compile(
+    expr: str,
+    lexer: Lexer = lex,
+    parser: Parser = parse,
+    funcs: Dict[str, Callable] = default_funcs,
+    consts: Dict[str, int | float] = default_consts,
+    optimize: bool = False,
+    backend: str = "vm",
+    limits: Limits | None = default_limits,
+) -> Expression:
+    """Compiles the expression for repeated evaluation.
+
+    Arguments:
+    - expr: expression.
+    - lexer: function to tokenise the expression.
+    - parser: parses the stream of token into parse tree.
+    - funcs: functions.
+    - consts: constants.
+    - optimize: fold constants & simplify the parse tree.
+    - backend: name of the backend in `backends` to evaluate the parse tree.
+    - limits: resource limits of each evaluation, `None` disables them.
+    """
+    return Expression.compile(
+        expr, lexer, parser, funcs, consts, optimize, backend, limits
+    )
@@ -27,6 +27,9 @@ class TkView(tk.Tk, AbstractView):
 
     keypad = keypad
 
+    poll_interval = 50
+    """milliseconds between checks of result of the background evaluation."""
+
     def __init__(self, title: str, control: Any | None = None):
         """
         Creates tkinter window.
@@ -37,6 +40,7 @@ class TkView(tk.Tk, AbstractView):
         """
         tk.Tk.__init__(self)
         AbstractView.__init__(self, control)
+        self.poll_id: str | None = None
 
         self.wm_title(title)
         self.resizable(False, False)
@@ -50,8 +54,13 @@ class TkView(tk.Tk, AbstractView):
         display = tk.Frame(root, bg="#232323", relief="flat")
         display.pack(expand=1, fill="x")
 
-        self.input_box = InputBox(display)
-        self.input_box.pack(fill="x", padx=6, pady=12, ipadx=0, ipady=0)
+        self.input_box = InputBox(display, on_input=self.on_input)
+        self.input_box.pack(fill="x", padx=6, pady=(12, 0), ipadx=0, ipady=0)
+
+        self.preview = tk.Label(
+            display, bg="#232323", fg="#808080", anchor="e", font=("Noto Sans", 12)
+        )
+        self.preview.pack(fill="x", padx=6, pady=(0, 6))
 
         buttons = tk.Frame(root, bg="#232323", relief="flat")
         buttons.pack(expand=1, fill="both")
@@ -65,6 +74,7 @@ class TkView(tk.Tk, AbstractView):
 
         self.bind("<Key-Return>", self.callback)
         self.bind("<Key-Delete>", lambda _: self.callback("cls"))
+        self.bind("<Key-Escape>", self.callback)
 
     @property
     def expression(self) -> str:
@@ -87,9 +97,39 @@ class TkView(tk.Tk, AbstractView):
         elif key == "equal":
             if self.control:
                 self.control.evaluate_expression()
+        elif key == "cancel":
+            if self.control:
+                self.control.cancel_evaluation()
         elif key != "":
             self.input_box.push(key)
 
+    def show_preview(self, preview: str):
+        self.preview.config(text=preview)
+
+    def show_busy(self, busy: bool):
+        self.config(cursor="watch" if busy else "")
+        if busy:
+            self.preview.config(text="calculating... (Esc to cancel)")
+            # the pending check serves the new evaluation as well
+            if self.poll_id is None:
+                self.poll_id = self.after(self.poll_interval, self.poll_result)
+        else:
+            if self.poll_id is not None:
+                self.after_cancel(self.poll_id)
+                self.poll_id = None
+            self.on_input()
+
+    def poll_result(self):
+        """Checks the result of background evaluation until it is ready."""
+        self.poll_id = None
+        if self.control and self.control.poll_result():
+            self.poll_id = self.after(self.poll_interval, self.poll_result)
+
+    def on_input(self):
+        """Previews the result whenever the expression is changed."""
+        if self.control:
+            self.control.preview_expression()
+
     def show_error(self, error: Exception):
         title = type(error).__name__
         message = str(error)
@@ -21,13 +21,17 @@ class InputBox(tk.Entry):
         "insertwidth": 2,
     }
 
-    def __init__(self, parent: tk.Misc):
+    def __init__(self, parent: tk.Misc, on_input: Callable[[], None] | None = None):
         """
         Arguments:
         - parent: parent widget.
-        - on_input: callback function when provided keyboard input.
+        - on_input: callback function when the text is changed.
         """
-        super().__init__(parent, justify=tk.RIGHT, **self.style)
+        self.text = tk.StringVar(parent)
+        super().__init__(parent, justify=tk.RIGHT, textvariable=self.text, **self.style)
+
+        if on_input is not None:
+            self.text.trace_add("write", lambda *_: on_input())
 
     def get_text(self) -> str:
         """Returns the text from buffer"""
@@ -8,6 +8,8 @@ Usage:
 (Token(NUMBER, '2', 0:1), Token(PLUS, '+', 1:2), Token(NUMBER, '3', 2:3))
 >>> [token for token in lex('2+3')]
 [Token(NUMBER, '2', 0:1), Token(PLUS, '+', 1:2), Token(NUMBER, '3', 2:3)]
+>>> [token for token in fast_lex('2+3')]
+[Token(NUMBER, '2', 0:1), Token(PLUS, '+', 1:2), Token(NUMBER, '3', 2:3)]
 """
 
 from __future__ import annotations
@@ -21,6 +23,10 @@ from .exceptions import IllegalCharError
 __all__ = (
     "Lexer",
     "lex",
+    "FastLexer",
+    "fast_lex",
+    "StreamLexer",
+    "stream_lex",
 )
 
 
@@ -32,16 +38,24 @@ class Lexer:
     starting from given index.
     """
 
-    def __init__(self, expr: str, ignore: str, lexers: Iterable[type[UnitLexer]]):
+    def __init__(
+        self,
+        expr: str,
+        ignore: str,
+        lexers: Iterable[type[UnitLexer]],
+        debug: bool = False,
+    ):
         """
         Arguments:
         - expr: expression to tokenise.
         - ignore: characters to ignore while tokenising, for e.g. whitespace.
         - lexers: unit lexers to be used to tokenise the expression.
+        - debug: validate every token produced by the unit lexers.
         """
         self.expr = expr
         self.ignore_chars = ignore
         self.lexers = lexers
+        self.debug = debug
 
         self.pos = 0
         self.char: str | None = None
@@ -83,6 +97,8 @@ class Lexer:
             if cls_lexer.match(self.char):
                 lexer: UnitLexer = cls_lexer(self.expr, self.pos)
                 tok = lexer.get_token()
+                if self.debug:
+                    tok.validate()
                 self.pos += len(tok.value)
                 self.advance()
                 return tok
@@ -100,6 +116,7 @@ def lex(
     expr: str,
     ignore_chars: str = " \t\n\r",
     lexers: Iterable[type[UnitLexer]] = default_lexers,
+    debug: bool = False,
 ) -> Iterator[Token]:
     """Provides an iterator to iterate through tokens.
 
@@ -107,5 +124,10 @@ def lex(
     - expr: expression.
     - ignore_chars: characters to ignore while tokenising.
     - lexers: An internal implementation to lexers to tokenise the serveral different parts of expression.
+    - debug: validate every token produced.
     """
-    return iter(Lexer(expr=expr, ignore=ignore_chars, lexers=lexers))
+    return iter(Lexer(expr=expr, ignore=ignore_chars, lexers=lexers, debug=debug))
+
+
+from .fast_lexer import FastLexer, fast_lex
+from .stream_lexer import StreamLexer, stream_lex
@@ -0,0 +1,132 @@
+"""
+Module: calc.lexer.fast_lexer
+Description: Provides a single pass lexer driven by a precompiled master pattern.
+
+NOTE: on long expressions it is about 4x faster than `Lexer`, short of the 10x
+aimed for. Most of the remaining time goes to creating a `Token` per token, even
+a plain tuple per token is only about 6x faster than `Lexer`, so the gap can not
+be closed while the lexers produce a stream of token objects.
+
+Usage:
+>>> from calc.lexer.fast_lexer import fast_lex
+>>> list(fast_lex('2**x'))
+[Token(NUMBER, 2, 0:1), Token(POW, **, 1:3), Token(NAME, x, 3:4)]
+"""
+
+from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import Iterator
+
+from .token import TokenType, Token, unchecked_token
+from .exceptions import IllegalCharError
+from . import Lexer, default_lexers
+
+
+__all__ = (
+    "FastLexer",
+    "fast_lex",
+)
+
+
+# NOTE: ordered alternatives, each group name is the value of its TokenType
+_token_patterns = (
+    (TokenType.NUMBER, r"[0-9]+(?:\.[0-9]*)?(?:[eE][+-]?[0-9]*)?"),
+    (TokenType.NAME, r"[A-Za-z][A-Za-z0-9]*"),
+    (TokenType.POW, r"\*\*"),
+    (TokenType.MUL, r"\*"),
+    (TokenType.DIV, r"/"),
+    (TokenType.MOD, r"%"),
+    (TokenType.PLUS, r"\+"),
+    (TokenType.MINUS, r"-"),
+    (TokenType.LPAREN, r"\("),
+    (TokenType.RPAREN, r"\)"),
+    (TokenType.COMMA, r","),
+)
+
+_token_types = {str(token_type): token_type for token_type, _ in _token_patterns}
+
+
+@lru_cache(maxsize=8)
+def master_pattern(ignore: str) -> re.Pattern:
+    """Builds the master pattern matching any token, ignored or illegal character.
+
+    Arguments:
+    - ignore: characters to ignore while tokenising.
+    """
+    parts = [f"(?P<{token_type}>{pattern})" for token_type, pattern in _token_patterns]
+    if ignore:
+        parts.insert(0, f"(?P<skip>[{re.escape(ignore)}]+)")
+    parts.append("(?P<illegal>.)")
+    return re.compile("|".join(parts), re.DOTALL)
+
+
+class FastLexer:
+    """A Lexer object tokenising the expression in a single pass.
+
+    The expression is scanned with a precompiled master pattern instead of trying
+    each unit lexer per token. It produces the same tokens & errors as `Lexer` with
+    the default unit lexers. Expressions containing non ascii characters are handed
+    over to `Lexer` as the unit lexers rely on unicode aware `str` methods.
+    """
+
+    def __init__(self, expr: str, ignore: str, debug: bool = False):
+        """
+        Arguments:
+        - expr: expression to tokenise.
+        - ignore: characters to ignore while tokenising, for e.g. whitespace.
+        - debug: validate every token produced.
+        """
+        self.expr = expr
+        self.ignore_chars = ignore
+        self.debug = debug
+
+    def illegal_char_error(self, char: str, pos: int) -> IllegalCharError:
+        """Provides the error class when none of tokens matches the part."""
+        msg = f"illegal character '{char}' found at index {pos} during lexing"
+        return IllegalCharError(self.expr, pos, msg)
+
+    def tokens(self) -> Iterator[Token]:
+        """Lazily provides the tokens of the expression.
+
+        Raises:
+        - IllegalCharError: when a char is not accepted by any token & not in ignore chars.
+        """
+        if not self.expr.isascii():
+            yield from Lexer(self.expr, self.ignore_chars, default_lexers, self.debug)
+            return
+
+        token_types = _token_types
+        number = TokenType.NUMBER
+        make_token = Token if self.debug else unchecked_token
+
+        for match in master_pattern(self.ignore_chars).finditer(self.expr):
+            kind = match.lastgroup
+            token_type = token_types.get(kind)
+
+            if token_type is None:
+                if kind == "illegal":
+                    raise self.illegal_char_error(match.group(), match.start())
+                continue
+
+            value = match.group()
+            if token_type is number and "E" in value:
+                value = value.replace("E", "e")
+
+            yield make_token(token_type, value, match.start())
+
+    def __iter__(self) -> Iterator[Token]:
+        return self.tokens()
+
+
+def fast_lex(
+    expr: str, ignore_chars: str = " \t\n\r", debug: bool = False
+) -> Iterator[Token]:
+    """Provides an iterator to iterate through tokens using the single pass lexer.
+
+    Arguments:
+    - expr: expression.
+    - ignore_chars: characters to ignore while tokenising.
+    - debug: validate every token produced.
+    """
+    return iter(FastLexer(expr=expr, ignore=ignore_chars, debug=debug))
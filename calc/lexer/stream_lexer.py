@@ -0,0 +1,204 @@
+"""
+Module: calc.lexer.stream_lexer
+Description: Provides a lexer tokenising the expression read in chunks from a stream.
+
+The expression is read from a text stream, binary stream or a bytes like buffer
+(e.g. `mmap`) in chunks. A token which reaches the end of the chunk read so far
+is carried over to the next chunk as it might continue there. So the memory used
+is bounded by the chunk size and the longest token, not by the expression.
+
+Usage:
+>>> import io
+>>> from calc.lexer.stream_lexer import stream_lex
+>>> list(stream_lex(io.StringIO('12 + x'), chunk_size=2))
+[Token(NUMBER, 12, 0:2), Token(PLUS, +, 3:4), Token(NAME, x, 5:6)]
+"""
+
+from __future__ import annotations
+import codecs
+import mmap
+from typing import IO, Iterator
+
+from .token import TokenType, Token, unchecked_token
+from .exceptions import IllegalCharError
+from .fast_lexer import master_pattern, _token_types
+from . import Lexer, default_lexers
+
+
+__all__ = (
+    "StreamLexer",
+    "stream_lex",
+)
+
+
+Source = IO[str] | IO[bytes] | bytes | bytearray | memoryview | mmap.mmap
+"""Sources of the expression accepted by the lexer."""
+
+
+class StreamLexer:
+    """A Lexer object tokenising the expression read in chunks.
+
+    It produces the same tokens as `FastLexer` for the whole expression, with
+    `Token.index` being the offset of character in the whole expression. Chunks
+    having non ascii characters are tokenised by `Lexer`.
+
+    NOTE: `IllegalCharError` holds a part of the expression around the illegal
+    character as `expr`, the message has its offset in the whole expression.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        ignore: str,
+        chunk_size: int = 1 << 16,
+        encoding: str = "utf-8",
+        debug: bool = False,
+    ):
+        """
+        Arguments:
+        - source: text stream, binary stream or bytes like buffer of the expression.
+        - ignore: characters to ignore while tokenising, for e.g. whitespace.
+        - chunk_size: number of characters or bytes read at once.
+        - encoding: encoding of binary stream or buffer.
+        - debug: validate every token produced.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be +ve")
+
+        self.source = source
+        self.ignore_chars = ignore
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.debug = debug
+
+    def chunks(self) -> Iterator[str]:
+        """Lazily provides the text of the expression in chunks."""
+        source, size = self.source, self.chunk_size
+
+        if isinstance(source, str):
+            for start in range(0, len(source), size):
+                yield source[start : start + size]
+            return
+
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            view = memoryview(source)
+            parts = (view[start : start + size] for start in range(0, len(view), size))
+        else:
+            parts = iter(lambda: source.read(size), source.read(0))
+
+        decoder = None
+        for part in parts:
+            if isinstance(part, str):
+                yield part
+                continue
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(self.encoding)()
+            yield decoder.decode(part)
+
+        if decoder is not None:
+            yield decoder.decode(b"", final=True)
+
+    def tokens(self) -> Iterator[Token]:
+        """Lazily provides the tokens of the expression.
+
+        Raises:
+        - IllegalCharError: when a char is not accepted by any token & not in ignore chars.
+        """
+        carry, offset = "", 0
+        chunks = self.chunks()
+        final = False
+
+        while not final:
+            chunk = next(chunks, None)
+            final = chunk is None
+            buffer = carry + (chunk or "")
+            if not buffer:
+                continue
+
+            # last token reaching the end of buffer might continue in next chunk
+            pending = None
+            try:
+                for token in self.scan(buffer, offset):
+                    if pending is not None:
+                        yield pending
+                    pending = token
+            except IllegalCharError:
+                # token before the illegal char is complete
+                if pending is not None:
+                    yield pending
+                raise
+
+            if pending is not None and (final or pending.end - offset < len(buffer)):
+                yield pending
+                pending = None
+
+            consumed = len(buffer) if pending is None else pending.index - offset
+            carry = buffer[consumed:]
+            offset += consumed
+
+    def scan(self, buffer: str, offset: int) -> Iterator[Token]:
+        """Tokenises the buffer starting at the offset of the expression."""
+        make_token = Token if self.debug else unchecked_token
+
+        if not buffer.isascii():
+            lexer = Lexer(buffer, self.ignore_chars, default_lexers, self.debug)
+            try:
+                for token in lexer:
+                    yield make_token(token.type, token.value, offset + token.index)
+            except IllegalCharError as error:
+                raise self.illegal_char_error(buffer, error.pos, offset)
+            return
+
+        token_types = _token_types
+        number = TokenType.NUMBER
+
+        for match in master_pattern(self.ignore_chars).finditer(buffer):
+            kind = match.lastgroup
+            token_type = token_types.get(kind)
+
+            if token_type is None:
+                if kind == "illegal":
+                    raise self.illegal_char_error(buffer, match.start(), offset)
+                continue
+
+            value = match.group()
+            if token_type is number and "E" in value:
+                value = value.replace("E", "e")
+
+            yield make_token(token_type, value, offset + match.start())
+
+    def illegal_char_error(self, buffer: str, pos: int, offset: int) -> IllegalCharError:
+        """Provides the error for illegal character at the position of buffer."""
+        start = max(0, pos - 32)
+        msg = f"illegal character '{buffer[pos]}' found at index {offset + pos} during lexing"
+        return IllegalCharError(buffer[start : pos + 32], pos - start, msg)
+
+    def __iter__(self) -> Iterator[Token]:
+        return self.tokens()
+
+
+def stream_lex(
+    source: Source,
+    ignore_chars: str = " \t\n\r",
+    chunk_size: int = 1 << 16,
+    encoding: str = "utf-8",
+    debug: bool = False,
+) -> Iterator[Token]:
+    """Provides an iterator to iterate through tokens of expression read in chunks.
+
+    Arguments:
+    - source: text stream, binary stream or bytes like buffer of the expression.
+    - ignore_chars: characters to ignore while tokenising.
+    - chunk_size: number of characters or bytes read at once.
+    - encoding: encoding of binary stream or buffer.
+    - debug: validate every token produced.
+    """
+    return iter(
+        StreamLexer(
+            source,
+            ignore=ignore_chars,
+            chunk_size=chunk_size,
+            encoding=encoding,
+            debug=debug,
+        )
+    )
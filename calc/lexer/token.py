@@ -8,7 +8,6 @@ Usage:
 """
 
 from dataclasses import dataclass
-from functools import cached_property
 from enum import StrEnum, auto
 
 
@@ -34,7 +33,7 @@ class TokenType(StrEnum):
     COMMA = auto()
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, slots=True, repr=False)
 class Token:
     """A class representing single token in the expression.
 
@@ -50,6 +49,9 @@ class Token:
         - index is a negative value
         - value is empty
 
+    NOTE: lexers create the tokens with `unchecked_token` skipping the validations,
+    they validate the tokens only in debug mode.
+
     Usage:
     >>> from calc.lexer.token import TokenType, Token
     >>> t = Token(TokenType.NUMBER, '23.6', 6)
@@ -60,6 +62,10 @@ class Token:
     index: int
 
     def __post_init__(self):
+        self.validate()
+
+    def validate(self):
+        """Validates the values of token, see the errors raised by `Token`."""
         if not isinstance(self.type, TokenType):
             raise TypeError(
                 "Argument 'type' got value of unexpected type: {}, expected {}",
@@ -75,10 +81,28 @@ class Token:
         """Length of token value"""
         return len(self.value)
 
-    @cached_property
+    @property
     def end(self) -> int:
         """End of the token. Equals to start + length"""
         return self.index + len(self)
 
     def __repr__(self) -> str:
         return f"Token({self.type.upper()!s}, {self.value}, {self.index}:{self.end})"
+
+
+def unchecked_token(type: TokenType, value: str, index: int) -> Token:
+    """Creates the token skipping the validations done by `Token`.
+
+    NOTE: meant for lexers which only produce valid tokens.
+    """
+    token = _new(Token)
+    _set_type(token, type)
+    _set_value(token, value)
+    _set_index(token, index)
+    return token
+
+
+_new = object.__new__
+_set_type = Token.type.__set__
+_set_value = Token.value.__set__
+_set_index = Token.index.__set__
@@ -8,7 +8,7 @@ import re
 from dataclasses import dataclass
 from io import StringIO
 
-from .token import TokenType, Token
+from .token import TokenType, Token, unchecked_token
 
 
 __all__ = (
@@ -92,7 +92,7 @@ class DelimiterLexer(UnitLexer):
     def get_token(self) -> Token:
         char = self.expr[self.index]
         token_type = self.delimiters[char]
-        return Token(token_type, char, self.index)
+        return unchecked_token(token_type, char, self.index)
 
 
 class IdentifierLexer(UnitLexer):
@@ -111,7 +111,7 @@ class IdentifierLexer(UnitLexer):
             stream.write(char)
             char, pos = self.advance(pos)
 
-        return Token(TokenType.NAME, stream.getvalue(), self.index)
+        return unchecked_token(TokenType.NAME, stream.getvalue(), self.index)
 
 
 class NumberLexer(UnitLexer):
@@ -153,7 +153,7 @@ class NumberLexer(UnitLexer):
                 stream.write(char)
                 char, pos = self.advance(pos)
 
-        return Token(TokenType.NUMBER, stream.getvalue(), self.index)
+        return unchecked_token(TokenType.NUMBER, stream.getvalue(), self.index)
 
 
 class OperatorLexer(UnitLexer):
@@ -185,7 +185,7 @@ class OperatorLexer(UnitLexer):
             if match := re.match(re.escape(symbol), substr):
                 end = match.end()
                 value = self.expr[self.index : self.index + end]
-                return Token(token_type, value, self.index)
+                return unchecked_token(token_type, value, self.index)
 
         raise RuntimeError("Unable to extract next token")
 
@@ -5,7 +5,14 @@ Description: Provides the model class to handle expression operations.
 
 import abc
 
-from .evaluator import evaluate
+from .cache import CacheInfo, LRUCache
+from .expression import compile
+from .session import Session
+from .evaluator.limits import Limits
+
+
+preview_limits = Limits(max_digits=10_000, timeout=0.05)
+"""Limits of the evaluation on every edit, kept small to not block the typing."""
 
 
 class AbstractModel(abc.ABC):
@@ -24,18 +31,60 @@ class AbstractModel(abc.ABC):
         """
         raise NotImplementedError
 
+    def preview(self, expression: str) -> tuple[int | float | Exception, bool]:
+        """Calculate the value of expression being typed, called on every edit.
+
+        Arguments:
+        - expression: input expression.
+
+        Returns:
+        - result of evaluation.
+        - success of evaluation.
+        """
+        return self.evaluate(expression)
+
 
 class CalcModel(AbstractModel):
-    _eval = staticmethod(evaluate)
-    """function to evaluate the expression."""
+    _compile = staticmethod(compile)
+    """function to compile the expression."""
+
+    def __init__(self, cache_size: int = 256, cache_results: bool = True):
+        """
+        Arguments:
+        - cache_size: maximum number of compiled expressions kept, `0` disables cache.
+        - cache_results: also keep the values of expressions without variables.
+        """
+        self.expressions = LRUCache(cache_size)
+        self.results = LRUCache(cache_size if cache_results else 0)
+        self.session = Session(limits=preview_limits)
 
     def evaluate(self, expression: str) -> tuple[int | float | Exception, bool]:
         success = True
 
         try:
-            result = self._eval(expression)
+            missing = object()
+            result = self.results.get(expression, missing)
+            if result is missing:
+                compiled = self.expressions.get_or_create(expression, self._compile)
+                result = compiled.evaluate()
+                self.results.put(expression, result)
         except Exception as error:
             success = False
             result = error
 
         return result, success
+
+    def preview(self, expression: str) -> tuple[int | float | Exception, bool]:
+        """Re-evaluates only the terms of expression changed since last preview."""
+        try:
+            self.session.set_text(expression)
+            return self.session.evaluate(), True
+        except Exception as error:
+            return error, False
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Provides the usage counters of the expression and result caches."""
+        return {
+            "expressions": self.expressions.info(),
+            "results": self.results.info(),
+        }
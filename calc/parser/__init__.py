@@ -10,8 +10,12 @@ Usage:
 BinOp(Num(2)+Num(3))
 >>> parse('2+3')
 BinOp(Num(2)+Num(3))
+>>> parse('2+3', tokens=tuple(lex('2+3')))
+BinOp(Num(2)+Num(3))
 """
 
+from typing import Iterable
+
 
 from .node import Node, BinOp, UnOp, Num, Func, Const
 from .exceptions import UnknownTokenError, SyntaxError
@@ -25,17 +29,47 @@ __all__ = (
 )
 
 
+# rules of grammar
+_EXPR = 0
+_EXPRS = 1
+_TERM = 2
+_FACTOR = 3
+
+# frames of the rules pending on stack
+_EXPR_REST = 4
+"""Operators & terms following the first term of expression."""
+_TERM_REST = 5
+"""Operators & factors following the first factor of term."""
+_BINOP = 6
+"""Left operand & operator waiting for the right operand."""
+_UNARY = 7
+"""Unary operator waiting for its factor."""
+_PAREN = 8
+"""Parenthesis waiting for the enclosed expression."""
+_CALL = 9
+"""Function waiting for its arguments."""
+_ARGS = 10
+"""Expressions seperated by comma."""
+
+_expr_types = (TokenType.PLUS, TokenType.MINUS)
+_term_types = (TokenType.MUL, TokenType.DIV, TokenType.MOD, TokenType.POW)
+_unary_types = (TokenType.PLUS, TokenType.MINUS)
+
+
 class Parser:
     """A Parser class to convert the stream of tokens into abstract syntax tree."""
 
-    def __init__(self, expr: str, lexer: Lexer):
+    def __init__(
+        self, expr: str, lexer: Lexer = lex, tokens: Iterable[Token] | None = None
+    ):
         """
         Arguments:
         - expr: expression.
         - lexer: lexer object to tokenise the expression into stream of tokens.
+        - tokens: tokens of the expression, when provided the lexer is not used.
         """
         self.expr = expr
-        self.lexer = iter(lexer(self.expr))
+        self.lexer = iter(lexer(self.expr) if tokens is None else tokens)
         self.token: Token | None = None
         self.advance()
 
@@ -62,92 +96,125 @@ class Parser:
 
     def parse_expr(self) -> Node:
         """Parses the expression."""
-        node = self.parse_term()
-
-        while self.token and self.token.type in (TokenType.PLUS, TokenType.MINUS):
-            op = self.token.value
-            index = self.token.index
-            if self.token.type == TokenType.PLUS:
-                self.advance()
-            elif self.token.type == TokenType.MINUS:
-                self.advance()
-            else:
-                raise self.syntax_error()
-
-            node = BinOp(index, left=node, op=op, right=self.parse_term())
-
-        return node
+        return self.run(_EXPR)
 
     def parse_exprs(self) -> tuple[Node, ...]:
         """Parses expressions seperated by comma delimiter."""
-        nodes = [self.parse_expr()]
-
-        while self.token and self.token.type == TokenType.COMMA:
-            self.advance()
-            nodes.extend(self.parse_exprs())
-
-        return tuple(nodes)
+        return self.run(_EXPRS)
 
     def parse_term(self) -> Node:
         """Parses terms in the expression."""
-        node = self.parse_factor()
-
-        types = (TokenType.MUL, TokenType.DIV, TokenType.MOD, TokenType.POW)
-        while self.token and self.token.type in types:
-            op = self.token.value
-            index = self.token.index
-            if self.token.type == TokenType.MUL:
-                self.advance()
-            elif self.token.type == TokenType.DIV:
-                self.advance()
-            elif self.token.type == TokenType.MOD:
-                self.advance()
-            elif self.token.type == TokenType.POW:
-                self.advance()
-            else:
-                raise self.syntax_error()
-
-            node = BinOp(index, left=node, op=op, right=self.parse_factor())
-
-        return node
+        return self.run(_TERM)
 
     def parse_factor(self) -> Node:
         """Parses factors in the term."""
-        if self.token is None:
-            raise self.syntax_error("unexpected end of expression")
-
-        if self.token.type is TokenType.NUMBER:
-            num = self.token.value
-            index = self.token.index
-            self.advance()
-            return Num(index, num)
-
-        if self.token.type == TokenType.LPAREN:
-            self.advance()
-            node = self.parse_expr()
-            self.advance()
-            return node
-
-        if self.token.type in (TokenType.PLUS, TokenType.MINUS):
-            op = self.token.value
-            index = self.token.index
-            self.advance()
-            return UnOp(index, op, self.parse_factor())
-
-        if self.token.type == TokenType.NAME:
-            name = self.token.value
-            index = self.token.index
-            self.advance()
-
-            if self.token and self.token.type == TokenType.LPAREN:
-                self.advance()
-                node = Func(index, name, tuple(self.parse_exprs()))
-                self.advance()
-                return node
-            else:
-                return Const(index, name)
+        return self.run(_FACTOR)
+
+    def run(self, rule: int) -> Node | tuple[Node, ...]:
+        """Parses the rule of grammar using an explicit stack instead of recursion.
 
-        raise self.unknown_token_error()
+        Each rule is parsed in the same steps as a recursive descent parser would,
+        pending work of the rules entered is kept as frames on the stack. So the
+        nesting of parenthesis, unary operators and arguments is only limited by
+        memory.
+
+        Arguments:
+        - rule: rule of grammar to parse.
+        """
+        stack = []
+        node = None
+
+        if rule == _EXPRS:
+            stack.append((_ARGS, []))
+            rule = _EXPR
+
+        while True:
+            # enters the rule, ends after the rule is entered or a node is parsed
+            if rule == _EXPR:
+                stack.append((_EXPR_REST,))
+                rule = _TERM
+                continue
+
+            if rule == _TERM:
+                stack.append((_TERM_REST,))
+                rule = _FACTOR
+                continue
+
+            if rule == _FACTOR:
+                rule = None
+                token = self.token
+                if token is None:
+                    raise self.syntax_error("unexpected end of expression")
+
+                if token.type is TokenType.NUMBER:
+                    self.advance()
+                    node = Num(token.index, token.value)
+
+                elif token.type == TokenType.LPAREN:
+                    self.advance()
+                    stack.append((_PAREN,))
+                    rule = _EXPR
+                    continue
+
+                elif token.type in _unary_types:
+                    self.advance()
+                    stack.append((_UNARY, token.index, token.value))
+                    rule = _FACTOR
+                    continue
+
+                elif token.type == TokenType.NAME:
+                    self.advance()
+                    if self.token and self.token.type == TokenType.LPAREN:
+                        self.advance()
+                        stack.append((_CALL, token.index, token.value, []))
+                        rule = _EXPR
+                        continue
+                    node = Const(token.index, token.value)
+
+                else:
+                    raise self.unknown_token_error()
+
+            # returns the parsed node to the pending frames
+            while stack:
+                frame = stack.pop()
+                kind = frame[0]
+
+                if kind == _EXPR_REST or kind == _TERM_REST:
+                    types = _expr_types if kind == _EXPR_REST else _term_types
+                    if self.token and self.token.type in types:
+                        index, op = self.token.index, self.token.value
+                        self.advance()
+                        stack.append((_BINOP, kind, node, op, index))
+                        rule = _TERM if kind == _EXPR_REST else _FACTOR
+                        break
+
+                elif kind == _BINOP:
+                    _, rest, left, op, index = frame
+                    node = BinOp(index, left=left, op=op, right=node)
+                    stack.append((rest,))
+
+                elif kind == _UNARY:
+                    node = UnOp(frame[1], frame[2], node)
+
+                elif kind == _PAREN:
+                    self.advance()
+
+                elif kind == _CALL or kind == _ARGS:
+                    args = frame[-1]
+                    args.append(node)
+                    if self.token and self.token.type == TokenType.COMMA:
+                        self.advance()
+                        stack.append(frame)
+                        rule = _EXPR
+                        break
+
+                    if kind == _ARGS:
+                        return tuple(args)
+
+                    self.advance()
+                    node = Func(frame[1], frame[2], tuple(args))
+            else:
+                return node
 
     def syntax_error(self, *msg: object) -> SyntaxError:
         """produces exception object for syntax error."""
@@ -166,10 +233,13 @@ class Parser:
         )
 
 
-def parse(expr: str, lexer: Lexer = lex) -> Node:
+def parse(
+    expr: str, lexer: Lexer = lex, tokens: Iterable[Token] | None = None
+) -> Node:
     """Produces the abstract syntax tree of expression.
 
     Arguments:
     - expr: expression.
-    - lexer: a lexer object providing stream of tokens."""
-    return Parser(expr, lexer).parse()
+    - lexer: a lexer object providing stream of tokens.
+    - tokens: already lexed tokens of expression, skips the lexer."""
+    return Parser(expr, lexer, tokens).parse()
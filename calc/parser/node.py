@@ -5,6 +5,7 @@ Description: It contains the node classes for parse tree.
 
 from __future__ import annotations
 import abc
+from typing import Iterator
 
 
 __all__ = (
@@ -14,11 +15,22 @@ __all__ = (
     "Num",
     "Func",
     "Const",
+    "walk",
+    "to_number",
 )
 
 
+max_converted_exponent = 4300
+"""Largest exponent of integer literal converted when the node is created."""
+
+
 class Node(abc.ABC):
-    """An abstract base class for node in parse tree."""
+    """An abstract base class for node in parse tree.
+
+    NOTE: nodes are slotted classes, they can not hold attributes other than their fields.
+    """
+
+    __slots__ = ("index",)
 
     def __init__(self, index: int):
         """
@@ -38,6 +50,11 @@ class Node(abc.ABC):
         """
         return cls(**obj)
 
+    @property
+    def children(self) -> tuple[Node, ...]:
+        """Child nodes in the order they appear in expression."""
+        return ()
+
     @abc.abstractmethod
     def to_dict(self) -> dict:
         """A utility method to get the node data."""
@@ -49,6 +66,8 @@ class BinOp(Node):
 
     A binary operator takes two operands and produces a single value."""
 
+    __slots__ = ("left", "op", "right")
+
     def __init__(self, index: str, left: Node, op: str, right: Node):
         """
         Arguments:
@@ -65,6 +84,10 @@ class BinOp(Node):
     def __repr__(self) -> str:
         return f"BinOp({self.left}{self.op}{self.right})"
 
+    @property
+    def children(self) -> tuple[Node, ...]:
+        return (self.left, self.right)
+
     def to_dict(self) -> dict:
         return {
             "left": self.left.to_dict(),
@@ -76,7 +99,11 @@ class BinOp(Node):
 class Num(Node):
     """Node for a number.
 
-    The number can be int or float or in a scientific form."""
+    The number can be int or float or in a scientific form. The literal is converted
+    once when the node is created and kept in `number`, `None` when the conversion
+    fails or is too costly, in which case it is converted during evaluation."""
+
+    __slots__ = ("value", "number")
 
     def __init__(self, index: str, value: str):
         """
@@ -86,6 +113,10 @@ class Num(Node):
         """
         super().__init__(index)
         self.value = value
+        try:
+            self.number = to_number(value, max_exponent=max_converted_exponent)
+        except (ValueError, OverflowError):
+            self.number = None
 
     def __repr__(self) -> str:
         return f"Num({self.value})"
@@ -99,6 +130,8 @@ class UnOp(Node):
 
     A unary operator takes one operand an produces a single value."""
 
+    __slots__ = ("op", "expr")
+
     def __init__(self, index: str, op: str, expr: Node):
         """
         Arguments:
@@ -113,6 +146,10 @@ class UnOp(Node):
     def __repr__(self) -> str:
         return f"UnaryOp({self.op}({self.expr}))"
 
+    @property
+    def children(self) -> tuple[Node, ...]:
+        return (self.expr,)
+
     def to_dict(self) -> dict:
         return {
             "op": self.op,
@@ -125,6 +162,8 @@ class Func(Node):
 
     A function takes atleast one argument and produces a single value."""
 
+    __slots__ = ("name", "args")
+
     def __init__(self, index: str, name: str, args: tuple[Node]):
         """
         Arguments:
@@ -140,6 +179,10 @@ class Func(Node):
         args = ", ".join(map(str, self.args))
         return f"{self.name}({args})"
 
+    @property
+    def children(self) -> tuple[Node, ...]:
+        return self.args
+
     def to_dict(self) -> dict:
         return {
             "name": self.name,
@@ -152,6 +195,8 @@ class Const(Node):
 
     A constant is a numerical value which has a fixed value."""
 
+    __slots__ = ("name",)
+
     def __init__(self, index: str, name: str):
         """
         Arguments:
@@ -166,3 +211,52 @@ class Const(Node):
 
     def to_dict(self) -> dict:
         return {"name": self.name}
+
+
+def to_number(literal: str, max_exponent: int | None = None) -> int | float:
+    """Converts the number literal into int or float.
+
+    Integer literal with a non negative exponent is an int, e.g. `2e3` is `2000`.
+
+    Arguments:
+    - literal: number literal.
+    - max_exponent: raises OverflowError for larger exponents of integer literal.
+
+    Raises:
+    - ValueError: malformed literal, for e.g. `1e`.
+    - OverflowError: exponent of float literal cannot be represented by float.
+    """
+    try:
+        return int(literal)
+    except ValueError:
+        pass
+
+    base, expo = literal, "0"
+    if "e" in base:
+        base, expo = base.split("e")
+    expo = int(expo)
+
+    if "." in base:
+        if expo > 308:
+            raise OverflowError("int too large to convert to float")
+        return float(literal)
+
+    base = int(base)
+    if expo < 0:
+        return float(literal)
+    if max_exponent is not None and expo > max_exponent:
+        raise OverflowError("exponent is too large to convert")
+    return base * 10**expo
+
+
+def walk(root: Node) -> Iterator[Node]:
+    """Iterates over all the nodes in the tree, parent node before its children.
+
+    Arguments:
+    - root: root node of the tree.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
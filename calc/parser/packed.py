@@ -0,0 +1,206 @@
+"""
+Module: calc.parser.packed
+Description: Provides the compact struct of arrays encoding of the parse tree.
+
+A parse tree made of node objects costs an object per node, an argument tuple per
+function and the strings of the tokens. The packed tree keeps the nodes in
+post-order within a single array of integers, holding the columns of kind,
+position, symbol & arity of nodes one after another. Operators, names and
+number literals are interned and kept in a table shared by the columns.
+
+Children of a node are the nodes before it: the last child is the node just
+before it and each earlier child ends just before the subtree of the next one.
+
+Usage:
+>>> from calc.parser import parse
+>>> from calc.parser.packed import pack
+>>> packed = pack(parse('max(2, x) * 3'))
+>>> len(packed)
+5
+>>> packed.unpack()
+BinOp(max(Num(2), Const(X))*Num(3))
+"""
+
+import sys
+from array import array
+from typing import Iterator
+
+from .node import Node, BinOp, UnOp, Num, Func, Const
+
+
+__all__ = (
+    "PackedTree",
+    "pack",
+    "unpack",
+)
+
+
+# kinds of node
+NUM = 0
+CONST = 1
+BINOP = 2
+UNOP = 3
+FUNC = 4
+
+_kinds = {Num: NUM, Const: CONST, BinOp: BINOP, UnOp: UNOP, Func: FUNC}
+
+
+def _typecode(largest: int) -> str:
+    """Smallest unsigned typecode of array holding the values."""
+    for typecode in ("B", "H", "I", "Q"):
+        if largest < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise OverflowError("values are too large to pack")
+
+
+class PackedTree:
+    """Parse tree packed into columns of integers and a table of symbols.
+
+    The columns of `n` nodes are laid out in `data` one after another:
+    - kinds: kind of node.
+    - positions: position of node in expression.
+    - symbols: index of operator, name or number literal of node in `table`.
+    - arities: number of children of node.
+    """
+
+    __slots__ = ("data", "table")
+
+    def __init__(self, data: array, table: tuple[str, ...]):
+        """
+        Arguments:
+        - data: columns of the nodes in post-order.
+        - table: interned operators, names and number literals.
+        """
+        self.data = data
+        self.table = table
+
+    @classmethod
+    def pack(cls, root: Node) -> "PackedTree":
+        """Packs the parse tree made of nodes.
+
+        Arguments:
+        - root: root node of the tree.
+
+        Raises:
+        - TypeError: tree has a node of unknown type.
+        """
+        kinds, positions, symbols, arities = [], [], [], []
+        table, slots = [], {}
+
+        def symbol(text: str) -> int:
+            slot = slots.get(text)
+            if slot is None:
+                slot = slots[text] = len(table)
+                table.append(sys.intern(text))
+            return slot
+
+        # post-order: node is emitted after all of its children
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+                continue
+
+            kind = _kinds.get(type(node))
+            if kind is None:
+                raise TypeError(f"cannot pack node of type {type(node).__name__}")
+
+            if kind == NUM:
+                text = node.value
+            elif kind == BINOP or kind == UNOP:
+                text = node.op
+            else:
+                text = node.name
+
+            kinds.append(kind)
+            positions.append(node.index)
+            symbols.append(symbol(text))
+            arities.append(len(node.children))
+
+        columns = kinds + positions + symbols + arities
+        return cls(array(_typecode(max(columns)), columns), tuple(table))
+
+    def unpack(self) -> Node:
+        """Provides the parse tree made of nodes."""
+        n = len(self)
+        data, table = self.data, self.table
+        values = []
+
+        for i in range(n):
+            kind = data[i]
+            index = data[n + i]
+            text = table[data[2 * n + i]]
+
+            if kind == NUM:
+                values.append(Num(index, text))
+            elif kind == CONST:
+                values.append(Const(index, text))
+            elif kind == BINOP:
+                right = values.pop()
+                values[-1] = BinOp(index, left=values[-1], op=text, right=right)
+            elif kind == UNOP:
+                values[-1] = UnOp(index, text, values[-1])
+            else:
+                argc = data[3 * n + i]
+                args = tuple(values[len(values) - argc :])
+                del values[len(values) - argc :]
+                values.append(Func(index, text, args))
+
+        return values[-1]
+
+    @property
+    def kinds(self) -> array:
+        """kind of each node."""
+        return self.data[: len(self)]
+
+    @property
+    def positions(self) -> array:
+        """position of each node in expression."""
+        n = len(self)
+        return self.data[n : 2 * n]
+
+    @property
+    def symbols(self) -> Iterator[str]:
+        """operator, name or number literal of each node."""
+        n = len(self)
+        return (self.table[slot] for slot in self.data[2 * n : 3 * n])
+
+    @property
+    def arities(self) -> array:
+        """number of children of each node."""
+        n = len(self)
+        return self.data[3 * n :]
+
+    def __len__(self) -> int:
+        return len(self.data) // 4
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedTree):
+            return NotImplemented
+        return self.data == other.data and self.table == other.table
+
+    def __hash__(self) -> int:
+        return hash((tuple(self.data), self.table))
+
+    def __repr__(self) -> str:
+        return f"PackedTree({len(self)} nodes)"
+
+
+def pack(root: Node) -> PackedTree:
+    """Packs the parse tree into columns of integers.
+
+    Arguments:
+    - root: root node of the tree.
+    """
+    return PackedTree.pack(root)
+
+
+def unpack(packed: PackedTree) -> Node:
+    """Provides the parse tree made of nodes from the packed tree.
+
+    Arguments:
+    - packed: packed parse tree.
+    """
+    return packed.unpack()
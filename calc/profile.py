@@ -0,0 +1,118 @@
+"""
+Module: calc.profile
+Description: Provides the hooks to measure the stages of evaluating an expression.
+
+An observer is told about each stage of the pipeline once it completes, along with
+its duration in nanoseconds and the number of tokens or nodes handled. No timers
+are read unless an observer is provided.
+
+Usage:
+>>> from calc.evaluator import Evaluator
+>>> from calc.profile import Profile
+>>> profile = Profile()
+>>> Evaluator('2*(3+4)', observer=profile).eval()
+14
+>>> [(stage.name, stage.count) for stage in profile.stages]
+[('lex', 7), ('parse', 5), ('eval', 5)]
+>>> profile.stages[-1].counts
+{'BinOp': 2, 'Num': 3}
+>>> profile.total_ns > 0
+True
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Protocol, TypeVar
+
+from .parser.node import Node, walk
+
+
+__all__ = (
+    "Stage",
+    "Observer",
+    "Profile",
+    "observe",
+    "node_counts",
+)
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Measurement of a completed stage.
+
+    Arguments:
+    - name: name of the stage, e.g. `lex`, `parse`, `optimize` or `eval`.
+    - ns: duration in nanoseconds.
+    - count: number of tokens produced or nodes handled.
+    - counts: number of nodes handled by their type.
+    """
+
+    name: str
+    ns: int
+    count: int
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+class Observer(Protocol):
+    """Receives the measurement of each stage."""
+
+    def on_stage(self, expr: str, stage: Stage) -> None:
+        """Called after the stage of evaluating the expression completes.
+
+        Arguments:
+        - expr: expression.
+        - stage: measurement of the stage.
+        """
+
+
+class Profile:
+    """Observer keeping the measurements of the stages in order."""
+
+    def __init__(self):
+        self.stages: list[Stage] = []
+
+    def on_stage(self, expr: str, stage: Stage) -> None:
+        self.stages.append(stage)
+
+    @property
+    def total_ns(self) -> int:
+        """Duration of all the stages in nanoseconds."""
+        return sum(stage.ns for stage in self.stages)
+
+
+def node_counts(root: Node) -> Dict[str, int]:
+    """Provides the number of nodes of the tree by their type."""
+    return dict(sorted(Counter(type(node).__name__ for node in walk(root)).items()))
+
+
+def observe(
+    observer: Observer,
+    expr: str,
+    name: str,
+    run: Callable[[], T],
+    measure: Callable[[T], Dict[str, int] | int],
+) -> T:
+    """Runs the stage and tells the observer its measurement.
+
+    Arguments:
+    - observer: receives the measurement.
+    - expr: expression.
+    - name: name of the stage.
+    - run: runs the stage.
+    - measure: provides the number of items handled by the stage or by their type
+      from its result, called after the timer is stopped.
+    """
+    start = time.perf_counter_ns()
+    result = run()
+    ns = time.perf_counter_ns() - start
+
+    counts = measure(result)
+    if isinstance(counts, int):
+        observer.on_stage(expr, Stage(name, ns, counts))
+    else:
+        observer.on_stage(expr, Stage(name, ns, sum(counts.values()), counts))
+    return result
@@ -0,0 +1,296 @@
+"""
+Module: calc.server
+Description: Provides an asyncio server evaluating expressions over a local socket.
+
+Every request is a single line, either the plain expression or a json object
+`{"expr": ..., "id": ...}`. The response is a line in the same form, the value or
+`<error>: <message>` for plain requests and a json object for json requests.
+
+Concurrent requests are collected into micro batches evaluated in a single pass,
+while the expressions likely to be expensive (`fact`, large `**`) are evaluated in
+an executor so that the event loop never stalls.
+
+Usage:
+```sh
+python -m calc serve --port 8765
+```
+"""
+
+import asyncio
+import json
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Iterable
+
+from .batch import Outcome, evaluate_one
+from .cache import LRUCache
+from .expression import compile
+from .evaluator.limits import literal_digits
+from .parser.node import BinOp, Func, Num, walk
+
+
+__all__ = (
+    "is_heavy",
+    "CalcServer",
+    "serve",
+    "main",
+)
+
+
+heavy_funcs = frozenset({"fact"})
+"""functions which can take long time to evaluate."""
+
+max_light_exponent = 64
+"""largest literal exponent of `**` evaluated in the event loop."""
+
+max_light_digits = 4300
+"""largest number of digits of a literal evaluated in the event loop."""
+
+
+def is_heavy(expr: str, cache: LRUCache | None = None) -> bool:
+    """Whether the expression is likely to take long time to evaluate.
+
+    Arguments:
+    - expr: expression.
+    - cache: cache of compiled expressions.
+    """
+    try:
+        if cache is None:
+            compiled = compile(expr)
+        else:
+            compiled = cache.get_or_create(expr, compile)
+    except Exception:
+        # the error is reported by the evaluation
+        return False
+
+    for node in walk(compiled.root):
+        # literals not converted by the parser are expanded during evaluation
+        if isinstance(node, Num) and node.number is None:
+            if literal_digits(node.value) > max_light_digits:
+                return True
+
+        if isinstance(node, Func) and node.name.lower() in heavy_funcs:
+            return True
+
+        if isinstance(node, BinOp) and node.op == "**":
+            exponent = node.right
+            if not isinstance(exponent, Num):
+                return True
+            try:
+                if abs(float(exponent.value)) > max_light_exponent:
+                    return True
+            except (ValueError, OverflowError):
+                return True
+
+    return False
+
+
+class CalcServer:
+    """Server evaluating the expressions received over the connections."""
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        cache_size: int = 256,
+        max_batch: int = 256,
+    ):
+        """
+        Arguments:
+        - executor: evaluates the heavy expressions, defaults to a process pool.
+        - cache_size: maximum number of compiled expressions kept for reuse.
+        - max_batch: maximum number of requests evaluated in a single pass.
+        """
+        self.executor = executor
+        self.cache = LRUCache(cache_size)
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue | None = None
+        self._batcher: asyncio.Task | None = None
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, path: str | None = None):
+        """Starts listening on the tcp address, or the unix socket path if given."""
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=1)
+
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._run_batches())
+
+        if path is None:
+            self._server = await asyncio.start_server(self.handle, host, port)
+        else:
+            self._server = await asyncio.start_unix_server(self.handle, path)
+
+    @property
+    def sockets(self):
+        """sockets the server is listening on."""
+        return self._server.sockets
+
+    async def serve_forever(self):
+        """Serves the connections until cancelled."""
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stops the server and the batch evaluation."""
+        self._server.close()
+        await self._server.wait_closed()
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def evaluate(self, expr: str) -> Outcome:
+        """Queues the expression for the next batch and waits for its outcome."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((expr, future))
+        return await future
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves the requests of a connection, one per line."""
+        try:
+            while line := await reader.readline():
+                request = line.decode("utf-8", errors="replace").strip()
+                if not request:
+                    continue
+                writer.write(await self._respond(request))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, request: str) -> bytes:
+        """Provides the response line to the request line."""
+        if not request.startswith("{"):
+            return _response(await self.evaluate(request))
+
+        try:
+            data = json.loads(request)
+            expr = data["expr"]
+            if not isinstance(expr, str):
+                raise TypeError
+        except (ValueError, KeyError, TypeError):
+            response = {"error": "BadRequest", "message": "expected {\"expr\": str}"}
+            return (json.dumps(response) + "\n").encode()
+
+        return _response(await self.evaluate(expr), data)
+
+    async def _run_batches(self):
+        """Collects the queued requests into batches & evaluates them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._evaluate_batch(loop, batch)
+
+    def _evaluate_batch(self, loop: asyncio.AbstractEventLoop, batch: Iterable[tuple]):
+        """Evaluates the light expressions in place, sends heavy ones to executor."""
+        for expr, future in batch:
+            if future.cancelled():
+                continue
+
+            try:
+                if is_heavy(expr, self.cache):
+                    task = loop.run_in_executor(self.executor, evaluate_one, expr)
+                    task.add_done_callback(partial(_resolve, future, expr))
+                else:
+                    future.set_result(evaluate_one(expr, self.cache))
+            except Exception as error:
+                # a failing request must not stop the batches of the later ones
+                future.set_result(_failed(expr, error))
+
+
+def _failed(expr: str, error: BaseException) -> Outcome:
+    """Provides the failed outcome of the error raised while serving the expression."""
+    return Outcome(expr, error=type(error).__name__, message=str(error))
+
+
+def _resolve(future: asyncio.Future, expr: str, task: asyncio.Future):
+    """Passes the outcome of executor task to the waiting request."""
+    if future.cancelled():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        # e.g. the worker process died, the request is still answered
+        future.set_result(_failed(expr, task.exception()))
+    else:
+        future.set_result(task.result())
+
+
+def _format(outcome: Outcome, data: dict | None) -> bytes:
+    """Provides the response line of the outcome, json when the request was json."""
+    if data is None:
+        if outcome.success:
+            return f"{outcome.value}\n".encode()
+        return f"{outcome.error}: {outcome.message}\n".encode()
+
+    response = {
+        "id": data.get("id"),
+        "expr": outcome.expr,
+        "value": outcome.value,
+        "error": outcome.error,
+        "message": outcome.message,
+    }
+    return (json.dumps(response, default=str) + "\n").encode()
+
+
+def _response(outcome: Outcome, data: dict | None = None) -> bytes:
+    """Provides the response line, as error when the value cannot be written.
+
+    e.g. integers beyond the limit of digits converted to string.
+    """
+    try:
+        return _format(outcome, data)
+    except Exception as error:
+        return _format(_failed(outcome.expr, error), data)
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, path: str | None = None, **kwargs):
+    """Runs the server until cancelled.
+
+    Arguments:
+    - host: host address to listen on.
+    - port: port to listen on.
+    - path: unix socket path to listen on instead of tcp address.
+    - kwargs: passed to `CalcServer`.
+    """
+    server = CalcServer(**kwargs)
+    await server.start(host, port, path)
+    address = path or "%s:%d" % server.sockets[0].getsockname()[:2]
+    print(f"serving on {address}", file=sys.stderr, flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def get_argparser() -> ArgumentParser:
+    """returns the parser object to parse args"""
+    p = ArgumentParser("calc serve")
+    p.add_argument("--host", type=str, default="127.0.0.1", help="host address to listen on")
+    p.add_argument("--port", type=int, default=8765, help="port to listen on")
+    p.add_argument("--unix", type=str, default=None, help="unix socket path to listen on instead")
+    p.add_argument("--cache-size", type=int, default=256, help="maximum number of parsed expressions kept for reuse")
+    p.add_argument("--max-batch", type=int, default=256, help="maximum number of requests evaluated in one pass")
+    return p
+
+
+def main(argv: Iterable[str]):
+    """Main function for the server"""
+    args = get_argparser().parse_args(argv)
+    try:
+        asyncio.run(serve(
+            args.host,
+            args.port,
+            args.unix,
+            cache_size=args.cache_size,
+            max_batch=args.max_batch,
+        ))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,367 @@
+"""
+Module: calc.session
+Description: Provides the incremental evaluation of an expression being edited.
+
+The expression is kept split into terms at the binary `+` & `-` operators outside
+of parenthesis, each term has its own tokens, parse tree & value. An edit re-lexes
+from the start of the term it touches, only until the tokens line up with the
+operators of the previous text again, and the terms after it are reused as they
+are. Positions of the terms after the last edit are kept from the end of the
+expression, so they stay valid without being shifted.
+
+Sum of the terms with integer values is kept up to date, as integers add up to
+the same in any order, so an edit anywhere re-evaluates only the terms it
+touches. Once a term has any other value the terms are combined left to right,
+as rounding of floats depends on the order, and the partial results are kept.
+So typing at the end of such expression re-evaluates only the last term, but an
+edit in the middle combines all the terms after it again.
+
+Any irregular input, like a term which is not parsed completely or an error during
+evaluation, falls back to the evaluation of the whole expression. So the result &
+errors are same as of `Evaluator`.
+
+Usage:
+>>> from calc.session import Session
+>>> s = Session('2*3 + 4')
+>>> s.evaluate()
+10
+>>> s.insert(7, '0')
+>>> s.text, s.evaluate()
+('2*3 + 40', 46)
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterator
+
+from .evaluator import Evaluator
+from .evaluator.limits import Limits, default_limits
+from .evaluator.functions import default_funcs
+from .evaluator.constants import default_consts
+from .lexer import Lexer, default_lexers, fast_lex
+from .lexer.token import TokenType, Token, unchecked_token
+from .lexer.exceptions import IllegalCharError
+from .lexer.fast_lexer import master_pattern, _token_types
+from .parser import Parser
+from .parser.node import Node, BinOp
+from .parser.exceptions import ParsingError
+
+
+__all__ = ("Session",)
+
+
+_operand_types = (TokenType.NUMBER, TokenType.NAME, TokenType.RPAREN)
+"""Tokens ending an operand, a `+` or `-` following them is binary."""
+
+_split_types = (TokenType.PLUS, TokenType.MINUS)
+
+_pending = object()
+"""Value of the term yet to be evaluated."""
+
+
+def common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix of the strings, found by comparing halves."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of the strings not longer than limit."""
+    low, high = 0, limit
+    la, lb = len(a), len(b)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[la - mid : la - low] == b[lb - mid : lb - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class Session:
+    """Expression being edited along with its terms.
+
+    Terms are kept in lists indexed by the term:
+    - op_starts: position of operator before the term, `-1` for the first term.
+      Positions of the terms from `gap` onwards are from the end of expression,
+      i.e. -ve, see `op_positions`.
+    - ops: operator before the term, empty for the first term.
+    - trees: parse tree of the term, `None` when not parsed completely.
+    - values: value of the term once evaluated.
+
+    NOTE: positions of nodes in the reused trees are not updated after an edit,
+    errors are reported by evaluating the whole expression again.
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        ignore: str = " \t\n\r",
+        funcs: Dict[str, Callable] = default_funcs,
+        consts: Dict[str, int | float] = default_consts,
+        limits: Limits | None = default_limits,
+    ):
+        """
+        Arguments:
+        - text: initial expression.
+        - ignore: characters to ignore while tokenising.
+        - funcs: functions.
+        - consts: constants.
+        - limits: resource limits of the evaluation, `None` disables them.
+        """
+        self.ignore_chars = ignore
+        self.funcs = funcs
+        self.consts = consts
+        self.limits = limits
+
+        self.text = ""
+        self.op_starts: list[int] = []
+        self.ops: list[str] = []
+        self.trees: list[Node | None] = []
+        self.values: list[Any] = []
+        self.prefix: list[int | float] = []
+        self.broken = 0
+        self.gap = 0
+
+        # sum of the integer values, number of other values & terms to evaluate
+        self.total = 0
+        self.inexact = 0
+        self.pending: list[int] = []
+
+        if text:
+            self.edit(0, 0, text)
+
+    def op_positions(self) -> list[int]:
+        """Positions of the operators before the terms, `-1` for the first term."""
+        gap, length = self.gap, len(self.text)
+        return [start if i < gap else start + length for i, start in enumerate(self.op_starts)]
+
+    def insert(self, pos: int, text: str):
+        """Inserts the text at the position."""
+        self.edit(pos, 0, text)
+
+    def delete(self, pos: int, count: int = 1):
+        """Deletes the characters starting at the position."""
+        self.edit(pos, count, "")
+
+    def set_text(self, text: str):
+        """Replaces the expression, editing only the part which differs."""
+        old = self.text
+        if text == old:
+            return
+
+        start = common_prefix(old, text)
+        end = common_suffix(old, text, min(len(old), len(text)) - start)
+        self.edit(start, len(old) - start - end, text[start : len(text) - end])
+
+    def edit(self, pos: int, deleted: int, inserted: str):
+        """Replaces the deleted characters at the position with inserted text.
+
+        Arguments:
+        - pos: position of edit in expression.
+        - deleted: number of characters removed.
+        - inserted: text inserted in their place.
+
+        Raises:
+        - IndexError: edit is outside of the expression.
+        """
+        old = self.text
+        if pos < 0 or deleted < 0 or pos + deleted > len(old):
+            raise IndexError("edit is outside of the expression")
+
+        # the token before the edit might grow into it, so its term is lexed too
+        k = max(self._term_at(pos - 1), 0)
+        # terms after k-th one are kept from the end, the edit does not move them
+        self._move_gap(min(k + 1, len(self.op_starts)))
+
+        self.text = old[:pos] + inserted + old[pos + deleted :]
+        self._update(k, pos + len(inserted))
+
+    def _term_at(self, pos: int) -> int:
+        """Index of the last term whose operator starts at or before the position."""
+        starts, gap = self.op_starts, self.gap
+        if gap == 0 or starts[gap - 1] <= pos:
+            return bisect_right(starts, pos - len(self.text), gap) - 1
+        return bisect_right(starts, pos, 0, gap) - 1
+
+    def _move_gap(self, gap: int):
+        """Keeps the positions of terms before the gap from the start, others from the end."""
+        starts, length = self.op_starts, len(self.text)
+        for i in range(gap, self.gap):
+            starts[i] -= length
+        for i in range(self.gap, gap):
+            starts[i] += length
+        self.gap = gap
+
+    def _account(self, op: str, value: Any, sign: int):
+        """Adds the value of term to the sum of integers, or removes it for -ve sign."""
+        if type(value) is int:
+            self.total += -sign * value if op == "-" else sign * value
+        else:
+            self.inexact += sign
+
+    def _update(self, k: int, edit_end: int):
+        """Re-lexes & re-parses the terms from k-th one onwards.
+
+        Terms of the previous text are reused from the first binary operator after
+        the edit which also was an operator between terms before it.
+        """
+        text = self.text
+        old_count = len(self.op_starts)
+
+        # k-th term is before the gap, so its position is from the start
+        if 0 < k < old_count:
+            op_start, op = self.op_starts[k], self.ops[k]
+        else:
+            op_start, op = -1, ""
+
+        op_starts, ops, trees = [], [], []
+        tokens: list[Token] = []
+        illegal = False
+        depth = 0
+        last = TokenType.PLUS if op else None
+        reuse = old_count
+
+        def end_term():
+            op_starts.append(op_start)
+            ops.append(op)
+            trees.append(None if illegal else self._parse(tokens))
+
+        for token in self._scan(text, op_start + 1):
+            if token is None:
+                illegal = True
+                continue
+
+            kind = token.type
+            if depth == 0 and kind in _split_types and last in _operand_types:
+                end_term()
+                if token.index >= edit_end:
+                    # same operator in previous text, rest of the terms are same
+                    offset = token.index - len(text)
+                    j = bisect_left(self.op_starts, offset, k + 1)
+                    if j < old_count and self.op_starts[j] == offset:
+                        reuse = j
+                        break
+
+                op_start, op = token.index, token.value
+                tokens, illegal, last = [], False, kind
+                continue
+
+            if kind is TokenType.LPAREN:
+                depth += 1
+            elif kind is TokenType.RPAREN:
+                depth -= 1
+            tokens.append(token)
+            last = kind
+        else:
+            if tokens or op or illegal:
+                end_term()
+
+        removed = self.trees[k:reuse]
+        self.broken += trees.count(None) - removed.count(None)
+
+        for i in range(k, reuse):
+            if self.values[i] is not _pending:
+                self._account(self.ops[i], self.values[i], -1)
+
+        shift = len(trees) - (reuse - k)
+        pending = [i if i < k else i + shift for i in self.pending if not k <= i < reuse]
+        pending.extend(range(k, k + len(trees)))
+        self.pending = pending
+
+        self.op_starts[k:reuse] = op_starts
+        self.gap = k + len(op_starts)
+        self.ops[k:reuse] = ops
+        self.trees[k:reuse] = trees
+        self.values[k:reuse] = [_pending] * len(trees)
+        del self.prefix[k:]
+
+    def _scan(self, text: str, begin: int) -> Iterator[Token | None]:
+        """Lazily provides the tokens from the position, `None` for illegal chars."""
+        if not text.isascii():
+            while begin < len(text):
+                lexer = Lexer(text[begin:], self.ignore_chars, default_lexers)
+                try:
+                    for token in lexer:
+                        yield unchecked_token(token.type, token.value, begin + token.index)
+                    return
+                except IllegalCharError as error:
+                    yield None
+                    begin += error.pos + 1
+            return
+
+        number = TokenType.NUMBER
+        for match in master_pattern(self.ignore_chars).finditer(text, begin):
+            kind = match.lastgroup
+            token_type = _token_types.get(kind)
+
+            if token_type is None:
+                if kind == "illegal":
+                    yield None
+                continue
+
+            value = match.group()
+            if token_type is number and "E" in value:
+                value = value.replace("E", "e")
+            yield unchecked_token(token_type, value, match.start())
+
+    def _parse(self, tokens: list[Token]) -> Node | None:
+        """Parses the term, `None` unless all of its tokens are parsed."""
+        if not tokens:
+            return None
+
+        parser = Parser(self.text, tokens=tokens)
+        try:
+            root = parser.parse_term()
+        except ParsingError:
+            return None
+        return root if parser.token is None else None
+
+    def evaluate(self) -> int | float:
+        """Evaluates the expression, reusing the values of unchanged terms."""
+        limits = self.limits
+        if self.broken or not self.trees or (limits and limits.max_ops is not None):
+            return self.evaluate_all()
+
+        evaluator = Evaluator(
+            self.text, funcs=self.funcs, consts=self.consts, limits=limits
+        )
+        trees, values, pending, prefix = self.trees, self.values, self.pending, self.prefix
+
+        try:
+            while pending:
+                i = pending[-1]
+                values[i] = evaluator.eval_tree(trees[i])
+                self._account(self.ops[i], values[i], 1)
+                pending.pop()
+
+            if not self.inexact:
+                return self.total
+
+            gap, length = self.gap, len(self.text)
+            for i in range(len(prefix), len(trees)):
+                value = values[i]
+                if i:
+                    start = self.op_starts[i] if i < gap else self.op_starts[i] + length
+                    join = BinOp(start, trees[i - 1], self.ops[i], trees[i])
+                    value = evaluator._apply_binop(join, prefix[-1], value)
+                prefix.append(value)
+        except Exception:
+            return self.evaluate_all()
+
+        return prefix[-1]
+
+    def evaluate_all(self) -> int | float:
+        """Evaluates the whole expression from scratch."""
+        return Evaluator(
+            self.text,
+            lexer=lambda expr: fast_lex(expr, self.ignore_chars),
+            funcs=self.funcs,
+            consts=self.consts,
+            limits=self.limits,
+        ).eval()
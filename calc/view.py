@@ -43,6 +43,20 @@ class AbstractView(abc.ABC):
         - error: kind of error raised during expression evaluation.
         """
 
+    def show_preview(self, preview: str) -> None:
+        """Shows the result of the expression while it is being typed.
+
+        Arguemnts:
+        - preview: calculated value or empty string when it cannot be calculated.
+        """
+
+    def show_busy(self, busy: bool) -> None:
+        """Shows whether the expression is being evaluated in background.
+
+        Arguemnts:
+        - busy: evaluation is started or finished.
+        """
+
     @abc.abstractmethod
     def mainloop(self) -> None:
         """Keeps the view open."""
@@ -53,6 +67,7 @@ KEY_CONFIG = {
     "backspace": ["⌫", "\x08", "backspace"],
     "clear": ["CE", "cls", "clear", "clean", "del", "delete"],
     "equal": ["=", "\r", "\n", "equal", "equals"],
+    "cancel": ["\x1b", "esc", "escape", "cancel"],
     "pi": ["π", "pi"],
     "_": lambda key: len(key) == 1 and ord(key) in range(32, 127),
 }
@@ -0,0 +1,150 @@
+"""
+Module: calc.worker
+Description: Provides the evaluation of expressions in a separate process.
+
+The interface stays responsive while an expression is evaluated by the worker
+process. The result is polled for instead of waited on, and a runaway evaluation
+is cancelled by terminating the process, a new one is started for the next job.
+
+Usage:
+>>> import time
+>>> from calc.worker import EvalWorker
+>>> worker = EvalWorker()
+>>> job = worker.submit('2**10')
+>>> while (outcome := worker.poll()) is None:
+...     time.sleep(0.01)
+>>> outcome
+(1, 1024, True)
+>>> worker.close()
+"""
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+from .models import AbstractModel, CalcModel
+
+
+__all__ = ("EvalWorker",)
+
+
+Outcome = tuple[int, Any, bool]
+"""Job id, result of evaluation & its success."""
+
+
+def serve(conn: Connection, model_factory: Callable[[], AbstractModel]):
+    """Evaluates the expressions received until the connection is closed.
+
+    Arguments:
+    - conn: connection receiving job id & expression, sending back the outcome.
+    - model_factory: creates the model evaluating the expressions.
+    """
+    model = model_factory()
+    while True:
+        try:
+            job, expr = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        result, success = model.evaluate(expr)
+        try:
+            conn.send((job, result, success))
+        except (EOFError, OSError):
+            return
+        except Exception as error:
+            # result cannot be pickled
+            conn.send((job, RuntimeError(f"{type(error).__name__}: {error}"), False))
+
+
+class EvalWorker:
+    """Evaluates the expressions one at a time in a worker process.
+
+    The process is started with the `spawn` method, so it does not inherit the
+    state of the interface, and is kept running between the jobs.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[], AbstractModel] = CalcModel,
+        context: multiprocessing.context.BaseContext | None = None,
+    ):
+        """
+        Arguments:
+        - model_factory: creates the model evaluating the expressions, must be picklable.
+        - context: multiprocessing context, `spawn` by default.
+        """
+        self.model_factory = model_factory
+        self.context = context or multiprocessing.get_context("spawn")
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.conn: Connection | None = None
+        self.job = 0
+        self.pending: int | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether a job is being evaluated."""
+        return self.pending is not None
+
+    def start(self):
+        """Starts the worker process unless it is running."""
+        if self.process is not None and self.process.is_alive():
+            return
+
+        self.conn, child = self.context.Pipe()
+        self.process = self.context.Process(
+            target=serve, args=(child, self.model_factory), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def submit(self, expr: str) -> int:
+        """Sends the expression for evaluation, cancelling the pending job.
+
+        Arguments:
+        - expr: expression.
+
+        Returns:
+        - id of the job.
+        """
+        if self.busy:
+            self.cancel()
+        self.start()
+
+        self.job += 1
+        self.pending = self.job
+        self.conn.send((self.job, expr))
+        return self.job
+
+    def poll(self) -> Outcome | None:
+        """Provides the outcome of the pending job, `None` until it is ready."""
+        if not self.busy:
+            return None
+
+        try:
+            if not self.conn.poll():
+                return None
+            outcome = self.conn.recv()
+        except (EOFError, OSError):
+            # worker died, e.g. ran out of memory
+            job = self.pending
+            self.close()
+            return job, RuntimeError("worker process exited"), False
+
+        self.pending = None
+        return outcome
+
+    def cancel(self):
+        """Cancels the pending job by terminating the worker process."""
+        if self.busy:
+            self.close()
+
+    def close(self):
+        """Terminates the worker process, dropping the pending job."""
+        self.pending = None
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+            self.process = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
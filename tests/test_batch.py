@@ -0,0 +1,49 @@
+"""
+Tests for module calc.batch
+"""
+
+import io
+import unittest
+
+from calc.batch import Outcome, evaluate_iter, evaluate_parallel, read_exprs
+
+
+class TestBatch(unittest.TestCase):
+    def test_read_exprs(self):
+        stream = io.StringIO("1+2\n\n  \n sin(0) \n")
+        self.assertEqual(list(read_exprs(stream)), ["1+2", "sin(0)"])
+
+    def test_evaluate_iter(self):
+        outcomes = list(evaluate_iter(["1+2", "x", "1+2"], cache_size=1))
+        self.assertEqual(outcomes[0], Outcome("1+2", 3))
+        self.assertEqual(outcomes[1].error, "UnknownConstNameError")
+        self.assertFalse(outcomes[1].success)
+        self.assertEqual(outcomes[2], outcomes[0])
+
+    def test_unexpected_errors(self):
+        outcomes = list(evaluate_iter(["1e", "1.5**5000", "1+1"]))
+        self.assertEqual([o.error for o in outcomes], ["ValueError", "OverflowError", None])
+        self.assertEqual(outcomes[2].value, 2)
+
+    def test_lazy(self):
+        def exprs():
+            yield "1"
+            raise AssertionError("consumed ahead")
+
+        self.assertEqual(next(evaluate_iter(exprs())).value, 1)
+
+
+class TestParallel(unittest.TestCase):
+    def test_order_and_errors(self):
+        exprs = [f"{i}/({i}%3)" for i in range(50)]
+        expected = list(evaluate_iter(exprs))
+        self.assertEqual(list(evaluate_parallel(exprs, jobs=2, chunksize=4)), expected)
+
+    def test_unexpected_errors(self):
+        exprs = ["1+1", "1.5**5000", "1e"] * 5
+        outcomes = list(evaluate_parallel(exprs, jobs=2, chunksize=2))
+        self.assertEqual(outcomes, list(evaluate_iter(exprs)))
+        self.assertEqual(outcomes[1].error, "OverflowError")
+
+    def test_empty(self):
+        self.assertEqual(list(evaluate_parallel([], jobs=2)), [])
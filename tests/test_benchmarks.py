@@ -0,0 +1,27 @@
+"""
+Tests for package benchmarks
+"""
+
+import unittest
+
+from benchmarks.compare import compare
+from benchmarks.suite import run
+from benchmarks.workloads import workloads
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_workloads_repeatable(self):
+        self.assertEqual(workloads(seed=3), workloads(seed=3))
+        self.assertNotEqual(workloads(seed=3), workloads(seed=4))
+
+    def test_run(self):
+        results = run(quick=True, only="short_formulas/")
+        names = list(results["benchmarks"])
+        self.assertEqual(names, [f"short_formulas/{stage}" for stage in ("lex", "parse", "evaluate", "cli")])
+        self.assertGreater(results["benchmarks"]["short_formulas/lex"]["min"], 0)
+
+    def test_compare(self):
+        old = {"benchmarks": {"a": {"min": 1.0}, "b": {"min": 1.0}, "c": {"min": 1.0}}}
+        new = {"benchmarks": {"a": {"min": 1.05}, "b": {"min": 1.2}, "c": {"min": 0.5}, "d": {"min": 1}}}
+        changes = {change.name: change.status for change in compare(old, new, threshold=0.1)}
+        self.assertEqual(changes, {"a": "same", "b": "regression", "c": "improvement"})
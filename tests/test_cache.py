@@ -0,0 +1,89 @@
+"""
+Tests for module calc.cache
+"""
+
+import threading
+import unittest
+
+from calc.cache import LRUCache
+from calc.models import CalcModel
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.info().evictions, 1)
+
+    def test_get_or_create(self):
+        cache = LRUCache(2)
+        calls = []
+        factory = lambda key: calls.append(key) or key * 2
+        self.assertEqual(cache.get_or_create("ab", factory), "abab")
+        self.assertEqual(cache.get_or_create("ab", factory), "abab")
+        self.assertEqual(calls, ["ab"])
+
+    def test_disabled(self):
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_negative_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(-1)
+
+    def test_threads(self):
+        cache = LRUCache(8)
+
+        def work():
+            for i in range(2000):
+                cache.get_or_create(i % 16, str)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, 8000)
+        self.assertEqual(info.currsize, 8)
+
+
+class TestCalcModelCache(unittest.TestCase):
+    def test_reuses_compiled_expression(self):
+        model = CalcModel(cache_size=4, cache_results=False)
+        self.assertEqual(model.evaluate("2*3"), (6, True))
+        self.assertEqual(model.evaluate("2*3"), (6, True))
+
+        info = model.cache_info()["expressions"]
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_caches_results(self):
+        model = CalcModel(cache_size=4)
+        model.evaluate("2*3")
+        model.evaluate("2*3")
+        self.assertEqual(model.cache_info()["results"].hits, 1)
+        self.assertEqual(model.cache_info()["expressions"].misses, 1)
+
+    def test_errors_are_not_cached(self):
+        model = CalcModel(cache_size=4)
+        result, success = model.evaluate("1/0")
+        self.assertFalse(success)
+        self.assertEqual(len(model.results), 0)
@@ -0,0 +1,54 @@
+"""
+Tests for module calc.cli
+"""
+
+import contextlib
+import io
+import unittest
+
+from calc.cli import main
+
+
+def run(*argv: str) -> str:
+    stream = io.StringIO()
+    with contextlib.redirect_stdout(stream):
+        main(["--no-color", *argv])
+    return stream.getvalue()
+
+
+class TestProcess(unittest.TestCase):
+    def test_eval(self):
+        self.assertEqual(run("-e", "1+2"), "Eval: '1+2'\n= 3\n\n")
+
+    def test_no_title(self):
+        self.assertEqual(run("--no-title", "-e", "2*3", "2**3"), "6\n\n8\n\n")
+
+    def test_inspect(self):
+        output = run("--inspect-tokens", "--inspect-tree", "--raw", "-e", "1+2")
+        self.assertIn("Token(NUMBER, 1, 0:1)", output)
+        self.assertIn("BinOp(Num(1)+Num(2))", output)
+
+    def test_error(self):
+        output = run("-e", "1/0")
+        self.assertTrue(output.startswith("DivideByZeroError: cannot divide by zero"))
+
+    def test_lexical_error_first(self):
+        output = run("-e", "1 + ) $")
+        self.assertTrue(output.startswith("IllegalCharError"))
+
+    def test_profile(self):
+        output = run("--profile", "-O", "-e", "2*(3+4)")
+        self.assertIn("Profile: '2*(3+4)'", output)
+        for stage in ("lex", "parse", "optimize", "eval", "total"):
+            self.assertIn(f"\n{stage:<8} ", output)
+        self.assertIn("BinOp=2 Num=3", output)
+
+    def test_numeric(self):
+        self.assertEqual(run("--no-title", "--numeric", "decimal:30", "-e", "0.1+0.2"), "0.3\n\n")
+        self.assertEqual(run("--no-title", "--numeric", "fraction", "-e", "1/3+1/6"), "1/2\n\n")
+
+    def test_numeric_overflow(self):
+        for expr in ("10**1000000", "1e999999*10"):
+            with self.subTest(expr=expr):
+                output = run("--no-title", "--numeric", "decimal:30", "-e", expr)
+                self.assertTrue(output.startswith("MathDomainError"))
@@ -0,0 +1,70 @@
+"""
+Tests for streaming mode of module calc.cli
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from calc.cli import main
+
+
+def run_stream(text: str, *argv: str) -> str:
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        file.write(text)
+    try:
+        stream = io.StringIO()
+        with contextlib.redirect_stdout(stream):
+            main(["--no-color", "--input", file.name, *argv])
+        return stream.getvalue()
+    finally:
+        os.remove(file.name)
+
+
+class TestStream(unittest.TestCase):
+    text = "1+2\n\n1/0\n  2*3  \n"
+
+    def test_text(self):
+        output = run_stream(self.text, "--no-title")
+        self.assertEqual(output, "3\nDivideByZeroError: cannot divide by zero\n6\n")
+
+    def test_csv(self):
+        output = run_stream(self.text, "--output-format", "csv")
+        self.assertEqual(output.splitlines(), [
+            "expr,value,error,message",
+            "1+2,3,,",
+            "1/0,,DivideByZeroError,cannot divide by zero",
+            "2*3,6,,",
+        ])
+
+    def test_jsonl(self):
+        output = run_stream(self.text, "--output-format", "jsonl", "-f", ".1f")
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual([r["value"] for r in records], ["3.0", None, "6.0"])
+        self.assertEqual(records[1]["error"], "DivideByZeroError")
+
+    def test_bad_lines(self):
+        output = run_stream("1e\n1.5**5000\n2**20000\n1+1\n", "--output-format", "jsonl")
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(
+            [r["error"] for r in records], ["ValueError", "OverflowError", "ValueError", None]
+        )
+        self.assertEqual(records[3]["value"], 2)
+
+        for fmt in ("csv", "text"):
+            with self.subTest(fmt=fmt):
+                output = run_stream("2**20000\n1+1\n", "--output-format", fmt)
+                self.assertIn("ValueError", output)
+                self.assertIn("2", output.splitlines()[-1])
+
+    def test_exclusive_sources(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                main(["-e", "1", "--input", "-"])
+
+    def test_jobs(self):
+        output = run_stream(self.text, "--no-title", "--jobs", "2")
+        self.assertEqual(output, "3\nDivideByZeroError: cannot divide by zero\n6\n")
@@ -0,0 +1,79 @@
+"""
+Tests for module calc.expression
+"""
+
+import math
+import unittest
+from dataclasses import FrozenInstanceError
+
+import calc
+from calc.evaluator import Evaluator, evaluate
+from calc.evaluator.exceptions import (
+    DivideByZeroError,
+    UnknownConstNameError,
+    UnknownFuncNameError,
+)
+from calc.lexer.exceptions import IllegalCharError
+
+
+class TestExpression(unittest.TestCase):
+    def test_evaluate(self):
+        e = calc.compile("2*3+4")
+        self.assertEqual(e.evaluate(), 10)
+        self.assertEqual(e.evaluate(), 10)
+
+    def test_same_result_as_evaluator(self):
+        exprs = ("2**10", "sin(pi/2)", "max(1, 5, 3) % 4", "-1.5e2")
+        for expr in exprs:
+            self.assertEqual(calc.compile(expr).evaluate(), Evaluator(expr).eval())
+
+    def test_is_immutable(self):
+        e = calc.compile("1+1")
+        with self.assertRaises(FrozenInstanceError):
+            e.expr = "2+2"
+
+    def test_lexical_error_on_compile(self):
+        with self.assertRaises(IllegalCharError) as ctx:
+            calc.compile("1 + $")
+        self.assertEqual(ctx.exception.pos, 4)
+
+    def test_evaluation_error_position(self):
+        e = calc.compile("1 + 2/0")
+        with self.assertRaises(DivideByZeroError) as ctx:
+            e.evaluate()
+        self.assertEqual(ctx.exception.pos, 5)
+
+    def test_unknown_function(self):
+        e = calc.compile("2 * foo(1)")
+        with self.assertRaises(UnknownFuncNameError) as ctx:
+            e.evaluate()
+        self.assertEqual(ctx.exception.pos, 4)
+
+
+class TestVariables(unittest.TestCase):
+    def test_keyword_binding(self):
+        e = calc.compile("x*2 + sin(y)")
+        self.assertEqual(e.evaluate(x=3, y=0), 6)
+        self.assertEqual(e.evaluate(x=4, y=0), 8)
+
+    def test_env_binding(self):
+        e = calc.compile("x - y")
+        self.assertEqual(e.evaluate({"x": 5, "y": 2}), 3)
+        self.assertEqual(e.evaluate({"x": 5, "y": 2}, y=4), 1)
+
+    def test_free_names(self):
+        e = calc.compile("a + pi * b(c) - a")
+        self.assertEqual(e.variables, frozenset({"a", "c"}))
+
+    def test_constants_take_precedence(self):
+        self.assertEqual(calc.compile("pi").evaluate(pi=3), math.pi)
+
+    def test_unbound_variable(self):
+        e = calc.compile("1 + x")
+        with self.assertRaises(UnknownConstNameError) as ctx:
+            e.evaluate(y=1)
+        self.assertEqual(ctx.exception.pos, 4)
+
+    def test_evaluate_function(self):
+        self.assertEqual(evaluate("x**2", x=3), 9)
+        self.assertEqual(evaluate("x**2", {"x": 4}), 16)
@@ -0,0 +1,48 @@
+"""
+Tests for module calc.lexer.fast_lexer
+"""
+
+import unittest
+
+from calc.lexer import lex, fast_lex
+from calc.lexer.exceptions import IllegalCharError
+
+
+class TestFastLexer(unittest.TestCase):
+    exprs = (
+        "",
+        "   ",
+        "2+3",
+        "2 ** x1 % 3",
+        "sin(pi/2) - -4",
+        "1.5E-3 + 2e + 7. + 1e+",
+        "max(1, 2,3)\t*\n2",
+        "x²+1",
+    )
+
+    def assertSameTokens(self, expr):
+        expected = [(t.type, t.value, t.index) for t in lex(expr)]
+        actual = [(t.type, t.value, t.index) for t in fast_lex(expr)]
+        self.assertEqual(actual, expected)
+
+    def test_same_tokens(self):
+        for expr in self.exprs:
+            with self.subTest(expr=expr):
+                self.assertSameTokens(expr)
+
+    def test_illegal_char(self):
+        for expr in ("1 + $", "2 # 3", "é + ¤"):
+            with self.subTest(expr=expr):
+                with self.assertRaises(IllegalCharError) as expected:
+                    list(lex(expr))
+                with self.assertRaises(IllegalCharError) as actual:
+                    list(fast_lex(expr))
+                self.assertEqual(actual.exception.pos, expected.exception.pos)
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_lazy(self):
+        tokens = fast_lex("1 + $")
+        self.assertEqual(next(tokens).value, "1")
+        self.assertEqual(next(tokens).value, "+")
+        with self.assertRaises(IllegalCharError):
+            next(tokens)
@@ -0,0 +1,84 @@
+"""
+Tests for module calc.lexer.stream_lexer
+"""
+
+import io
+import mmap
+import tempfile
+import unittest
+
+from calc.lexer import fast_lex, stream_lex
+from calc.lexer.exceptions import IllegalCharError
+
+
+def tokens(lexer):
+    return [(t.type, t.value, t.index) for t in lexer]
+
+
+def tokens_before_error(lexer):
+    produced = []
+    try:
+        for t in lexer:
+            produced.append((t.type, t.value, t.index))
+    except IllegalCharError:
+        return produced
+    raise AssertionError("IllegalCharError not raised")
+
+
+class TestStreamLexer(unittest.TestCase):
+    exprs = (
+        "",
+        "   ",
+        "2 ** x1 % 3",
+        "123456.75E-12 + longname1",
+        "1.5E-3 + 2e + 7. + 1e+",
+        "max(1, 2,3)\t*\n2",
+        "x²+1 * αβ",
+    )
+
+    def test_same_tokens(self):
+        for expr in self.exprs:
+            for chunk_size in (1, 2, 3, 64):
+                with self.subTest(expr=expr, chunk_size=chunk_size):
+                    actual = tokens(stream_lex(io.StringIO(expr), chunk_size=chunk_size))
+                    self.assertEqual(actual, tokens(fast_lex(expr)))
+
+    def test_bytes(self):
+        expr = "sin(x²) ** 22.5e1"
+        for chunk_size in (1, 2, 5):
+            with self.subTest(chunk_size=chunk_size):
+                for source in (expr.encode(), io.BytesIO(expr.encode())):
+                    actual = tokens(stream_lex(source, chunk_size=chunk_size))
+                    self.assertEqual(actual, tokens(fast_lex(expr)))
+
+    def test_mmap(self):
+        expr = " + ".join(f"{i}.5*x" for i in range(1000))
+        with tempfile.TemporaryFile() as file:
+            file.write(expr.encode())
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                actual = tokens(stream_lex(source, chunk_size=7))
+        self.assertEqual(actual, tokens(fast_lex(expr)))
+
+    def test_global_index(self):
+        expr = "1+" * 5000 + "1"
+        last = list(stream_lex(expr, chunk_size=16))[-1]
+        self.assertEqual(last.index, len(expr) - 1)
+
+    def test_illegal_char(self):
+        expr = "1+" * 100 + "$"
+        with self.assertRaises(IllegalCharError) as error:
+            list(stream_lex(io.StringIO(expr), chunk_size=8))
+        self.assertIn("index 200", str(error.exception))
+        self.assertEqual(error.exception.expr[error.exception.pos], "$")
+
+    def test_tokens_before_illegal_char(self):
+        for expr in ("12 + 345$", "x*yz$1", "αβ + 1$", "1 $"):
+            for chunk_size in (1, 2, 3, 64):
+                with self.subTest(expr=expr, chunk_size=chunk_size):
+                    actual = tokens_before_error(stream_lex(expr, chunk_size=chunk_size))
+                    self.assertEqual(actual, tokens_before_error(fast_lex(expr)))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            stream_lex("1", chunk_size=0)
@@ -3,9 +3,11 @@ Tests for module calc.lexer.token
 """
 
 import unittest
+from unittest import mock
 from dataclasses import FrozenInstanceError
 
-from calc.lexer.token import TokenType, Token
+from calc.lexer import lex, fast_lex
+from calc.lexer.token import TokenType, Token, unchecked_token
 
 
 class TestTokenTypes(unittest.TestCase):
@@ -88,3 +90,37 @@ class TestToken(unittest.TestCase):
     def test_should_use_tokentype(self):
         with self.assertRaises(TypeError):
             Token("PLUS", "+", 2)
+
+
+class TestUncheckedToken(unittest.TestCase):
+    def test_same_as_token(self):
+        t = unchecked_token(TokenType.NAME, "sin", 2)
+        self.assertEqual(t, Token(TokenType.NAME, "sin", 2))
+        self.assertEqual(t.end, 5)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(unchecked_token(TokenType.PLUS, "+", 0), "__dict__"))
+
+    def test_validate(self):
+        with self.assertRaises(ValueError):
+            unchecked_token(TokenType.PLUS, "", 0).validate()
+
+    def test_debug_lexers(self):
+        for lexer in (lex, fast_lex):
+            with self.subTest(lexer=lexer.__name__):
+                tokens = list(lexer("2*x", debug=True))
+                self.assertEqual([t.value for t in tokens], ["2", "*", "x"])
+
+    def test_debug_detects_invalid_tokens(self):
+        def bad_token(type, value, index):
+            return unchecked_token(type, value, -1)
+
+        with mock.patch("calc.lexer.unit_lexer.unchecked_token", bad_token):
+            self.assertEqual(len(list(lex("2*x"))), 3)
+            with self.assertRaises(ValueError):
+                list(lex("2*x", debug=True))
+
+        with mock.patch.dict("calc.lexer.fast_lexer._token_types", name="NAME"):
+            self.assertEqual(len(list(fast_lex("2*x"))), 3)
+            with self.assertRaises(TypeError):
+                list(fast_lex("2*x", debug=True))
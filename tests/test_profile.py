@@ -0,0 +1,39 @@
+"""
+Tests for module calc.profile
+"""
+
+import unittest
+
+from calc.evaluator import Evaluator
+from calc.profile import Profile, Stage, observe
+
+
+class TestProfile(unittest.TestCase):
+    def test_stages(self):
+        profile = Profile()
+        value = Evaluator("max(1, 2) * -x", variables={"x": 3}, observer=profile).eval()
+        self.assertEqual(value, -6)
+
+        names = [stage.name for stage in profile.stages]
+        self.assertEqual(names, ["lex", "parse", "eval"])
+
+        lexed, parsed, evaluated = profile.stages
+        self.assertEqual(lexed.count, 9)
+        self.assertEqual(parsed.counts, {"BinOp": 1, "Const": 1, "Func": 1, "Num": 2, "UnOp": 1})
+        self.assertEqual(evaluated.count, 6)
+        self.assertTrue(all(stage.ns >= 0 for stage in profile.stages))
+        self.assertEqual(profile.total_ns, sum(stage.ns for stage in profile.stages))
+
+    def test_no_stage_on_error(self):
+        profile = Profile()
+        with self.assertRaises(Exception):
+            Evaluator("1/0", observer=profile).eval()
+        self.assertEqual([stage.name for stage in profile.stages], ["lex", "parse"])
+
+    def test_observe(self):
+        profile = Profile()
+        result = observe(profile, "expr", "stage", lambda: (1, 2, 3), len)
+        self.assertEqual(result, (1, 2, 3))
+        (stage,) = profile.stages
+        self.assertEqual((stage.name, stage.count, stage.counts), ("stage", 3, {}))
+        self.assertIsInstance(stage, Stage)
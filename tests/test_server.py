@@ -0,0 +1,75 @@
+"""
+Tests for module calc.server
+"""
+
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from calc.server import CalcServer, is_heavy
+
+
+class TestIsHeavy(unittest.TestCase):
+    def test_heavy(self):
+        for expr in ("fact(5)", "FACT(20000)", "2**100000", "2**x", "1+sin(fact(3))", "1e3000000"):
+            with self.subTest(expr=expr):
+                self.assertTrue(is_heavy(expr))
+
+    def test_light(self):
+        for expr in ("1+2", "2**10", "sqrt(16)", "1/0", "1 $ 2", "1e", "1e300", "1.5e400"):
+            with self.subTest(expr=expr):
+                self.assertFalse(is_heavy(expr))
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = CalcServer(executor=ThreadPoolExecutor(1))
+        await self.server.start(port=0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.server.close()
+
+    async def request(self, line: str) -> str:
+        self.writer.write(line.encode() + b"\n")
+        await self.writer.drain()
+        return (await self.reader.readline()).decode().rstrip("\n")
+
+    async def test_plain(self):
+        self.assertEqual(await self.request("1+2"), "3")
+        self.assertEqual(await self.request("fact(5)"), "120")
+        self.assertEqual(await self.request("1/0"), "DivideByZeroError: cannot divide by zero")
+
+    async def test_json(self):
+        response = json.loads(await self.request('{"expr": "2*3", "id": 7}'))
+        self.assertEqual(response["id"], 7)
+        self.assertEqual(response["value"], 6)
+        self.assertIsNone(response["error"])
+
+        response = json.loads(await self.request('{"id": 8}'))
+        self.assertEqual(response["error"], "BadRequest")
+
+    async def test_concurrent(self):
+        exprs = [f"{i}*2" for i in range(20)] + ["fact(20)"]
+        outcomes = await asyncio.gather(*map(self.server.evaluate, exprs))
+        self.assertEqual([o.value for o in outcomes[:-1]], [i * 2 for i in range(20)])
+        self.assertEqual(outcomes[-1].value, 2432902008176640000)
+
+    async def test_malformed_then_valid(self):
+        self.assertTrue((await self.request("1e")).startswith("ValueError: "))
+        self.assertEqual(await self.request("1+2"), "3")
+
+    async def test_unwritable_value(self):
+        response = json.loads(await self.request('{"expr": "2**20000"}'))
+        self.assertEqual(response["error"], "ValueError")
+        self.assertTrue((await self.request("2**20000")).startswith("ValueError: "))
+        self.assertEqual(await self.request("1+2"), "3")
+
+    async def test_executor_failure(self):
+        self.server.executor.shutdown()
+        self.assertTrue((await self.request("fact(5)")).startswith("RuntimeError: "))
+        self.assertEqual(await self.request("1+2"), "3")
@@ -0,0 +1,87 @@
+"""
+Tests for module calc.session
+"""
+
+import unittest
+
+from calc.session import Session
+from calc.evaluator import Evaluator
+from calc.evaluator.exceptions import DivideByZeroError
+from calc.parser.exceptions import SyntaxError
+
+
+class TestSession(unittest.TestCase):
+    def test_typing(self):
+        s = Session()
+        expr = "2*(3+4) - sin(0)/2 + 10"
+        for i, char in enumerate(expr):
+            s.insert(i, char)
+            with self.subTest(text=s.text):
+                try:
+                    expected = Evaluator(s.text).eval()
+                except Exception as error:
+                    with self.assertRaises(type(error)):
+                        s.evaluate()
+                else:
+                    self.assertEqual(s.evaluate(), expected)
+
+    def test_terms_reused(self):
+        s = Session("1 + 2*3 - 4 + 5")
+        s.evaluate()
+        trees = list(s.trees)
+
+        s.insert(5, "0")
+        self.assertEqual(s.text, "1 + 20*3 - 4 + 5")
+        self.assertEqual(s.evaluate(), 62)
+        self.assertIs(s.trees[0], trees[0])
+        self.assertIsNot(s.trees[1], trees[1])
+        self.assertEqual(s.trees[2:], trees[2:])
+        self.assertEqual(s.op_positions(), [-1, 2, 9, 13])
+
+    def test_edits_in_middle(self):
+        s = Session(" + ".join(map(str, range(1000))))
+        s.evaluate()
+
+        s.insert(s.text.index(" 500 ") + 4, "0")
+        self.assertEqual(s.pending, [500])
+        self.assertEqual(s.evaluate(), sum(range(1000)) - 500 + 5000)
+
+        s.set_text(s.text.replace(" 10 + ", " 10 - 0.5 - ", 1))
+        expected = Evaluator(s.text).eval()
+        self.assertEqual(s.evaluate(), expected)
+        self.assertIsInstance(expected, float)
+
+        s.delete(0, s.text.index("10 - "))
+        self.assertEqual(s.evaluate(), Evaluator(s.text).eval())
+        self.assertEqual(s.op_positions()[:2], [-1, 3])
+
+    def test_edits(self):
+        s = Session("1 + 2 + 3")
+        s.delete(4, 4)
+        self.assertEqual((s.text, s.evaluate()), ("1 + 3", 4))
+
+        s.set_text("(1 + 3) * 2")
+        self.assertEqual(s.evaluate(), 8)
+        self.assertEqual(len(s.trees), 1)
+
+        with self.assertRaises(IndexError):
+            s.edit(20, 0, "1")
+
+    def test_irregular_input(self):
+        cases = {
+            "2 3 + 4": 2,
+            "(2 3) + 4": 2,
+            "1, 2 + 3": 1,
+            "": 0,
+        }
+        for text, value in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(Session(text).evaluate(), value)
+
+    def test_errors(self):
+        with self.assertRaises(DivideByZeroError) as error:
+            Session("1 + 2 + 3/0").evaluate()
+        self.assertEqual(error.exception.pos, 9)
+
+        with self.assertRaises(SyntaxError):
+            Session("1 + 2 +").evaluate()
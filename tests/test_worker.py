@@ -0,0 +1,116 @@
+"""
+Tests for module calc.worker
+"""
+
+import pickle
+import time
+import unittest
+
+from calc.app import Controller
+from calc.models import AbstractModel, CalcModel
+from calc.view import AbstractView
+from calc.worker import EvalWorker
+from calc.evaluator.exceptions import DivideByZeroError
+
+
+class SlowModel(AbstractModel):
+    def evaluate(self, expression):
+        time.sleep(60)
+        return 0, True
+
+
+class View(AbstractView):
+    expression = None
+
+    def __init__(self, control, expression):
+        super().__init__(control)
+        self.expression = expression
+        self.shown = []
+        self.busy = []
+
+    def show_expression(self, expression):
+        self.shown.append(expression)
+
+    def show_error(self, error):
+        self.shown.append(error)
+
+    def show_busy(self, busy):
+        self.busy.append(busy)
+
+    def mainloop(self):
+        pass
+
+
+def wait(poll, timeout=30):
+    """Polls until the result is ready."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        outcome = poll()
+        if outcome is not None:
+            return outcome
+        time.sleep(0.01)
+    raise TimeoutError("worker did not respond")
+
+
+def wait_controller(control):
+    wait(lambda: None if control.poll_result() else True)
+
+
+class TestEvalWorker(unittest.TestCase):
+    def test_result(self):
+        worker = EvalWorker()
+        self.addCleanup(worker.close)
+
+        job = worker.submit("2**10")
+        self.assertTrue(worker.busy)
+        self.assertEqual(wait(worker.poll), (job, 1024, True))
+        self.assertFalse(worker.busy)
+
+        job = worker.submit("1/0")
+        _, error, success = wait(worker.poll)
+        self.assertFalse(success)
+        self.assertIsInstance(error, DivideByZeroError)
+        self.assertEqual(error.pos, 1)
+
+    def test_cancel(self):
+        worker = EvalWorker(SlowModel)
+        self.addCleanup(worker.close)
+
+        worker.submit("1")
+        worker.cancel()
+        self.assertFalse(worker.busy)
+        self.assertIsNone(worker.process)
+        self.assertIsNone(worker.poll())
+
+    def test_errors_pickled(self):
+        error, _ = CalcModel().evaluate("sin(1, 2)")
+        copy = pickle.loads(pickle.dumps(error))
+        self.assertIs(type(copy), type(error))
+        self.assertEqual((copy.args, copy.__dict__), (error.args, error.__dict__))
+
+
+class TestController(unittest.TestCase):
+    def setUp(self):
+        self.worker = EvalWorker()
+        self.addCleanup(self.worker.close)
+        self.control = Controller(CalcModel(), self.worker)
+        self.view = View(self.control, "6*7")
+
+    def test_result_shown(self):
+        self.control.evaluate_expression()
+        wait_controller(self.control)
+        self.assertEqual(self.view.shown, ["42"])
+        self.assertEqual(self.view.busy, [True, False])
+
+    def test_stale_result_dropped(self):
+        self.control.evaluate_expression()
+        self.view.expression = "6*8"
+        wait_controller(self.control)
+        self.assertEqual(self.view.shown, [])
+        self.assertEqual(self.view.busy, [True, False])
+
+    def test_without_worker(self):
+        control = Controller(CalcModel())
+        view = View(control, "1/0")
+        control.evaluate_expression()
+        self.assertIsInstance(view.shown[0], DivideByZeroError)
@@ -0,0 +1,96 @@
+"""
+Tests for module calc.evaluator
+"""
+
+import math
+import unittest
+
+from calc.evaluator import Evaluator, evaluate
+from calc.parser import parse
+from calc.evaluator.exceptions import *
+
+
+class TestEvaluator(unittest.TestCase):
+    def test_values(self):
+        cases = {
+            "2+3*4": 14,
+            "-2**2": 4,
+            "max(1, sqrt(16), 2)": 4.0,
+            "fact(3) % 4": 2,
+            "": 0,
+        }
+        for expr, value in cases.items():
+            with self.subTest(expr=expr):
+                self.assertEqual(evaluate(expr), value)
+
+    def test_number_literals(self):
+        self.assertEqual(evaluate("1.1e-5"), 1.1e-05)
+        self.assertEqual(evaluate("2e400 / 2e399"), 10.0)
+        with self.assertRaises(ValueError):
+            evaluate("1e + 1")
+        with self.assertRaises(OverflowError):
+            evaluate("1.0e400")
+
+    def test_deep_trees(self):
+        self.assertEqual(evaluate("1" + "+1" * 20000), 20001)
+        self.assertEqual(evaluate("-" * 20000 + "2"), 2)
+        self.assertEqual(evaluate("abs(" * 10000 + "-3" + ")" * 10000), 3)
+
+    def test_innermost_function_error(self):
+        with self.assertRaises(MathDomainError) as ctx:
+            evaluate("sin(1 + sqrt(-1))")
+        self.assertEqual((ctx.exception.fn, ctx.exception.pos), ("sqrt", 8))
+
+        with self.assertRaises(WrongArgCountError) as ctx:
+            evaluate("max(1, sin(1, 2))")
+        self.assertEqual((ctx.exception.fn, ctx.exception.pos), ("sin", 7))
+
+        with self.assertRaises(MathDomainError) as ctx:
+            evaluate("sin(1, 2 + sqrt(-1)) + 1")
+        self.assertEqual(ctx.exception.fn, "sqrt")
+
+    def test_errors_inside_arguments(self):
+        with self.assertRaises(WrongArgCountError) as ctx:
+            evaluate("cos(2 + x)", x="a")
+        self.assertEqual((ctx.exception.fn, ctx.exception.pos), ("cos", 0))
+
+        with self.assertRaises(TypeError):
+            evaluate("2 + x", x="a")
+
+    def test_function_resolved_before_arguments(self):
+        with self.assertRaises(UnknownFuncNameError):
+            evaluate("foo(1/0)")
+
+        with self.assertRaises(DivideByZeroError):
+            evaluate("sin(1/0) + foo(1)")
+
+    def test_names_resolved_once(self):
+        found = []
+
+        class CountingEvaluator(Evaluator):
+            def _find_func(self, root):
+                found.append(root.name)
+                return super()._find_func(root)
+
+        expr = "sin(0) + sin(pi) * sin(x) - cos(0)"
+        evaluator = CountingEvaluator(expr)
+        root = parse(expr)
+        for x in (0, math.pi / 2):
+            value = evaluator.bind({"x": x}).eval_tree(root)
+            self.assertAlmostEqual(value, math.sin(math.pi) * math.sin(x) - 1)
+        self.assertEqual(sorted(found), ["cos", "sin"])
+
+    def test_resolved_operators_per_node(self):
+        evaluator = Evaluator("")
+        for expr in ("(2**3) * 5", "7 * (2**2)"):
+            with self.subTest(expr=expr):
+                self.assertEqual(evaluator.eval_tree(parse(expr)), eval(expr))
+
+    def test_zero_division_of_other_operators(self):
+        with self.assertRaises(DivideByZeroError) as ctx:
+            evaluate("1 + 5 % 0")
+        self.assertEqual(ctx.exception.pos, 6)
+
+        with self.assertRaises(ZeroDivisionError) as ctx:
+            evaluate("0.0 ** -1")
+        self.assertNotIsInstance(ctx.exception, DivideByZeroError)
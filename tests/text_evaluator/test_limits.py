@@ -0,0 +1,76 @@
+"""
+Tests for module calc.evaluator.limits
+"""
+
+import math
+import time
+import unittest
+
+import calc
+from calc.evaluator.exceptions import ResourceLimitError
+from calc.evaluator.limits import (
+    Limits,
+    fact_digits,
+    literal_digits,
+    mul_digits,
+    pow_digits,
+)
+
+
+backends = ("tree", "vm", "native")
+
+
+class TestCosts(unittest.TestCase):
+    def test_estimates(self):
+        self.assertAlmostEqual(pow_digits(10, 50), 50)
+        self.assertAlmostEqual(mul_digits(10**20, 10**30), 50)
+        self.assertAlmostEqual(fact_digits(1000), len(str(math.factorial(1000))), delta=1)
+        self.assertEqual(literal_digits("12e5000"), 5002)
+        self.assertEqual(literal_digits("1.5e-20"), 23)
+
+    def test_not_integers(self):
+        self.assertEqual(pow_digits(2.0, 10**9), 0)
+        self.assertEqual(fact_digits(-1), 0)
+        self.assertEqual(fact_digits(1, 2), 0)
+        self.assertEqual(literal_digits("1e+"), 0)
+
+
+class TestLimits(unittest.TestCase):
+    def assertLimit(self, expr, limit, pos, limits=Limits()):
+        for backend in backends:
+            with self.subTest(expr=expr, backend=backend):
+                e = calc.compile(expr, backend=backend, limits=limits)
+                with self.assertRaises(ResourceLimitError) as ctx:
+                    e.evaluate()
+                self.assertEqual(ctx.exception.limit, limit)
+                self.assertEqual(ctx.exception.pos, pos)
+
+    def test_max_digits(self):
+        self.assertLimit("fact(10**7)", "max_digits", 0)
+        self.assertLimit("1 + 9**(9**9)", "max_digits", 5)
+        self.assertLimit("(10**60000)*(10**60000)", "max_digits", 11)
+        self.assertLimit("1 + 1e3000000", "max_digits", 4)
+
+    def test_max_ops(self):
+        self.assertLimit("1+2+3", "max_ops", 3, Limits(max_ops=4))
+
+    def test_timeout(self):
+        slow = lambda x: time.sleep(0.02) or x
+        funcs = {**calc.expression.default_funcs, "slow": slow}
+        expr = "slow(2)**5000 * slow(3)**5000"
+        for backend in backends:
+            with self.subTest(backend=backend):
+                e = calc.compile(expr, funcs=funcs, backend=backend, limits=Limits(timeout=0.01))
+                with self.assertRaises(ResourceLimitError) as ctx:
+                    e.evaluate()
+                self.assertEqual(ctx.exception.limit, "timeout")
+
+    def test_within_limits(self):
+        for backend in backends:
+            with self.subTest(backend=backend):
+                self.assertEqual(calc.compile("fact(20)", backend=backend).evaluate(), 2432902008176640000)
+                self.assertEqual(calc.compile("2**10 * 3", backend=backend).evaluate(), 3072)
+
+    def test_disabled(self):
+        e = calc.compile("(10**60000)*(10**60000)", limits=None)
+        self.assertEqual(e.evaluate(), 10**120000)
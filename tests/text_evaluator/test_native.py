@@ -0,0 +1,66 @@
+"""
+Tests for module calc.evaluator.native
+"""
+
+import unittest
+
+from calc.evaluator import Evaluator
+from calc.evaluator.exceptions import *
+from calc.evaluator.native import compile_native, translate
+from calc.evaluator.vm import Program
+from calc.parser import parse
+from calc.parser.node import BinOp, Func, Num
+
+
+def compiled(expr):
+    return compile_native(expr, parse(expr))
+
+
+class TestNative(unittest.TestCase):
+    def test_same_result_as_evaluator(self):
+        exprs = (
+            "2+3*4",
+            "-2**2 % 3",
+            "sin(pi/2) + max(1, 2, 3)",
+            "avg(1, 2) / 4 - +1.5e2",
+            "log(8, 2) * fact(5)",
+        )
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertEqual(compiled(expr)(), Evaluator(expr).eval())
+
+    def test_variables(self):
+        fn = compiled("x*2 + sin(y)")
+        self.assertEqual(fn({"x": 3, "y": 0}), 6)
+        self.assertEqual(fn({"x": 1, "y": 0}), 2)
+
+    def test_call_without_arguments(self):
+        root = BinOp(2, Num(0, "1"), "+", Func(4, "seven", ()))
+        fn = compile_native("1 + seven()", root, funcs={"seven": lambda: 7})
+        self.assertEqual(fn(), 8)
+
+    def test_only_generated_names(self):
+        expr = "sqrt(x) + pi"
+        tree, namespace = translate(Program.compile(expr, parse(expr)))
+        self.assertEqual(namespace["__builtins__"], {})
+        self.assertEqual(set(namespace) - {"__builtins__"}, {"_f0"})
+
+    def test_errors(self):
+        cases = (
+            ("1 + 2/0", DivideByZeroError),
+            ("2 * foo(1)", UnknownFuncNameError),
+            ("1 + x", UnknownConstNameError),
+            ("1 + sqrt(-1)", MathDomainError),
+            ("sin(1, 2)", WrongArgCountError),
+        )
+        for expr, error in cases:
+            with self.subTest(expr=expr):
+                with self.assertRaises(error) as expected:
+                    Evaluator(expr).eval()
+                with self.assertRaises(error) as actual:
+                    compiled(expr)()
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_deep_tree(self):
+        expr = "1" + "+1" * 5000
+        self.assertEqual(compiled(expr)(), 5001)
@@ -0,0 +1,123 @@
+"""
+Tests for module calc.evaluator.numeric
+"""
+
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+from calc.evaluator.exceptions import (
+    DivideByZeroError,
+    MathDomainError,
+    ResourceLimitError,
+    UnknownFuncNameError,
+)
+from calc.evaluator.limits import Limits
+from calc.evaluator.numeric import (
+    DecimalNumeric,
+    FractionNumeric,
+    NumericEvaluator,
+    numeric_backend,
+)
+
+
+class TestDecimalNumeric(unittest.TestCase):
+    numeric = DecimalNumeric(precision=50)
+
+    def eval(self, expr, **variables):
+        return NumericEvaluator(expr, self.numeric, variables=variables).eval()
+
+    def test_exact_literals(self):
+        self.assertEqual(self.eval("0.1 + 0.2"), Decimal("0.3"))
+        self.assertEqual(self.eval("-0.1 * 3"), Decimal("-0.3"))
+
+    def test_precision(self):
+        self.assertEqual(self.eval("1/3"), Decimal("0." + "3" * 50))
+        self.assertEqual(str(self.eval("sqrt(2)"))[:22], "1.41421356237309504880")
+
+    def test_functions(self):
+        self.assertEqual(self.eval("sin(pi/6)"), Decimal("0.5"))
+        self.assertEqual(self.eval("cos(pi)"), Decimal(-1))
+        self.assertEqual(self.eval("log(8, 2)"), Decimal(3))
+        self.assertEqual(self.eval("fact(5)"), 120)
+
+    def test_variables(self):
+        self.assertEqual(self.eval("x * 3", x=0.1), Decimal("0.3"))
+
+    def test_errors(self):
+        with self.assertRaises(DivideByZeroError):
+            self.eval("1/0")
+        with self.assertRaises(DivideByZeroError):
+            self.eval("5 % 0")
+        with self.assertRaises(MathDomainError):
+            self.eval("sqrt(-1)")
+
+    def test_no_infinities(self):
+        for expr in ("log(0)", "log10(0)", "log2(0)", "log(0, 2)", "log(8, 1)", "0**-1"):
+            with self.subTest(expr=expr):
+                with self.assertRaises(MathDomainError):
+                    self.eval(expr)
+        self.assertEqual(self.eval("0**2"), 0)
+
+
+class TestFractionNumeric(unittest.TestCase):
+    numeric = FractionNumeric()
+
+    def eval(self, expr):
+        return NumericEvaluator(expr, self.numeric).eval()
+
+    def test_exact(self):
+        self.assertEqual(self.eval("1/3 + 1/6"), Fraction(1, 2))
+        self.assertEqual(self.eval("0.1 + 0.2"), Fraction(3, 10))
+        self.assertEqual(self.eval("2**-2"), Fraction(1, 4))
+        self.assertEqual(self.eval("sqrt(9/4)"), Fraction(3, 2))
+
+    def test_inexact_is_out_of_domain(self):
+        with self.assertRaises(MathDomainError):
+            self.eval("2**0.5")
+        with self.assertRaises(MathDomainError):
+            self.eval("sqrt(2)")
+        with self.assertRaises(UnknownFuncNameError):
+            self.eval("sin(1)")
+
+    def test_divide_by_zero(self):
+        with self.assertRaises(DivideByZeroError):
+            self.eval("1/0")
+
+
+class TestNumericLimits(unittest.TestCase):
+    limits = Limits(max_digits=1000)
+
+    def eval(self, expr, numeric):
+        return NumericEvaluator(expr, numeric, limits=self.limits).eval()
+
+    def test_factorial(self):
+        for numeric in (DecimalNumeric(), FractionNumeric()):
+            with self.subTest(numeric=numeric):
+                with self.assertRaises(ResourceLimitError):
+                    self.eval("fact(200000)", numeric)
+                self.assertEqual(self.eval("fact(20)", numeric), 2432902008176640000)
+
+    def test_fraction_power(self):
+        with self.assertRaises(ResourceLimitError):
+            self.eval("(7/3)**5000", FractionNumeric())
+
+    def test_fraction_literal(self):
+        for expr in ("1e999999999", "1.5e-999999999"):
+            with self.subTest(expr=expr):
+                with self.assertRaises(ResourceLimitError):
+                    self.eval(expr, FractionNumeric())
+        self.assertEqual(self.eval("1.5e2", FractionNumeric()), 150)
+
+
+class TestNumericBackend(unittest.TestCase):
+    def test_specs(self):
+        self.assertIsNone(numeric_backend("float"))
+        self.assertIsInstance(numeric_backend("fraction"), FractionNumeric)
+        self.assertEqual(numeric_backend("decimal").precision, 28)
+        self.assertEqual(numeric_backend("decimal:50").precision, 50)
+
+    def test_invalid(self):
+        for spec in ("double", "decimal:x", "decimal:0", "fraction:2"):
+            with self.assertRaises(ValueError):
+                numeric_backend(spec)
@@ -0,0 +1,67 @@
+"""
+Tests for module calc.evaluator.optimizer
+"""
+
+import unittest
+
+from calc.evaluator import Evaluator
+from calc.evaluator.exceptions import DivideByZeroError, MathDomainError
+from calc.evaluator.optimizer import optimize
+from calc.parser import parse
+from calc.parser.node import Num, Const
+
+
+def optimized(expr):
+    return optimize(expr, parse(expr))
+
+
+class TestOptimizer(unittest.TestCase):
+    def test_fold_constants(self):
+        for expr in ("2*pi/360", "sqrt(2)*1", "-(3 + 4)", "max(1, 2**10, 3)", "1.5e-7*2"):
+            with self.subTest(expr=expr):
+                root = optimized(expr)
+                self.assertIsInstance(root, Num)
+                self.assertEqual(Evaluator(expr).eval_tree(root), Evaluator(expr).eval())
+
+    def test_partial_fold(self):
+        root = optimized("2*pi/360*(x)")
+        self.assertIsInstance(root.left, Num)
+        self.assertIsInstance(root.right, Const)
+
+    def test_identities(self):
+        for expr in ("x*1", "1*x", "x+0", "0+x", "x-0", "--x", "+x", "(x*1+0)*(2-1)"):
+            with self.subTest(expr=expr):
+                root = optimized(expr)
+                self.assertIsInstance(root, Const)
+                self.assertEqual(root.name, "x")
+
+    def test_keeps_type(self):
+        root = optimized("x*1.0")
+        self.assertEqual(Evaluator("x*1.0", variables={"x": 2}).eval_tree(root), 2.0)
+        self.assertIsInstance(Evaluator("x*1.0", variables={"x": 2}).eval_tree(root), float)
+
+    def test_keeps_errors(self):
+        cases = (
+            ("x + 1/0", DivideByZeroError, 5),
+            ("x + 2 % (1-1)", DivideByZeroError, 6),
+            ("x * sqrt(-1)", MathDomainError, 4),
+        )
+        for expr, error, pos in cases:
+            with self.subTest(expr=expr):
+                root = optimized(expr)
+                with self.assertRaises(error) as ctx:
+                    Evaluator(expr, variables={"x": 1}).eval_tree(root)
+                self.assertEqual(ctx.exception.pos, pos)
+
+    def test_keeps_values_without_literal(self):
+        # beyond the digits of int to str conversion, and floats with no literal
+        for expr in ("2**20000", "(2**20000) % 7 + 1", "1e308*10.5", "-(1e308*10.5)"):
+            with self.subTest(expr=expr):
+                root = optimized(expr)
+                self.assertNotIsInstance(root, Num)
+                self.assertEqual(Evaluator(expr).eval_tree(root), Evaluator(expr).eval())
+
+    def test_does_not_modify_tree(self):
+        root = parse("1+2")
+        optimize("1+2", root)
+        self.assertEqual(repr(root), "BinOp(Num(1)+Num(2))")
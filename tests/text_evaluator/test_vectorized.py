@@ -0,0 +1,73 @@
+"""
+Tests for module calc.evaluator.vectorized
+"""
+
+import math
+import unittest
+
+import calc
+from calc.evaluator import evaluate
+from calc.evaluator.exceptions import (
+    DivideByZeroError,
+    MathDomainError,
+    ResourceLimitError,
+    UnknownConstNameError,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestVectorEvaluator(unittest.TestCase):
+    def assertMatchesScalar(self, expr, **columns):
+        rows = zip(*columns.values())
+        expected = [evaluate(expr, dict(zip(columns, row))) for row in rows]
+        actual = calc.compile(expr).evaluate_columns(columns)
+        np.testing.assert_allclose(actual, expected)
+
+    def test_matches_scalar_path(self):
+        x = [0.5, 1.0, 2.5, 4.0]
+        y = [1, 2, 3, 4]
+        exprs = (
+            "x*2 + sin(y)",
+            "-x ** 2 % 3",
+            "log(x, 2) + log10(y) - sqrt(x)",
+            "max(x, y, 2) + min(x, 1) + avg(x, y)",
+            "floor(x) * ceil(x) + round(x) + abs(-y)",
+            "y ** -1 + pi",
+        )
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertMatchesScalar(expr, x=x, y=y)
+
+    def test_scalar_fallback(self):
+        self.assertMatchesScalar("fact(y) + x", x=[1.0, 2.0, 3.0], y=[3, 4, 5])
+
+    def test_divide_by_zero(self):
+        e = calc.compile("1 / (x - 2)")
+        with self.assertRaises(DivideByZeroError) as ctx:
+            e.evaluate_columns(x=[1, 2, 3])
+        self.assertEqual(ctx.exception.pos, 2)
+
+    def test_math_domain(self):
+        with self.assertRaises(MathDomainError):
+            calc.compile("sqrt(x)").evaluate_columns(x=[1.0, -1.0])
+        with self.assertRaises(MathDomainError):
+            calc.compile("fact(x)").evaluate_columns(x=[1, -1])
+
+    def test_limits(self):
+        e = calc.compile("fact(x)")
+        with self.assertRaises(ResourceLimitError):
+            e.evaluate_columns(x=[3, 10**6])
+        self.assertEqual(list(e.evaluate_columns(x=[3, 5])), [6, 120])
+
+    def test_unknown_column(self):
+        with self.assertRaises(UnknownConstNameError):
+            calc.compile("x + y").evaluate_columns(x=[1])
+
+    def test_broadcast_scalars(self):
+        result = calc.compile("x + 2*pi").evaluate_columns(x=np.zeros(3))
+        np.testing.assert_allclose(result, [2 * math.pi] * 3)
@@ -0,0 +1,65 @@
+"""
+Tests for module calc.evaluator.vm
+"""
+
+import unittest
+
+from calc.evaluator import Evaluator
+from calc.evaluator.exceptions import *
+from calc.evaluator.vm import Program
+from calc.parser import parse
+from calc.parser.node import BinOp, Func, Num
+
+
+def compiled(expr):
+    return Program.compile(expr, parse(expr))
+
+
+class TestProgram(unittest.TestCase):
+    def test_same_result_as_evaluator(self):
+        exprs = (
+            "2+3*4",
+            "-2**2 % 3",
+            "sin(pi/2) + max(1, 2, 3)",
+            "avg(1, 2) / 4 - +1.5e2",
+            "log(8, 2) * fact(5)",
+        )
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertEqual(compiled(expr).run(), Evaluator(expr).eval())
+
+    def test_variables(self):
+        program = compiled("x*2 + y")
+        self.assertEqual(program.run({"x": 3, "y": 1}), 7)
+        self.assertEqual(program.run({"x": 1, "y": 1}), 3)
+
+    def test_call_without_arguments(self):
+        root = BinOp(2, Num(0, "1"), "+", Func(4, "seven", ()))
+        program = Program.compile("1 + seven()", root, funcs={"seven": lambda: 7})
+        self.assertEqual(program.run(), 8)
+
+    def test_flat_instructions(self):
+        self.assertEqual(len(compiled("1 + 2*x")), 5)
+
+    def test_deep_tree(self):
+        expr = "1" + "+1" * 5000
+        self.assertEqual(compiled(expr).run(), 5001)
+
+    def test_errors(self):
+        cases = (
+            ("1 + 2/0", DivideByZeroError, "pos", 5),
+            ("1 + 2%(1-1)", DivideByZeroError, "pos", 5),
+            ("2 * foo(1/0)", UnknownFuncNameError, "pos", 4),
+            ("1 + x", UnknownConstNameError, "pos", 4),
+            ("1 + sqrt(-1)", MathDomainError, "pos", 4),
+            ("sin(1 + sqrt(2, 3))", WrongArgCountError, "pos", 8),
+            ("sin(1e)", MathDomainError, "fn", "sin"),
+        )
+        for expr, error, attr, value in cases:
+            with self.subTest(expr=expr):
+                with self.assertRaises(error) as expected:
+                    Evaluator(expr).eval()
+                with self.assertRaises(error) as actual:
+                    compiled(expr).run()
+                self.assertEqual(getattr(actual.exception, attr), value)
+                self.assertEqual(str(actual.exception), str(expected.exception))
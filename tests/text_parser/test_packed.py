@@ -0,0 +1,51 @@
+"""
+Tests for module calc.parser.packed
+"""
+
+import pickle
+import unittest
+
+from calc.parser import parse
+from calc.parser.packed import PackedTree, pack, unpack
+
+
+class TestPackedTree(unittest.TestCase):
+    exprs = (
+        "1",
+        "x",
+        "2+3*4 - -y",
+        "max(1, (2), f(3, 4)) ** 2",
+        "avg(1.5e3, sin(pi/2), 7 % 4)",
+    )
+
+    def test_round_trip(self):
+        for expr in self.exprs:
+            with self.subTest(expr=expr):
+                root = parse(expr)
+                packed = pack(root)
+                self.assertEqual(repr(unpack(packed)), repr(root))
+                self.assertEqual(unpack(packed).to_dict(), root.to_dict())
+
+    def test_positions_kept(self):
+        packed = pack(parse("max(1, x) * 3"))
+        self.assertEqual(list(packed.positions), [4, 7, 0, 12, 10])
+        self.assertEqual(list(packed.symbols), ["1", "x", "max", "3", "*"])
+        self.assertEqual(list(packed.arities), [0, 0, 2, 0, 2])
+
+    def test_deep_tree(self):
+        depth = 20000
+        packed = pack(parse("1" + "+1" * depth))
+        self.assertEqual(len(packed), 2 * depth + 1)
+        self.assertEqual(pack(packed.unpack()), packed)
+
+    def test_large_positions(self):
+        expr = " " * 70000 + "1+2"
+        self.assertEqual(unpack(pack(parse(expr))).index, 70001)
+
+    def test_equality_and_pickle(self):
+        packed = pack(parse("sin(x) + 1"))
+        self.assertEqual(packed, pack(parse("sin(x) + 1")))
+        self.assertEqual(hash(packed), hash(pack(parse("sin(x) + 1"))))
+        self.assertNotEqual(packed, pack(parse("sin(x) + 2")))
+        self.assertEqual(pickle.loads(pickle.dumps(packed)), packed)
+        self.assertIsInstance(packed, PackedTree)
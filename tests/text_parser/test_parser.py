@@ -0,0 +1,73 @@
+"""
+Tests for module calc.parser
+"""
+
+import unittest
+
+from calc.lexer import lex
+from calc.parser import Parser, parse
+from calc.parser.exceptions import SyntaxError, UnknownTokenError
+
+
+class TestParser(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(repr(parse("2+3")), "BinOp(Num(2)+Num(3))")
+        self.assertEqual(repr(parse("")), "Num(0)")
+
+    def test_parse_tokens(self):
+        expr = "sin(x) * -2"
+        tokens = tuple(lex(expr))
+        self.assertEqual(repr(parse(expr, tokens=tokens)), repr(parse(expr)))
+
+    def test_tokens_skip_lexer(self):
+        def lexer(expr):
+            raise AssertionError("lexer should not be used")
+
+        root = Parser("1+2", lexer, tokens=tuple(lex("1+2"))).parse()
+        self.assertEqual(repr(root), "BinOp(Num(1)+Num(2))")
+
+    def test_unknown_token(self):
+        with self.assertRaises(UnknownTokenError):
+            parse("1 + )")
+
+    def test_trees(self):
+        cases = {
+            "1-2-3": "BinOp(BinOp(Num(1)-Num(2))-Num(3))",
+            "2*3**2": "BinOp(BinOp(Num(2)*Num(3))**Num(2))",
+            "-+x": "UnaryOp(-(UnaryOp(+(Const(X)))))",
+            "max(1, (2), f(3, 4))": "max(Num(1), Num(2), f(Num(3), Num(4)))",
+            "2 * (1 + 3) 5": "BinOp(Num(2)*BinOp(Num(1)+Num(3)))",
+        }
+        for expr, tree in cases.items():
+            with self.subTest(expr=expr):
+                self.assertEqual(repr(parse(expr)), tree)
+
+    def test_parse_exprs(self):
+        nodes = Parser("1, x, 2*3", lex).parse_exprs()
+        self.assertEqual(repr(nodes), "(Num(1), Const(X), BinOp(Num(2)*Num(3)))")
+
+    def test_deep_nesting(self):
+        depth = 20000
+        root = parse("(" * depth + "-1" + ")" * depth)
+        self.assertEqual(repr(root), "UnaryOp(-(Num(1)))")
+
+        root = parse("f(" * depth + "1" + ")" * depth)
+        for _ in range(depth):
+            (root,) = root.args
+        self.assertEqual(repr(root), "Num(1)")
+
+    def test_many_args(self):
+        root = parse("max(" + ", ".join(["1"] * 20000) + ")")
+        self.assertEqual(len(root.args), 20000)
+
+    def test_end_of_expression(self):
+        with self.assertRaises(SyntaxError):
+            parse("2 * (1 +")
+
+    def test_numbers_converted(self):
+        cases = {"2": 2, "2.5": 2.5, "2e3": 2000, "1.1e-5": 1.1e-05, "2e-3": 0.002, "1e": None}
+        for literal, number in cases.items():
+            with self.subTest(literal=literal):
+                node = parse(literal)
+                self.assertEqual(node.number, number)
+                self.assertIs(type(node.number), type(number))